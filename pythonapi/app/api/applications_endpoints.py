@@ -8,27 +8,133 @@ Routes:
     - GET /applications: Get all applications (admin) or user's applications
     - GET /applications/{id}: Get specific application
     - PATCH /applications/{id}: Update application status (admin)
-    - GET /applications/stats: Get application statistics (admin)
+    - POST /applications/bulk-review: Update many applications at once (admin)
+    - DELETE /applications/{id}: Delete application (owner or admin)
+    - GET /applications/stats: Get application statistics (admin: all, user: own)
+    - GET /applications/stats/pets: Application counts per pet (admin)
+    - GET /applications/stats/locations: Application counts per location (admin)
+    - GET /applications/stats/daily: Submissions and decisions per day (admin)
+    - GET /applications/events: Server-Sent Events for application changes
+    - GET /applications/export: Stream applications as CSV or NDJSON
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime
-from app.db import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime, timedelta
+from app.db import AsyncSessionLocal, get_async_db
 from app.schemas.models import Application, User, Pet
-from app.schemas.schemas_application import ApplicationCreate, ApplicationUpdate, ApplicationOut, ApplicationWithDetails
+from app.schemas.schemas_auth import UserOut
+from app.schemas.schemas_application import (
+    ApplicationBulkReview, ApplicationCreate, ApplicationUpdate, ApplicationOut, ApplicationSummary,
+    ApplicationWithDetails,
+)
 from app.api.auth_endpoints import get_current_user
-from typing import List
+from app.services import application_stats_service as stats
+from app.services.application_events_service import CREATED, DELETED, UPDATED, application_events
+from app.services.export_service import export_response
+from typing import List, Literal, Union
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
+# Columns of the list views, labelled with their output field names
+SUMMARY_COLUMNS = (
+    Application.application_id,
+    Application.user_id,
+    Application.pet_id,
+    Application.contact_phone,
+    Application.living_situation,
+    Application.has_other_pets,
+    Application.status,
+    Application.application_date,
+    Application.reviewed_at,
+    User.email.label('user_email'),
+    User.display_name.label('user_name'),
+    Pet.name.label('pet_name'),
+    Pet.species.label('pet_species'),
+    Pet.age.label('pet_age'),
+    Pet.photo_url.label('pet_photo_url'),
+)
+DETAIL_COLUMNS = SUMMARY_COLUMNS + (
+    Application.application_message,
+    Application.other_pets_details,
+    Application.admin_notes,
+)
+
+# What bulk review needs to know about an application (stats and events)
+REVIEW_COLUMNS = (
+    Application.application_id,
+    Application.user_id,
+    Application.pet_id,
+    Application.status,
+    Application.application_date,
+    Application.reviewed_at,
+)
+
+
+def encode_cursor(application_date: datetime, application_id: int) -> str:
+    """
+    Keyset cursor for the row after which the next page starts.
+
+    Example:
+        encode_cursor(datetime(2024, 5, 1, 10, 30), 42) -> "2024-05-01T10:30:00_42"
+    """
+    return f"{application_date.isoformat()}_{application_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Parse a cursor from encode_cursor (HTTPException 400 if malformed)."""
+    try:
+        date_part, _, id_part = cursor.rpartition("_")
+        return datetime.fromisoformat(date_part), int(id_part)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def application_filters(
+        user,
+        status: str | None,
+        pet_id: int | None,
+        user_id: int | None,
+        living_situation: str | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+) -> list:
+    """
+    WHERE clauses for GET /applications and its export. Users only ever get
+    their own applications (HTTPException 403 for another user_id).
+    """
+    clauses = []
+
+    # Filter by user if not admin
+    if not user.is_admin:
+        if user_id is not None and user_id != user.user_id:
+            raise HTTPException(status_code=403, detail="Cannot list other users' applications")
+        user_id = user.user_id
+    if user_id is not None:
+        clauses.append(Application.user_id == user_id)
+
+    # Optional filters
+    if status:
+        clauses.append(Application.status == status)
+    if pet_id is not None:
+        clauses.append(Application.pet_id == pet_id)
+    if living_situation:
+        clauses.append(Application.living_situation == living_situation)
+    if date_from is not None:
+        clauses.append(Application.application_date >= date_from)
+    if date_to is not None:
+        clauses.append(Application.application_date < date_to)
+    return clauses
+
 
 @router.post("", response_model=ApplicationOut)
-def create_application(
+async def create_application(
         data: ApplicationCreate,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Submit Adoption Application
@@ -44,19 +150,19 @@ def create_application(
         HTTPException 400: User already has pending application for this pet
     """
     # Get current user
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Check if pet exists
-    pet = db.query(Pet).filter(Pet.pet_id == data.pet_id).first()
+    pet = await db.get(Pet, data.pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Pet not found")
 
     # Check if user already has a pending application for this pet
-    existing = db.query(Application).filter(
+    existing = await db.scalar(select(Application).where(
         Application.user_id == user.user_id,
         Application.pet_id == data.pet_id,
         Application.status == "pending"
-    ).first()
+    ))
 
     if existing:
         raise HTTPException(
@@ -71,132 +177,314 @@ def create_application(
     )
 
     db.add(application)
-    db.commit()
-    db.refresh(application)
+    await db.flush()  # fills in application_date
+    await stats.record_change(db, None, stats.stats_state(application))
+    await db.commit()
+    await db.refresh(application)
+    application_events.publish(CREATED, application)
 
     return application
 
 
-@router.get("", response_model=List[ApplicationWithDetails])
-def list_applications(
+@router.get("", response_model=Union[List[ApplicationWithDetails], List[ApplicationSummary]])
+async def list_applications(
         request: Request,
-        db: Session = Depends(get_db),
-        status: str = None
+        db: AsyncSession = Depends(get_async_db),
+        status: str = None,
+        pet_id: int | None = None,
+        user_id: int | None = None,
+        living_situation: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        view: Literal["full", "summary"] = "full",
+        order: Literal["newest", "oldest"] = "newest",
+        limit: int = Query(50, ge=1, le=500),
+        cursor: str | None = None,
 ):
     """
     List Applications
     -----------------
-    - Admin: Returns all applications (optionally filtered by status)
+    - Admin: Returns all applications (optionally filtered)
     - User: Returns only their own applications
 
     Query Parameters:
         status: Filter by status (pending, approved, rejected)
+        pet_id: Filter by pet
+        user_id: Filter by applicant (admin only; users always see their own)
+        living_situation: Filter by exact living situation (e.g. "house")
+        date_from / date_to: Submitted at or after date_from and before date_to
+        view: "full" (default) or "summary", which leaves out
+              application_message, other_pets_details and admin_notes
+        order: "newest" (default) or "oldest" first, e.g. the longest-waiting
+               pending applications with status=pending&order=oldest
+        limit: Maximum number of applications to return (default 50, max 500)
+        cursor: Value of X-Next-Cursor from the previous page
 
     Returns:
-        List of applications with user and pet details
+        One page of applications with user and pet details, in the given order
+
+    Raises:
+        HTTPException 400: Invalid cursor
+        HTTPException 403: User filtering by another user's id
+
+    Note:
+        Uses keyset pagination on (application_date, application_id), so deep
+        pages cost the same as the first. When more applications are available
+        the X-Next-Cursor header holds the cursor for the next page. Rows are
+        serialized straight from the joined columns, without building a
+        Pydantic model per row.
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
-    # Build query
-    query = db.query(
-        Application,
-        User.email.label('user_email'),
-        User.display_name.label('user_name'),
-        Pet.name.label('pet_name'),
-        Pet.species.label('pet_species'),
-        Pet.age.label('pet_age'),
-        Pet.photo_url.label('pet_photo_url')
-    ).join(
+    # Build query (only the columns the chosen view returns)
+    columns = DETAIL_COLUMNS if view == "full" else SUMMARY_COLUMNS
+    query = select(*columns).join(
         User, Application.user_id == User.user_id
     ).join(
         Pet, Application.pet_id == Pet.pet_id
+    ).where(
+        *application_filters(user, status, pet_id, user_id, living_situation, date_from, date_to)
     )
 
-    # Filter by user if not admin
-    if not user.is_admin:
-        query = query.filter(Application.user_id == user.user_id)
+    # Continue after the last row of the previous page
+    key = tuple_(Application.application_date, Application.application_id)
+    if cursor:
+        after = decode_cursor(cursor)
+        query = query.where(key < after if order == "newest" else key > after)
+
+    # Order by date; fetch one extra row to detect another page
+    if order == "newest":
+        query = query.order_by(Application.application_date.desc(), Application.application_id.desc())
+    else:
+        query = query.order_by(Application.application_date, Application.application_id)
+    query = query.limit(limit + 1)
+    rows = (await db.execute(query)).mappings().all()
+
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1]["application_date"], rows[-1]["application_id"])
+
+    return Response(
+        content=to_json([dict(row) for row in rows]),
+        media_type="application/json",
+        headers=headers,
+    )
 
-    # Filter by status if provided
-    if status:
-        query = query.filter(Application.status == status)
-
-    # Order by date (newest first)
-    query = query.order_by(Application.application_date.desc())
-
-    # Execute query
-    results = query.all()
-
-    # Transform results
-    applications = []
-    for app, user_email, user_name, pet_name, pet_species, pet_age, pet_photo_url in results:
-        applications.append(ApplicationWithDetails(
-            application_id=app.application_id,
-            user_id=app.user_id,
-            pet_id=app.pet_id,
-            application_message=app.application_message,
-            contact_phone=app.contact_phone,
-            living_situation=app.living_situation,
-            has_other_pets=app.has_other_pets,
-            other_pets_details=app.other_pets_details,
-            status=app.status,
-            admin_notes=app.admin_notes,
-            application_date=app.application_date,
-            reviewed_at=app.reviewed_at,
-            user_email=user_email,
-            user_name=user_name,
-            pet_name=pet_name,
-            pet_species=pet_species,
-            pet_age=pet_age,
-            pet_photo_url=pet_photo_url
-        ))
-
-    return applications
+
+@router.get("/export")
+async def export_applications(
+        fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+        status: str = None,
+        pet_id: int | None = None,
+        user_id: int | None = None,
+        living_situation: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        db: AsyncSession = Depends(get_async_db),
+        user: UserOut = Depends(get_current_user),
+):
+    """
+    Export Applications
+    -------------------
+    Streams every matching application, with user and pet details, as a
+    CSV or NDJSON download in application_id order.
+
+    - Admin: All applications (optionally filtered)
+    - User: Only their own applications
+
+    Query Parameters:
+        format: "csv" (default, with a header row) or "ndjson" (one JSON object per line)
+        status, pet_id, user_id, living_situation, date_from, date_to:
+            Same filters as GET /applications
+
+    Raises:
+        HTTPException 401: Not authenticated
+        HTTPException 403: User filtering by another user's id
+
+    Note:
+        Rows are read through a server-side cursor and sent in batches of
+        EXPORT_BATCH_SIZE, so memory use doesn't grow with the result and
+        the download starts right away. The export reads through its own
+        session; the request session (only used for the login check) is
+        released first, so the download holds one connection, not two.
+    """
+    await db.close()
+
+    query = select(*DETAIL_COLUMNS).join(
+        User, Application.user_id == User.user_id
+    ).join(
+        Pet, Application.pet_id == Pet.pet_id
+    ).where(
+        *application_filters(user, status, pet_id, user_id, living_situation, date_from, date_to)
+    ).order_by(Application.application_id)
+
+    return export_response(query, fmt, "applications")
 
 
 @router.get("/stats")
-def get_application_stats(
+async def get_application_stats(
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get Application Statistics (Admin Only)
-    ----------------------------------------
-    Returns statistics about applications.
+    Get Application Statistics
+    --------------------------
+    - Admin: Counts across all applications
+    - User: Counts of their own applications (the My Applications tabs)
 
     Returns:
         Dict with pending, approved, rejected, and total counts
+
+    Note:
+        Admin totals are read from counters that every application write
+        keeps up to date (application_stats_service), so the cost doesn't
+        grow with the number of applications.
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
+
+    if not user.is_admin:
+        return await stats.user_totals(db, user.user_id)
+
+    return await stats.status_totals(db)
+
+
+@router.get("/stats/pets")
+async def get_pet_application_stats(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db),
+        limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Get Application Statistics per Pet (Admin Only)
+    -----------------------------------------------
+    Returns status counts for the pets with the most applications.
+
+    Query Parameters:
+        limit: Maximum number of pets (default 50, max 500)
+
+    Returns:
+        List of {pet_id, pet_name, pending, approved, rejected, total}, busiest first
+    """
+    user = await get_current_user(request, db)
 
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    # Get counts by status
-    stats = db.query(
-        Application.status,
-        func.count(Application.application_id).label('count')
-    ).group_by(Application.status).all()
-
-    # Transform to dict
-    result = {
-        'pending': 0,
-        'approved': 0,
-        'rejected': 0,
-        'total': 0
-    }
+    return await stats.pet_breakdown(db, limit)
+
+
+@router.get("/stats/locations")
+async def get_location_application_stats(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get Application Statistics per Location (Admin Only)
+    ----------------------------------------------------
+    Returns status counts for each location with applications, by the
+    pets' current location.
+
+    Returns:
+        List of {location_id, location_name, pending, approved, rejected, total}
+    """
+    user = await get_current_user(request, db)
+
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return await stats.location_breakdown(db)
+
+
+@router.get("/stats/daily")
+async def get_daily_application_stats(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db),
+        date_from: date | None = None,
+        date_to: date | None = None,
+):
+    """
+    Get Daily Application Statistics (Admin Only)
+    ---------------------------------------------
+    Returns how many applications were submitted, approved and rejected
+    on each day (UTC).
+
+    Query Parameters:
+        date_from: First day (default: 29 days before date_to)
+        date_to: Last day, inclusive (default: today)
+
+    Returns:
+        List of {day, submitted, approved, rejected} for days with activity, oldest first
+
+    Raises:
+        HTTPException 400: Range longer than a year or date_from after date_to
+    """
+    user = await get_current_user(request, db)
+
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    date_to = date_to or datetime.utcnow().date()
+    date_from = date_from or date_to - timedelta(days=29)
+    if date_from > date_to or (date_to - date_from).days > 366:
+        raise HTTPException(status_code=400, detail="Invalid date range (at most one year)")
+
+    return await stats.daily_counts(db, date_from, date_to)
+
+
+@router.get("/events")
+async def stream_application_events(
+        request: Request,
+        last_event_id: str | None = None,
+):
+    """
+    Stream Application Events
+    -------------------------
+    Server-Sent Events for application changes, so pages showing applications
+    or stats can update themselves instead of re-polling:
+
+        const events = new EventSource("/applications/events", {withCredentials: true});
+        events.addEventListener("application.updated", (e) => update(JSON.parse(e.data)));
+
+    - Admin: Receives events for all applications
+    - User: Receives events for their own applications only
+
+    Events:
+        application.created, application.updated, application.deleted:
+            {application_id, user_id, pet_id, status, previous_status, reviewed_at}
+        reset: Missed events can't be replayed; reload the data once
+
+    Query Parameters:
+        last_event_id: Resume after this event id (the Last-Event-ID header,
+                       which EventSource sends when reconnecting, takes precedence)
 
-    for status, count in stats:
-        result[status] = count
-        result['total'] += count
+    Raises:
+        HTTPException 401: Not authenticated
 
-    return result
+    Note:
+        The database session is only used for the login check and is closed
+        before streaming, so open streams don't hold pool connections.
+    """
+    async with AsyncSessionLocal() as db:
+        user = await get_current_user(request, db)
+
+    return StreamingResponse(
+        application_events.stream(
+            user.user_id, user.is_admin, request.headers.get("last-event-id") or last_event_id
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # don't let nginx buffer the stream
+        },
+    )
 
 
 @router.get("/{application_id}", response_model=ApplicationWithDetails)
-def get_application(
+async def get_application(
         application_id: int,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get Application Details
@@ -214,10 +502,10 @@ def get_application(
         HTTPException 404: Application not found
         HTTPException 403: Not authorized to view this application
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Query with joins
-    result = db.query(
+    result = (await db.execute(select(
         Application,
         User.email.label('user_email'),
         User.display_name.label('user_name'),
@@ -229,9 +517,9 @@ def get_application(
         User, Application.user_id == User.user_id
     ).join(
         Pet, Application.pet_id == Pet.pet_id
-    ).filter(
+    ).where(
         Application.application_id == application_id
-    ).first()
+    ))).first()
 
     if not result:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -268,11 +556,11 @@ def get_application(
 
 
 @router.patch("/{application_id}", response_model=ApplicationOut)
-def update_application(
+async def update_application(
         application_id: int,
         data: ApplicationUpdate,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update Application Status (Admin Only)
@@ -290,20 +578,20 @@ def update_application(
         HTTPException 403: Not admin
         HTTPException 404: Application not found
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
     # Find application
-    application = db.query(Application).filter(
-        Application.application_id == application_id
-    ).first()
+    application = await db.get(Application, application_id)
 
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
     # Update fields
+    before = stats.stats_state(application)
+    previous_status = application.status
     if data.status:
         application.status = data.status
         application.reviewed_at = datetime.utcnow()
@@ -311,25 +599,127 @@ def update_application(
     if data.admin_notes is not None:
         application.admin_notes = data.admin_notes
 
-    db.commit()
-    db.refresh(application)
+    await stats.record_change(db, before, stats.stats_state(application))
+    await db.commit()
+    await db.refresh(application)
+    application_events.publish(UPDATED, application, previous_status=previous_status)
 
     return application
 
 
+@router.post("/bulk-review")
+async def bulk_review_applications(
+        data: ApplicationBulkReview,
+        request: Request,
+        db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Bulk Review Applications (Admin Only)
+    -------------------------------------
+    Set the status (and optionally notes) of many applications in one
+    transaction, e.g. to work through a day's review queue in one request.
+
+    Args:
+        data: application_ids, status, admin_notes; with status "approved",
+              reject_other_pending also rejects every other pending
+              application for the same pets (with rejection_notes, if given)
+
+    Returns:
+        dict: Numbers of applications updated and auto-rejected, and the
+              requested ids that don't exist
+
+    Raises:
+        HTTPException 403: Not admin
+
+    Example:
+        POST /applications/bulk-review
+        {"application_ids": [12, 15], "status": "approved", "reject_other_pending": true}
+        -> {"updated": 2, "auto_rejected": 7, "not_found": []}
+
+    Note:
+        Uses one UPDATE per group (reviewed, auto-rejected) instead of a
+        SELECT and commit per application, and every application gets the
+        same reviewed_at. Stats counters and application events are updated
+        as for PATCH /applications/{id}.
+    """
+    user = await get_current_user(request, db)
+
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    # Current state, for the stats and events (rows locked on PostgreSQL)
+    requested = set(data.application_ids)
+    before = {
+        row.application_id: row
+        for row in await db.execute(
+            select(*REVIEW_COLUMNS).where(Application.application_id.in_(requested)).with_for_update()
+        )
+    }
+    reviewed_at = datetime.utcnow()
+
+    values = {"status": data.status, "reviewed_at": reviewed_at}
+    if data.admin_notes is not None:
+        values["admin_notes"] = data.admin_notes
+    reviewed = []
+    if before:
+        reviewed = (await db.execute(
+            update(Application)
+            .where(Application.application_id.in_(list(before)))
+            .values(**values)
+            .returning(*REVIEW_COLUMNS)
+        )).all()
+
+    # Approving an applicant closes the other pending applications for that pet
+    auto_rejected = []
+    if data.reject_other_pending and data.status == "approved" and reviewed:
+        others = {
+            row.application_id: row
+            for row in await db.execute(
+                select(*REVIEW_COLUMNS).where(
+                    Application.pet_id.in_({row.pet_id for row in reviewed}),
+                    Application.status == "pending",
+                    Application.application_id.not_in(list(before)),
+                ).with_for_update()
+            )
+        }
+        if others:
+            before.update(others)
+            values = {"status": "rejected", "reviewed_at": reviewed_at}
+            if data.rejection_notes is not None:
+                values["admin_notes"] = data.rejection_notes
+            auto_rejected = (await db.execute(
+                update(Application)
+                .where(Application.application_id.in_(list(others)))
+                .values(**values)
+                .returning(*REVIEW_COLUMNS)
+            )).all()
+
+    changed = reviewed + auto_rejected
+    await stats.record_changes(db, [
+        (stats.stats_state(before[row.application_id]), stats.stats_state(row)) for row in changed
+    ])
+    await db.commit()
+    for row in changed:
+        application_events.publish(UPDATED, row, previous_status=before[row.application_id].status)
+
+    return {
+        "updated": len(reviewed),
+        "auto_rejected": len(auto_rejected),
+        "not_found": sorted(requested - before.keys()),
+    }
+
+
 @router.delete("/{application_id}")
-def delete_application(
+async def delete_application(
         application_id: int,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     # Get current user from JWT token
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Find application in database
-    application = db.query(Application).filter(
-        Application.application_id == application_id
-    ).first()
+    application = await db.get(Application, application_id)
 
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -339,7 +729,9 @@ def delete_application(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     # Perform deletion
-    db.delete(application)
-    db.commit()
+    await stats.record_change(db, stats.stats_state(application), None)
+    await db.delete(application)
+    await db.commit()
+    application_events.publish(DELETED, application)
 
     return {"ok": True, "message": "Application deleted successfully"}
\ No newline at end of file
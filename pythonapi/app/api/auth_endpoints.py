@@ -16,14 +16,18 @@ Routes:
 
 from fastapi import APIRouter, HTTPException, Response, Request, Depends
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from authlib.integrations.starlette_client import OAuth
 from starlette.config import Config
-from app.db import get_db
+from app.db import get_async_db
 from app.schemas.models import User
 from app.schemas.schemas_auth import LoginRequest, RegisterRequest, UserOut
+from app.services.cache_service import principal_cache
+from app.services.password_service import (  # bcrypt on a dedicated pool
+    hash_password_async, needs_rehash, verify_password_async,
+)
 from app import config
-import bcrypt
 import jwt
 from datetime import datetime, timedelta
 from typing import Optional
@@ -52,21 +56,6 @@ oauth.register(
 )
 
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode('utf-8')
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    password_bytes = plain_password.encode('utf-8')
-    hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
-
-
 def create_access_token(data: dict, remember_me: bool = False) -> str:
     """
     Create a JWT access token.
@@ -105,10 +94,17 @@ def get_token_from_request(request: Request) -> Optional[str]:
     return request.cookies.get("access_token")
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_async_db)) -> UserOut:
     """
     Get the currently authenticated user from JWT token.
 
+    The verified user is cached per token for a short time (see
+    PRINCIPAL_CACHE_TTL_SECONDS), so repeat requests skip the users table.
+    update_user/delete_user drop the cached entries via invalidate_principal().
+
+    Returns:
+        UserOut: Snapshot of the user (not a database-bound object)
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
@@ -124,14 +120,29 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
             raise HTTPException(status_code=401, detail="Invalid token")
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
-    user = db.query(User).filter(User.email == email).first()
+    principal = principal_cache.get(email, token)
+    if principal is not None:
+        return principal
+
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
-    return user
+    principal = UserOut.model_validate(user)
+    principal_cache.set(email, token, principal)
+    return principal
+
+
+def invalidate_principal(email: str) -> None:
+    """
+    Drop every cached token for a user after their account changes.
+    Only this process's cache is cleared; other API workers catch up within
+    PRINCIPAL_CACHE_TTL_SECONDS (see config).
+    """
+    principal_cache.invalidate(email)
 
 
 def require_auth(request: Request):
@@ -156,7 +167,7 @@ def auth_status():
 
 
 @router.post("/login", response_model=UserOut)
-def login(data: LoginRequest, response: Response, db: Session = Depends(get_db)):
+async def login(data: LoginRequest, response: Response, db: AsyncSession = Depends(get_async_db)):
     """
     User Login
     ----------
@@ -173,12 +184,22 @@ def login(data: LoginRequest, response: Response, db: Session = Depends(get_db))
 
     Raises:
         HTTPException 401: Invalid credentials
+        HTTPException 503: Password hashing pool is saturated
+
+    Note:
+        If the stored hash was created with a different bcrypt cost than
+        BCRYPT_ROUNDS, it is re-hashed with the current cost on success.
     """
-    user = db.query(User).filter(User.email == data.email).first()
+    user = await db.scalar(select(User).where(User.email == data.email))
 
-    if not user or not verify_password(data.password, user.password_hash):
+    if not user or not await verify_password_async(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    # Upgrade hashes created with an older/different work factor
+    if needs_rehash(user.password_hash):
+        user.password_hash = await hash_password_async(data.password)
+        await db.commit()
+
     # Create JWT token
     remember_me = getattr(data, 'remember_me', False)
     access_token = create_access_token(
@@ -209,7 +230,7 @@ def login(data: LoginRequest, response: Response, db: Session = Depends(get_db))
 
 
 @router.post("/register", response_model=UserOut)
-def register(data: RegisterRequest, response: Response, db: Session = Depends(get_db)):
+async def register(data: RegisterRequest, response: Response, db: AsyncSession = Depends(get_async_db)):
     """
     User Registration
     -----------------
@@ -226,20 +247,20 @@ def register(data: RegisterRequest, response: Response, db: Session = Depends(ge
     Raises:
         HTTPException 400: Email already registered
     """
-    existing_user = db.query(User).filter(User.email == data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == data.email))
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     new_user = User(
         email=data.email,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password_async(data.password),
         display_name=data.display_name,
         is_admin=False
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     # Create JWT token
     access_token = create_access_token(data={"sub": new_user.email})
@@ -283,7 +304,7 @@ def logout(response: Response):
 
 
 @router.get("/me", response_model=UserOut)
-def me(request: Request, db: Session = Depends(get_db)):
+async def me(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get Current User
     ----------------
@@ -299,7 +320,7 @@ def me(request: Request, db: Session = Depends(get_db)):
     Raises:
         HTTPException 401: Not authenticated
     """
-    return get_current_user(request, db)
+    return await get_current_user(request, db)
 
 
 @router.get("/google/login")
@@ -331,7 +352,7 @@ async def google_login(request: Request):
 
 
 @router.get("/google/callback")
-async def google_callback(request: Request, db: Session = Depends(get_db)):
+async def google_callback(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Google OAuth Callback
     ---------------------
@@ -367,7 +388,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
         print(f"Google OAuth: Processing login for {email}")
 
         # Find or create user
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
 
         if not user:
             # Create new user with random password (they'll use Google to login)
@@ -376,13 +397,13 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
 
             user = User(
                 email=email,
-                password_hash=hash_password(random_password),
+                password_hash=await hash_password_async(random_password),
                 display_name=display_name,
                 is_admin=False  # New Google users are not admins by default
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            await db.commit()
+            await db.refresh(user)
             print(f"Created new user via Google OAuth: {email}")
         else:
             print(f"Found existing user: {email}")
@@ -11,8 +11,10 @@ Routes:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
-from app.db import get_db
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import get_async_db
 from app.schemas.models import Favorite, Pet
 from app.api.auth_endpoints import get_current_user
 from app.schemas.schemas_pet import PetOut
@@ -22,9 +24,9 @@ router = APIRouter(prefix="/favorites", tags=["favorites"])
 
 
 @router.get("", response_model=List[PetOut])
-def list_favorites(
+async def list_favorites(
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get User's Favorite Pets
@@ -34,25 +36,25 @@ def list_favorites(
     Returns:
         List of pet objects
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Query pets that user has favorited
-    pets = db.query(Pet).join(
+    pets = await db.scalars(select(Pet).join(
         Favorite, Pet.pet_id == Favorite.pet_id
-    ).filter(
+    ).where(
         Favorite.user_id == user.user_id
     ).order_by(
         Favorite.created_at.desc()
-    ).all()
+    ))
 
-    return pets
+    return list(pets)
 
 
 @router.post("/{pet_id}")
-def add_favorite(
+async def add_favorite(
         pet_id: int,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Add Pet to Favorites
@@ -69,18 +71,18 @@ def add_favorite(
         HTTPException 404: Pet not found
         HTTPException 400: Already favorited
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Check if pet exists
-    pet = db.query(Pet).filter(Pet.pet_id == pet_id).first()
+    pet = await db.get(Pet, pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Pet not found")
 
     # Check if already favorited
-    existing = db.query(Favorite).filter(
+    existing = await db.scalar(select(Favorite).where(
         Favorite.user_id == user.user_id,
         Favorite.pet_id == pet_id
-    ).first()
+    ))
 
     if existing:
         raise HTTPException(status_code=400, detail="Pet already in favorites")
@@ -92,16 +94,21 @@ def add_favorite(
     )
 
     db.add(favorite)
-    db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request favorited the same pet first (unique index)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Pet already in favorites")
 
     return {"ok": True, "message": "Pet added to favorites"}
 
 
 @router.delete("/{pet_id}")
-def remove_favorite(
+async def remove_favorite(
         pet_id: int,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Remove Pet from Favorites
@@ -117,29 +124,29 @@ def remove_favorite(
     Raises:
         HTTPException 404: Favorite not found
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Find favorite
-    favorite = db.query(Favorite).filter(
+    favorite = await db.scalar(select(Favorite).where(
         Favorite.user_id == user.user_id,
         Favorite.pet_id == pet_id
-    ).first()
+    ))
 
     if not favorite:
         raise HTTPException(status_code=404, detail="Pet not in favorites")
 
     # Delete favorite
-    db.delete(favorite)
-    db.commit()
+    await db.delete(favorite)
+    await db.commit()
 
     return {"ok": True, "message": "Pet removed from favorites"}
 
 
 @router.get("/check/{pet_id}")
-def check_favorite(
+async def check_favorite(
         pet_id: int,
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Check if Pet is Favorited
@@ -152,21 +159,21 @@ def check_favorite(
     Returns:
         {"is_favorited": bool}
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Check if favorited
-    favorite = db.query(Favorite).filter(
+    favorite = await db.scalar(select(Favorite).where(
         Favorite.user_id == user.user_id,
         Favorite.pet_id == pet_id
-    ).first()
+    ))
 
     return {"is_favorited": favorite is not None}
 
 
 @router.get("/list-ids")
-def list_favorite_ids(
+async def list_favorite_ids(
         request: Request,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get List of Favorited Pet IDs
@@ -177,14 +184,12 @@ def list_favorite_ids(
     Returns:
         {"pet_ids": [1, 2, 3, ...]}
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
 
     # Query favorite pet IDs
-    pet_ids = db.query(Favorite.pet_id).filter(
+    pet_ids = await db.scalars(select(Favorite.pet_id).where(
         Favorite.user_id == user.user_id
-    ).all()
-
-    # Extract IDs from tuples
-    pet_ids = [pid[0] for pid in pet_ids]
+    ))
+    pet_ids = list(pet_ids)
 
     return {"pet_ids": pet_ids}
\ No newline at end of file
@@ -11,19 +11,44 @@ Routes:
     - DELETE /locations/{location_id}: Delete location
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db import get_db  # Database session dependency
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import get_async_db  # Database session dependency
 from app.schemas.schemas_location import LocationCreate, LocationOut  # Pydantic schemas for locations
-from app.schemas.models import Location  # Location database model
+from app.schemas.models import Location, Pet  # Database models
+from app.services.catalog_version_service import (  # ETags / change counters
+    bump_version, catalog_etag, is_not_modified, not_modified,
+)
+from app.services.cache_service import (  # Pre-serialized response cache
+    LOCATIONS_LIST, catalog_cache, cached_json_response,
+)
 from sqlalchemy import func
 
 # Create API router with /locations prefix
 router = APIRouter(prefix="/locations", tags=["locations"])
 
+# Serializes query results straight to JSON bytes for the response cache
+location_list_adapter = TypeAdapter(list[LocationOut])
+
+
+def name_sort_key(db: AsyncSession):
+    """
+    Case-insensitive sort key for location names.
+
+    PostgreSQL's default collation is locale-aware (it skips spaces and
+    punctuation when comparing), while SQLite compares bytes. Forcing the
+    "C" collation on PostgreSQL gives the same order on both databases.
+    """
+    key = func.lower(Location.name)
+    if db.get_bind().dialect.name == "postgresql":
+        key = key.collate("C")
+    return key
+
 
 @router.get("", response_model=list[LocationOut])
-def list_locations(db: Session = Depends(get_db)):
+async def list_locations(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     List All Locations
     ------------------
@@ -34,12 +59,29 @@ def list_locations(db: Session = Depends(get_db)):
 
     Note:
         Uses case-insensitive sorting for consistent alphabetical order.
+        Responds 304 Not Modified when If-None-Match matches the current ETag,
+        and serves repeat requests from the response cache.
     """
-    return db.query(Location).order_by(func.lower(Location.name).asc()).all()
+    etag = await catalog_etag(db, Location.__tablename__)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cached = catalog_cache.get(LOCATIONS_LIST, etag)
+    if cached is not None:
+        return cached_json_response(cached, etag)
+
+    locations = list(await db.scalars(
+        select(Location).order_by(name_sort_key(db).asc(), Location.location_id)
+    ))
+
+    body = location_list_adapter.dump_json(location_list_adapter.validate_python(locations, from_attributes=True))
+    cached = (body, {})
+    catalog_cache.set(LOCATIONS_LIST, etag, cached)
+    return cached_json_response(cached, etag)
 
 
 @router.post("", response_model=LocationOut, status_code=200)
-def create_location(payload: LocationCreate, db: Session = Depends(get_db)):
+async def create_location(payload: LocationCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create New Location
     -------------------
@@ -61,13 +103,15 @@ def create_location(payload: LocationCreate, db: Session = Depends(get_db)):
     # Create and save new location
     obj = Location(**data)
     db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    await db.execute(bump_version(Location.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(LOCATIONS_LIST)
+    await db.refresh(obj)
     return obj
 
 
 @router.put("/{location_id}", response_model=LocationOut)
-def update_location(location_id: int, payload: LocationCreate, db: Session = Depends(get_db)):
+async def update_location(location_id: int, payload: LocationCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Update Location
     ---------------
@@ -88,7 +132,7 @@ def update_location(location_id: int, payload: LocationCreate, db: Session = Dep
         Phone number defaults to empty string if not provided.
     """
     # Find the location
-    location = db.query(Location).filter(Location.location_id == location_id).first()
+    location = await db.get(Location, location_id)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
 
@@ -100,13 +144,15 @@ def update_location(location_id: int, payload: LocationCreate, db: Session = Dep
         setattr(location, key, value)
 
     # Save changes
-    db.commit()
-    db.refresh(location)
+    await db.execute(bump_version(Location.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(LOCATIONS_LIST)
+    await db.refresh(location)
     return location
 
 
 @router.delete("/{location_id}")
-def delete_location(location_id: int, db: Session = Depends(get_db)):
+async def delete_location(location_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete Location
     ---------------
@@ -127,13 +173,14 @@ def delete_location(location_id: int, db: Session = Depends(get_db)):
         This prevents orphaned pet records.
     """
     # Find the location
-    location = db.query(Location).filter(Location.location_id == location_id).first()
+    location = await db.get(Location, location_id)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
 
     # Check if any pets are using this location
-    from app.schemas.models import Pet
-    pets_count = db.query(Pet).filter(Pet.location_id == location_id).count()
+    pets_count = await db.scalar(
+        select(func.count()).select_from(Pet).where(Pet.location_id == location_id)
+    )
     if pets_count > 0:
         raise HTTPException(
             status_code=400,
@@ -141,6 +188,8 @@ def delete_location(location_id: int, db: Session = Depends(get_db)):
         )
 
     # Delete location
-    db.delete(location)
-    db.commit()
+    await db.delete(location)
+    await db.execute(bump_version(Location.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(LOCATIONS_LIST)
     return {"ok": True, "message": "Location deleted successfully"}
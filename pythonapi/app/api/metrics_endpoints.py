@@ -0,0 +1,93 @@
+"""
+Metrics Endpoints
+-----------------
+Read-only runtime counters for load testing and monitoring.
+
+Routes:
+    - GET /metrics/cache: Catalog response and principal cache statistics
+    - GET /metrics/bcrypt: Password hashing pool statistics
+    - GET /metrics/image-jobs: Background image processing queue
+    - GET /metrics/application-events: Open application event streams
+"""
+
+from fastapi import APIRouter
+from app.services.cache_service import catalog_cache, principal_cache  # In-process caches
+from app.services.password_service import hasher  # bcrypt thread pool
+from app.services.image_job_service import image_worker  # Image processing queue
+from app.services.application_events_service import application_events  # SSE broker
+
+# Create API router with /metrics prefix
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/cache")
+def cache_metrics():
+    """
+    Cache Statistics
+    ----------------
+    Returns hit/miss counters for the in-process caches:
+        - catalog: GET /pets, GET /pets/{pet_id} and GET /locations responses
+        - principals: verified users for authenticated requests
+
+    Returns:
+        dict: entries, hits, misses, hit_ratio, evictions, invalidations per cache
+
+    Note:
+        Counters are per API worker process and reset on restart.
+    """
+    return {
+        "catalog": catalog_cache.stats(),
+        "principals": principal_cache.stats(),
+    }
+
+
+@router.get("/bcrypt")
+def bcrypt_metrics():
+    """
+    Password Hashing Statistics
+    ---------------------------
+    Returns the state of the dedicated bcrypt thread pool.
+
+    Returns:
+        dict: rounds, max_workers, max_queue, active, queued, completed, rejected
+
+    Note:
+        A growing "queued" count or non-zero "rejected" count means login and
+        registration traffic is exceeding BCRYPT_MAX_WORKERS.
+    """
+    return hasher.stats()
+
+
+@router.get("/image-jobs")
+async def image_job_metrics():
+    """
+    Image Processing Statistics
+    ---------------------------
+    Returns the background image job queue state.
+
+    Returns:
+        dict: processes, running_here, jobs (count per status), completed, retried, failed
+
+    Note:
+        "jobs" is read from the database and covers all API workers; the other
+        counters are for this worker process only.
+    """
+    return await image_worker.stats()
+
+
+@router.get("/application-events")
+def application_event_metrics():
+    """
+    Application Event Stream Statistics
+    -----------------------------------
+    Returns the state of the GET /applications/events broker.
+
+    Returns:
+        dict: subscribers, published, buffered, dropped_subscribers
+
+    Note:
+        Counters are per API worker process and reset on restart. A growing
+        "dropped_subscribers" count means clients can't keep up with
+        APPLICATION_EVENTS_QUEUE_SIZE.
+    """
+    return application_events.stats()
@@ -5,43 +5,339 @@ API endpoints for managing pets in the adoption system.
 Handles pet CRUD operations with photo upload support.
 
 Routes:
-    - GET /pets: List all pets
+    - GET /pets: List pets (filterable, cursor-paginated)
+    - GET /pets/search: Full-text search over pet names, species and descriptions
+    - GET /pets/count: Number of pets matching the list filters
+    - GET /pets/species: Distinct species, for filter dropdowns
     - GET /pets/{pet_id}: Get specific pet details
+    - POST /pets/photo-uploads: Presign a direct photo upload to object storage
+    - POST /pets/bulk: Import many pets from NDJSON/CSV (admin only)
     - POST /pets: Create new pet (with optional photo upload)
     - PUT /pets/{pet_id}: Update existing pet (with optional photo upload)
     - PATCH /pets/{pet_id}/approve: Approve a pet
     - DELETE /pets/{pet_id}: Delete a pet
+    - POST /pets/bulk-approve: Approve many pets in one statement (admin only)
+    - POST /pets/bulk-delete: Delete many pets and their dependents (admin only)
+    - GET /pets/export: Stream pets as CSV or NDJSON (admin only)
 """
 
 import os
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from app.db import get_db  # Database session dependency
-from app.schemas.schemas_pet import PetCreate, PetOut  # Pydantic schemas for pets
-from app.schemas.models import Pet  # Pet database model
+import zipfile
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import get_async_db  # Database sessions
+from app.schemas.schemas_pet import (  # Pydantic schemas for pets
+    PetCount, PetCreate, PetImportReport, PetOut, PetSelection, PhotoUploadRequest, PhotoUploadTicket,
+)
+from app.schemas.schemas_auth import UserOut
+from app.schemas.models import Application, Favorite, ImageJob, Location, Pet  # Database models
 from app.api.auth_endpoints import require_auth  # Authentication dependency
-from app.services.files_service import save_image_or_error  # File upload utility
-from pathlib import Path
+from app.api.users_endpoints import require_admin  # Admin-only dependency
+from app.services.files_service import (  # File upload utilities
+    check_uploaded_photo, direct_upload_ticket, save_image_async,
+)
+from app.services.storage_service import get_storage  # Local directory or S3
+from app.services.pet_import_service import IMPORT_FORMATS, import_pets  # Bulk import
+from app.services.image_job_service import image_worker, queue_image_job  # Background variants
+from app.services.search_service import search_pets  # Full-text search
+from app.services.application_stats_service import remove_applications  # Dashboard counters
+from app.services.application_events_service import (  # Live application updates
+    DELETED, application_events, deleted_applications,
+)
+from app.services.export_service import export_response  # Streaming CSV/NDJSON
+from app.services.catalog_version_service import (  # ETags / change counters
+    bump_version, catalog_etag, is_not_modified, not_modified,
+)
+from app.services.cache_service import (  # Pre-serialized response cache
+    PETS_LIST, catalog_cache, cached_json_response, pet_namespace,
+)
+from app import config
 
 # Create API router with /pets prefix
 router = APIRouter(prefix="/pets", tags=["pets"])
 
+# Serializes query results straight to JSON bytes for the response cache
+pet_list_adapter = TypeAdapter(list[PetOut])
+species_adapter = TypeAdapter(list[str])
+
+
+def encode_search_cursor(score: float, pet_id: int) -> str:
+    """
+    Keyset cursor for the search result after which the next page starts.
+
+    Example:
+        encode_search_cursor(-1.78e-06, 42) -> "-1.78e-06_42"
+    """
+    return f"{score!r}_{pet_id}"
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, int]:
+    """Parse a cursor from encode_search_cursor (HTTPException 400 if malformed)."""
+    try:
+        score_part, _, id_part = cursor.rpartition("_")
+        return float(score_part), int(id_part)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.get("", response_model=list[PetOut])
-def list_pets(db: Session = Depends(get_db)):
+async def list_pets(
+        request: Request,
+        limit: int = Query(50, ge=1, le=200),
+        cursor: int | None = Query(None, ge=1),
+        species: str | None = None,
+        status: str | None = None,
+        location_id: int | None = None,
+        min_age: int | None = Query(None, ge=0),
+        max_age: int | None = Query(None, ge=0),
+        db: AsyncSession = Depends(get_async_db),
+):
     """
-    List All Pets
-    -------------
-    Returns all pets in the database, ordered by newest first.
+    List Pets
+    ---------
+    Returns one page of pets, ordered by newest first.
+
+    Query Parameters:
+        limit: Maximum number of pets to return (default 50, max 200)
+        cursor: Only return pets older than this pet_id (from X-Next-Cursor)
+        species: Filter by exact species (e.g. "Dog")
+        status: Filter by status ("pending" or "approved")
+        location_id: Filter by location
+        min_age / max_age: Inclusive age range
+
+    Returns:
+        List[PetOut]: One page of pets
+
+    Note:
+        Uses keyset pagination on pet_id. Unfiltered pages and pages filtered
+        by species, status or location_id are an index seek however deep the
+        client has scrolled; an age range is ordered by pet_id too, so it
+        narrows the rows read but still walks the matching range. When more
+        pets are available the X-Next-Cursor header holds the cursor for the
+        next page.
+        Responds 304 Not Modified when If-None-Match matches the current ETag,
+        and serves repeat requests for the same page from the response cache.
+    """
+    etag = await catalog_etag(db, Pet.__tablename__)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cache_key = (etag, limit, cursor, species, status, location_id, min_age, max_age)
+    cached = catalog_cache.get(PETS_LIST, cache_key)
+    if cached is not None:
+        return cached_json_response(cached, etag)
+
+    query = select(Pet)
+
+    # Apply optional filters (species/status/location_id are backed by a (column, pet_id) index)
+    if species:
+        query = query.where(Pet.species == species)
+    if status:
+        query = query.where(Pet.status == status)
+    if location_id is not None:
+        query = query.where(Pet.location_id == location_id)
+    if min_age is not None:
+        query = query.where(Pet.age >= min_age)
+    if max_age is not None:
+        query = query.where(Pet.age <= max_age)
+
+    # Continue from where the previous page stopped
+    if cursor is not None:
+        query = query.where(Pet.pet_id < cursor)
+
+    # Fetch one extra row to find out whether another page exists
+    pets = list(await db.scalars(query.order_by(Pet.pet_id.desc()).limit(limit + 1)))
+    headers = {}
+    if len(pets) > limit:
+        pets = pets[:limit]
+        headers["X-Next-Cursor"] = str(pets[-1].pet_id)
+
+    body = pet_list_adapter.dump_json(pet_list_adapter.validate_python(pets, from_attributes=True))
+    cached = (body, headers)
+    catalog_cache.set(PETS_LIST, cache_key, cached)
+    return cached_json_response(cached, etag)
+
+
+@router.get("/search", response_model=list[PetOut])
+async def search(
+        response: Response,
+        q: str = Query(..., min_length=1, max_length=200),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: str | None = None,
+        species: str | None = None,
+        status: str | None = None,
+        location_id: int | None = None,
+        db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Search Pets
+    -----------
+    Full-text search across pet name, species and description.
+
+    Query Parameters:
+        q: Search text (each word is matched as a prefix, e.g. "gold ret")
+        limit: Maximum number of pets to return (default 20, max 100)
+        cursor: Value of X-Next-Cursor from the previous page
+        species / status / location_id: Same filters as GET /pets
 
     Returns:
-        List[PetOut]: List of all pets
+        List[PetOut]: Matching pets, most relevant first
+
+    Raises:
+        HTTPException 400: Invalid cursor
+
+    Note:
+        Ranked with bm25; name matches outweigh species and description matches.
+        The cursor is the (score, pet_id) of the last pet returned, so a deep
+        page continues from there instead of re-ranking every earlier match.
     """
-    return db.query(Pet).order_by(Pet.pet_id.desc()).all()
+    after = decode_search_cursor(cursor) if cursor else None
+    hits = await search_pets(db, q, limit + 1, after, species, status, location_id)
+    if len(hits) > limit:
+        hits = hits[:limit]
+        response.headers["X-Next-Cursor"] = encode_search_cursor(hits[-1][1], hits[-1][0].pet_id)
+    return [pet for pet, _ in hits]
+
+
+@router.get("/count", response_model=PetCount)
+async def count_pets(
+        request: Request,
+        species: str | None = None,
+        status: str | None = None,
+        location_id: int | None = None,
+        db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Count Pets
+    ----------
+    Number of pets matching the GET /pets filters, for totals that one page
+    of the list can't give (dashboard and home page counters).
+
+    Query Parameters:
+        species: Filter by exact species (e.g. "Dog")
+        status: Filter by status ("pending" or "approved")
+        location_id: Filter by location
+
+    Returns:
+        PetCount: {"count": 42}
+
+    Note:
+        Cached and answered with 304 Not Modified like GET /pets.
+    """
+    etag = await catalog_etag(db, Pet.__tablename__)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cache_key = ("count", etag, species, status, location_id)
+    cached = catalog_cache.get(PETS_LIST, cache_key)
+    if cached is not None:
+        return cached_json_response(cached, etag)
+
+    query = select(func.count()).select_from(Pet)
+    if species:
+        query = query.where(Pet.species == species)
+    if status:
+        query = query.where(Pet.status == status)
+    if location_id is not None:
+        query = query.where(Pet.location_id == location_id)
+
+    cached = (PetCount(count=await db.scalar(query)).model_dump_json().encode(), {})
+    catalog_cache.set(PETS_LIST, cache_key, cached)
+    return cached_json_response(cached, etag)
+
+
+@router.get("/species", response_model=list[str])
+async def list_species(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    List Species
+    ------------
+    Every species with at least one pet, alphabetically, for the species
+    filter (a page of GET /pets only shows the species on that page).
+
+    Returns:
+        List[str]: e.g. ["Cat", "Dog", "Rabbit"]
+
+    Note:
+        Cached and answered with 304 Not Modified like GET /pets.
+    """
+    etag = await catalog_etag(db, Pet.__tablename__)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cache_key = ("species", etag)
+    cached = catalog_cache.get(PETS_LIST, cache_key)
+    if cached is not None:
+        return cached_json_response(cached, etag)
+
+    species = list(await db.scalars(select(Pet.species).distinct().order_by(Pet.species)))
+    cached = (species_adapter.dump_json(species), {})
+    catalog_cache.set(PETS_LIST, cache_key, cached)
+    return cached_json_response(cached, etag)
+
+
+@router.get("/export")
+async def export_pets(
+        fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+        species: str | None = None,
+        status: str | None = None,
+        location_id: int | None = None,
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin),
+):
+    """
+    Export Pets (Admin Only)
+    ------------------------
+    Streams every matching pet, with its location name, as a CSV or NDJSON
+    download in pet_id order.
+
+    Query Parameters:
+        format: "csv" (default, with a header row) or "ndjson" (one JSON object per line)
+        species: Filter by exact species (e.g. "Dog")
+        status: Filter by status ("pending" or "approved")
+        location_id: Filter by location
+
+    Raises:
+        HTTPException 401: Not authenticated
+        HTTPException 403: Not admin
+
+    Note:
+        Rows are read through a server-side cursor and sent in batches of
+        EXPORT_BATCH_SIZE, so memory use doesn't grow with the catalog and
+        the download starts right away. The export reads through its own
+        session; the request session (only used for the admin check) is
+        released first rather than held for the whole download.
+    """
+    await db.close()
+
+    query = select(
+        Pet.pet_id,
+        Pet.name,
+        Pet.species,
+        Pet.age,
+        Pet.description,
+        Pet.status,
+        Pet.location_id,
+        Location.name.label("location_name"),
+        Pet.photo_url,
+        Pet.photo_status,
+    ).join(Location, Pet.location_id == Location.location_id)
+
+    if species:
+        query = query.where(Pet.species == species)
+    if status:
+        query = query.where(Pet.status == status)
+    if location_id is not None:
+        query = query.where(Pet.location_id == location_id)
+
+    return export_response(query.order_by(Pet.pet_id), fmt, "pets")
 
 
 @router.get("/{pet_id}", response_model=PetOut)
-def get_pet(pet_id: int, db: Session = Depends(get_db)):
+async def get_pet(pet_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Get Pet by ID
     -------------
@@ -55,22 +351,148 @@ def get_pet(pet_id: int, db: Session = Depends(get_db)):
 
     Raises:
         HTTPException 404: Pet not found
+
+    Note:
+        Responds 304 Not Modified when If-None-Match matches the current ETag,
+        and serves repeat requests from the response cache.
     """
-    pet = db.query(Pet).filter(Pet.pet_id == pet_id).first()
+    etag = await catalog_etag(db, Pet.__tablename__)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    cached = catalog_cache.get(pet_namespace(pet_id), etag)
+    if cached is not None:
+        return cached_json_response(cached, etag)
+
+    pet = await db.get(Pet, pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Not found")
-    return pet
+
+    cached = (PetOut.model_validate(pet).model_dump_json().encode(), {})
+    catalog_cache.set(pet_namespace(pet_id), etag, cached)
+    return cached_json_response(cached, etag)
+
+
+async def store_photo(photo: UploadFile | None, photo_url: str | None) -> str | None:
+    """
+    Web path of the photo sent with a create/update request: a file uploaded
+    through the API, or the photo_url of a finished direct upload.
+
+    Raises:
+        HTTPException 400: Both given, or the photo is invalid / missing
+    """
+    if photo and photo_url:
+        raise HTTPException(status_code=400, detail="Send either photo or photo_url, not both")
+    if photo:
+        return await save_image_async(photo, get_storage(), config.MAX_UPLOAD_MB * 1024 * 1024)
+    if photo_url:
+        return await run_in_threadpool(check_uploaded_photo, photo_url, get_storage())
+    return None
+
+
+@router.post("/photo-uploads", response_model=PhotoUploadTicket, dependencies=[Depends(require_auth)])
+async def create_photo_upload(body: PhotoUploadRequest):
+    """
+    Presign Direct Photo Upload
+    ---------------------------
+    Let the client upload a pet photo straight to the object store, so the
+    image bytes never pass through the API. Requires authentication and
+    STORAGE_BACKEND=s3.
+
+    Args:
+        body: filename, size in bytes and hex SHA-256 of the photo
+
+    Returns:
+        PhotoUploadTicket: photo_url, plus the presigned request to send the
+        file with (method, url, headers). upload is null when the same photo
+        is already stored.
+
+    Raises:
+        HTTPException 400: Not JPG/PNG, or larger than MAX_UPLOAD_MB
+        HTTPException 501: Storage backend doesn't support direct uploads
+
+    Flow:
+        1. POST /pets/photo-uploads {"filename": "rex.jpg", "size": 183422, "sha256": "3fa2..."}
+        2. PUT the file to upload.url with upload.headers
+        3. POST /pets (or PUT /pets/{pet_id}) with photo_url instead of photo
+
+    Note:
+        The store rejects bodies whose size or SHA-256 differ from the ones
+        announced here, and the photo is decoded by the background image job
+        (photo_status becomes "failed" if it isn't a valid image).
+    """
+    return await run_in_threadpool(
+        direct_upload_ticket, body.filename, body.size, body.sha256,
+        get_storage(), config.MAX_UPLOAD_MB * 1024 * 1024,
+    )
+
+
+@router.post("/bulk", response_model=PetImportReport)
+async def bulk_import_pets(
+        file: UploadFile = File(...),
+        photos: UploadFile | None = File(None),
+        dry_run: bool = Query(False),
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin),
+):
+    """
+    Bulk Import Pets (Admin Only)
+    -----------------------------
+    Create many pets in one request, e.g. when onboarding a new shelter.
+
+    Args:
+        file: Pets as NDJSON (.ndjson/.jsonl) or CSV (.csv, with a header row);
+              each row has the POST /pets fields plus an optional "photo"
+        photos: Optional ZIP archive with the photo files the rows name
+        dry_run: Only validate the rows and report errors
+
+    Returns:
+        PetImportReport: Row, insert and photo counts plus per-line errors
+
+    Raises:
+        HTTPException 400: Unknown file format, invalid ZIP archive or non-UTF-8 file
+
+    Example Response:
+        {"rows": 3, "inserted": 2, "failed": 1, "photos": 2,
+         "errors": [{"line": 3, "error": "age: Input should be a valid integer"}]}
+
+    Note:
+        Rows are inserted IMPORT_BATCH_SIZE at a time, each batch in its own
+        transaction; invalid rows are skipped, not fatal. Photo variants are
+        generated in the background, as for POST /pets.
+    """
+    ext = os.path.splitext(file.filename or "")[1].lower()
+    fmt = IMPORT_FORMATS.get(ext) or {
+        "text/csv": "csv", "application/x-ndjson": "ndjson", "application/jsonl": "ndjson",
+    }.get(file.content_type)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="Import file must be .ndjson, .jsonl or .csv")
+
+    archive = None
+    if photos:
+        try:
+            archive = await run_in_threadpool(zipfile.ZipFile, photos.file)
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail="photos must be a ZIP archive")
+
+    report = await import_pets(
+        db, file.file, fmt, archive=archive, storage=get_storage(), dry_run=dry_run
+    )
+    if report["photos"]:
+        image_worker.notify()
+    return report
 
 
 @router.post("", response_model=PetOut, dependencies=[Depends(require_auth)])
-def create_pet(
+async def create_pet(
         name: str = Form(...),
         species: str = Form(...),
         age: int = Form(...),
         description: str | None = Form(None),
         location_id: int = Form(...),
         photo: UploadFile | None = File(None),
-        db: Session = Depends(get_db),
+        photo_url: str | None = Form(None),
+        db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create New Pet
@@ -85,40 +507,43 @@ def create_pet(
         description: Detailed description (optional)
         location_id: ID of the location where pet is housed
         photo: Pet's photo file (optional, max 2MB)
+        photo_url: Instead of photo, a photo uploaded via POST /pets/photo-uploads
 
     Returns:
         PetOut: Created pet object
 
     Note:
         Uses multipart/form-data because of file upload.
-        Photo is saved to uploads/ directory and URL is stored in database.
+        Photo is saved to the storage backend and its URL is stored in database.
+        Resized thumb/card/full variants are generated in the background:
+        photo_status is "processing" until photo_variants is filled in.
     """
     # Validate input with Pydantic for consistent error messages
     payload = PetCreate(
         name=name, species=species, age=age, description=description, location_id=location_id
     )
 
-    # Get absolute path to uploads directory
-    base_dir = Path(__file__).resolve().parent  # Project root directory
-    upload_dir = os.getenv("UPLOAD_DIR") or str(base_dir / "uploads")
-    max_mb = int(os.getenv("MAX_UPLOAD_MB", "2"))
-
     # Handle photo upload if provided
-    photo_url = None
-    if photo:
-        photo_url = save_image_or_error(photo, upload_dir, max_mb * 1024 * 1024)
-        # Returns relative path like "uploads/<filename>"
+    # Returns relative path like "uploads/ab/12/<hash>.jpg"
+    photo_url = await store_photo(photo, photo_url)
 
-    # Create and save new pet
-    obj = Pet(**payload.model_dump(), photo_url=photo_url)
+    # Create and save new pet (and its image job, in the same transaction)
+    obj = Pet(**payload.model_dump())
     db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    if photo_url:
+        await db.flush()  # assigns pet_id for the job row
+        queue_image_job(db, obj, photo_url)
+    await db.execute(bump_version(Pet.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(PETS_LIST)
+    if photo_url:
+        image_worker.notify()
+    await db.refresh(obj)
     return obj
 
 
 @router.put("/{pet_id}", response_model=PetOut, dependencies=[Depends(require_auth)])
-def update_pet(
+async def update_pet(
         pet_id: int,
         name: str = Form(...),
         species: str = Form(...),
@@ -126,7 +551,8 @@ def update_pet(
         description: str | None = Form(None),
         location_id: int = Form(...),
         photo: UploadFile | None = File(None),
-        db: Session = Depends(get_db),
+        photo_url: str | None = Form(None),
+        db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update Existing Pet
@@ -142,6 +568,7 @@ def update_pet(
         description: Detailed description (optional)
         location_id: ID of the location where pet is housed
         photo: New pet's photo file (optional, max 2MB). If not provided, keeps existing photo.
+        photo_url: Instead of photo, a photo uploaded via POST /pets/photo-uploads
 
     Returns:
         PetOut: Updated pet object
@@ -154,7 +581,7 @@ def update_pet(
         If photo is provided, it replaces the old photo.
     """
     # Find the pet
-    pet = db.query(Pet).filter(Pet.pet_id == pet_id).first()
+    pet = await db.get(Pet, pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Pet not found")
 
@@ -163,30 +590,28 @@ def update_pet(
         name=name, species=species, age=age, description=description, location_id=location_id
     )
 
-    # Get absolute path to uploads directory
-    base_dir = Path(__file__).resolve().parent
-    upload_dir = os.getenv("UPLOAD_DIR") or str(base_dir / "uploads")
-    max_mb = int(os.getenv("MAX_UPLOAD_MB", "2"))
-
-    # Handle photo upload if provided
-    photo_url = pet.photo_url  # Keep existing photo by default
-    if photo:
-        photo_url = save_image_or_error(photo, upload_dir, max_mb * 1024 * 1024)
-        # Returns relative path like "uploads/<filename>"
+    # Handle photo upload if provided (otherwise keep the existing photo)
+    photo_url = await store_photo(photo, photo_url)
+    new_photo = photo_url is not None and photo_url != pet.photo_url
+    if new_photo:
+        queue_image_job(db, pet, photo_url)
 
     # Update pet fields
     for key, value in payload.model_dump().items():
         setattr(pet, key, value)
-    pet.photo_url = photo_url
 
     # Save changes
-    db.commit()
-    db.refresh(pet)
+    await db.execute(bump_version(Pet.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(PETS_LIST, pet_namespace(pet_id))
+    if new_photo:
+        image_worker.notify()
+    await db.refresh(pet)
     return pet
 
 
 @router.patch("/{pet_id}/approve", response_model=PetOut, dependencies=[Depends(require_auth)])
-def approve_pet(pet_id: int, db: Session = Depends(get_db)):
+async def approve_pet(pet_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Approve Pet
     -----------
@@ -206,7 +631,7 @@ def approve_pet(pet_id: int, db: Session = Depends(get_db)):
         Approved pets are visible to public users.
         Used for admin approval workflow.
     """
-    pet = db.query(Pet).filter(Pet.pet_id == pet_id).first()
+    pet = await db.get(Pet, pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Not found")
 
@@ -214,13 +639,15 @@ def approve_pet(pet_id: int, db: Session = Depends(get_db)):
     if pet.status != "approved":
         pet.status = "approved"
         db.add(pet)
-        db.commit()
-        db.refresh(pet)
+        await db.execute(bump_version(Pet.__tablename__))
+        await db.commit()
+        catalog_cache.invalidate(PETS_LIST, pet_namespace(pet_id))
+        await db.refresh(pet)
     return pet
 
 
 @router.delete("/{pet_id}", dependencies=[Depends(require_auth)])
-def delete_pet(pet_id: int, db: Session = Depends(get_db)):
+async def delete_pet(pet_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete Pet
     ----------
@@ -239,10 +666,131 @@ def delete_pet(pet_id: int, db: Session = Depends(get_db)):
     Note:
         This is a permanent action and cannot be undone!
     """
-    pet = db.query(Pet).filter(Pet.pet_id == pet_id).first()
+    pet = await db.get(Pet, pet_id)
     if not pet:
         raise HTTPException(status_code=404, detail="Not found")
 
-    db.delete(pet)
-    db.commit()
-    return {"ok": True}
\ No newline at end of file
+    removed = await deleted_applications(db, Application.pet_id == pet_id)
+    await remove_applications(db, Application.pet_id == pet_id)
+    await db.delete(pet)  # loads and deletes applications/favorites (ORM cascade)
+    await db.execute(bump_version(Pet.__tablename__))
+    await db.commit()
+    catalog_cache.invalidate(PETS_LIST, pet_namespace(pet_id))
+    for application in removed:
+        application_events.publish(DELETED, application)
+    return {"ok": True}
+
+
+def selection_filter(selection: PetSelection) -> list:
+    """
+    WHERE clauses for a bulk selection.
+
+    Raises:
+        HTTPException 400: Nothing selected (a bulk operation never targets every pet implicitly)
+    """
+    clauses = []
+    if selection.pet_ids:
+        clauses.append(Pet.pet_id.in_(selection.pet_ids))
+    if selection.status is not None:
+        clauses.append(Pet.status == selection.status)
+    if selection.location_id is not None:
+        clauses.append(Pet.location_id == selection.location_id)
+    if selection.species is not None:
+        clauses.append(Pet.species == selection.species)
+    if not clauses:
+        raise HTTPException(status_code=400, detail="Give pet_ids or at least one filter")
+    return clauses
+
+
+async def missing_pet_ids(db: AsyncSession, selection: PetSelection) -> list[int]:
+    """Requested pet_ids that don't exist, as bulk review reports them."""
+    if not selection.pet_ids:
+        return []
+    found = set(await db.scalars(select(Pet.pet_id).where(Pet.pet_id.in_(selection.pet_ids))))
+    return sorted(set(selection.pet_ids) - found)
+
+
+@router.post("/bulk-approve")
+async def bulk_approve_pets(
+        selection: PetSelection,
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin),
+):
+    """
+    Bulk Approve Pets (Admin Only)
+    ------------------------------
+    Approve every selected pet with a single UPDATE.
+
+    Args:
+        selection: pet_ids and/or filters (status, location_id, species), combined with AND
+
+    Returns:
+        dict: Number of pets approved (already approved pets are not counted)
+              and the requested pet_ids that don't exist
+
+    Example:
+        POST /pets/bulk-approve {"status": "pending", "location_id": 2}
+        -> {"approved": 140, "not_found": []}
+    """
+    clauses = selection_filter(selection)
+    not_found = await missing_pet_ids(db, selection)
+    pet_ids = list(await db.scalars(
+        update(Pet)
+        .where(*clauses, Pet.status != "approved")
+        .values(status="approved")
+        .returning(Pet.pet_id)
+    ))
+    if pet_ids:
+        await db.execute(bump_version(Pet.__tablename__))
+    await db.commit()
+    if pet_ids:
+        catalog_cache.invalidate(PETS_LIST, *map(pet_namespace, pet_ids))
+    return {"approved": len(pet_ids), "not_found": not_found}
+
+
+@router.post("/bulk-delete")
+async def bulk_delete_pets(
+        selection: PetSelection,
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin),
+):
+    """
+    Bulk Delete Pets (Admin Only)
+    -----------------------------
+    Permanently delete every selected pet, with its applications, favorites
+    and image jobs, in one transaction.
+
+    Args:
+        selection: pet_ids and/or filters (status, location_id, species), combined with AND
+
+    Returns:
+        dict: Rows deleted per table and the requested pet_ids that don't exist
+
+    Example:
+        POST /pets/bulk-delete {"pet_ids": [4, 8, 15, 16]}
+        -> {"pets": 3, "applications": 5, "favorites": 12, "image_jobs": 0, "not_found": [16]}
+
+    Note:
+        Dependents are removed with one DELETE ... WHERE pet_id IN (subquery)
+        per table instead of loading them through the ORM cascade.
+        Their photos are left to the upload GC.
+    """
+    clauses = selection_filter(selection)
+    selected = select(Pet.pet_id).where(*clauses).scalar_subquery()
+    not_found = await missing_pet_ids(db, selection)
+
+    removed = await deleted_applications(db, Application.pet_id.in_(selected))
+    await remove_applications(db, Application.pet_id.in_(selected))
+    counts = {}
+    for model in (Application, Favorite, ImageJob):
+        result = await db.execute(delete(model).where(model.pet_id.in_(selected)))
+        counts[model.__tablename__] = result.rowcount
+    pet_ids = list(await db.scalars(delete(Pet).where(*clauses).returning(Pet.pet_id)))
+    if pet_ids:
+        await db.execute(bump_version(Pet.__tablename__))
+    await db.commit()
+    if pet_ids:
+        catalog_cache.invalidate(PETS_LIST, *map(pet_namespace, pet_ids))
+    for application in removed:
+        application_events.publish(DELETED, application)
+    return {"pets": len(pet_ids), **counts, "not_found": not_found}
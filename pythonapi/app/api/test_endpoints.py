@@ -11,24 +11,31 @@ WARNING: These endpoints should ONLY be used in development/testing!
 """
 
 from fastapi import APIRouter, Depends, Header, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.db import get_db  # Database session dependency
-from app.schemas.models import Pet, Location, User  # Database models
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import get_async_db  # Database session dependency
+from app.schemas.models import (  # Database models
+    Pet, Location, User, Application, ApplicationCount, ApplicationDailyCount, Favorite, ImageJob,
+)
+from app.services.catalog_version_service import bump_version  # Invalidate ETags
+from app.services.cache_service import catalog_cache  # Cached catalog responses
 
 # Create API router with /_test prefix (hidden from main API docs)
 router = APIRouter(prefix="/_test", tags=["_test"])
 
 
 @router.post("/reset")
-def reset_db(
-        db: Session = Depends(get_db),
+async def reset_db(
+        db: AsyncSession = Depends(get_async_db),
         x_admin_key: str = Header(None)
 ):
     """
     Reset Database
     --------------
     Clear all data from pets and locations tables.
+    Applications, favorites and image jobs for those pets are removed first, since
+    PostgreSQL enforces the foreign keys (SQLite would leave them orphaned),
+    and the application stats counters are emptied with them.
     Used by Cypress tests to ensure clean test state.
 
     Args:
@@ -49,9 +56,17 @@ def reset_db(
     if x_admin_key != "letmein":
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    # Delete all test data
-    db.query(Pet).delete()
-    db.query(Location).delete()
-    db.commit()
+    # Delete all test data (children first to satisfy foreign keys)
+    await db.execute(delete(Favorite))
+    await db.execute(delete(Application))
+    await db.execute(delete(ApplicationCount))
+    await db.execute(delete(ApplicationDailyCount))
+    await db.execute(delete(ImageJob))
+    await db.execute(delete(Pet))
+    await db.execute(delete(Location))
+    await db.execute(bump_version(Pet.__tablename__))
+    await db.execute(bump_version(Location.__tablename__))
+    await db.commit()
+    catalog_cache.clear()
 
     return {"ok": True}
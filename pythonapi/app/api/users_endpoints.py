@@ -13,17 +13,21 @@ Routes:
 """
 
 from fastapi import APIRouter, HTTPException, Request, Depends
-from sqlalchemy.orm import Session
-from app.db import get_db
-from app.schemas.models import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import get_async_db
+from app.schemas.models import Application, User
 from app.schemas.schemas_auth import UserOut, UserUpdate, UserCreate
-from app.api.auth_endpoints import require_auth, get_current_user, hash_password
+from app.api.auth_endpoints import require_auth, get_current_user, invalidate_principal
+from app.services.password_service import hash_password_async
+from app.services.application_stats_service import remove_applications
+from app.services.application_events_service import DELETED, application_events, deleted_applications
 from typing import List
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-def require_admin(request: Request, db: Session = Depends(get_db)) -> User:
+async def require_admin(request: Request, db: AsyncSession = Depends(get_async_db)) -> UserOut:
     """
     Dependency to require admin authentication.
 
@@ -31,18 +35,18 @@ def require_admin(request: Request, db: Session = Depends(get_db)) -> User:
         HTTPException: If user is not authenticated or not an admin
 
     Returns:
-        User: The authenticated admin user
+        UserOut: The authenticated admin user
     """
-    user = get_current_user(request, db)
+    user = await get_current_user(request, db)
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin privileges required")
     return user
 
 
 @router.get("", response_model=List[UserOut])
-def list_users(
-        db: Session = Depends(get_db),
-        _: User = Depends(require_admin)
+async def list_users(
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin)
 ):
     """
     List All Users (Admin Only)
@@ -67,15 +71,15 @@ def list_users(
             ...
         ]
     """
-    users = db.query(User).all()
+    users = list(await db.scalars(select(User)))
     return users
 
 
 @router.get("/{user_id}", response_model=UserOut)
-def get_user(
+async def get_user(
         user_id: int,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        db: AsyncSession = Depends(get_async_db),
+        current_user: UserOut = Depends(get_current_user)
 ):
     """
     Get User Details
@@ -100,7 +104,7 @@ def get_user(
     if current_user.user_id != user_id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Cannot view other users' profiles")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -108,11 +112,11 @@ def get_user(
 
 
 @router.put("/{user_id}", response_model=UserOut)
-def update_user(
+async def update_user(
         user_id: int,
         user_data: UserUpdate,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        db: AsyncSession = Depends(get_async_db),
+        current_user: UserOut = Depends(get_current_user)
 ):
     """
     Update User Information
@@ -145,9 +149,10 @@ def update_user(
         raise HTTPException(status_code=403, detail="Cannot update other users' profiles")
 
     # Find the user to update
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    old_email = user.email
 
     # Update only the fields that were provided
     if user_data.display_name is not None:
@@ -155,29 +160,30 @@ def update_user(
 
     if user_data.email is not None:
         # Check if email is already taken by another user
-        existing_user = db.query(User).filter(
+        existing_user = await db.scalar(select(User).where(
             User.email == user_data.email,
             User.user_id != user_id
-        ).first()
+        ))
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
         user.email = user_data.email
 
     if user_data.password is not None:
         # Hash the new password before storing
-        user.password_hash = hash_password(user_data.password)
+        user.password_hash = await hash_password_async(user_data.password)
 
     # Save changes to database
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    invalidate_principal(old_email)
+    await db.refresh(user)
     return user
 
 
 @router.delete("/{user_id}")
-def delete_user(
+async def delete_user(
         user_id: int,
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        db: AsyncSession = Depends(get_async_db),
+        current_user: UserOut = Depends(get_current_user)
 ):
     """
     Delete User Account
@@ -206,22 +212,27 @@ def delete_user(
         raise HTTPException(status_code=403, detail="Cannot delete other users' accounts")
 
     # Find the user to delete
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Delete the user from the database
-    db.delete(user)
-    db.commit()
+    removed = await deleted_applications(db, Application.user_id == user_id)
+    await remove_applications(db, Application.user_id == user_id)
+    await db.delete(user)  # loads and deletes applications/favorites (ORM cascade)
+    await db.commit()
+    invalidate_principal(user.email)
+    for application in removed:
+        application_events.publish(DELETED, application)
 
     return {"message": "User account deleted successfully", "user_id": user_id}
 
 
 @router.post("", response_model=UserOut)
-def create_user(
+async def create_user(
         user_data: UserCreate,
-        db: Session = Depends(get_db),
-        _: User = Depends(require_admin)
+        db: AsyncSession = Depends(get_async_db),
+        _: UserOut = Depends(require_admin)
 ):
     """
     Create New User (Admin Only)
@@ -244,21 +255,21 @@ def create_user(
         For regular user registration, use the /auth/register endpoint instead.
     """
     # Check if email is already taken
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create new user with hashed password
     new_user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         display_name=user_data.display_name,
         is_admin=user_data.is_admin
     )
 
     # Save to database
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return new_user
\ No newline at end of file
@@ -1,17 +1,114 @@
-import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from app import config
 
-# Need the SQLite file in the same folder as this file (app/ems.db)
-HERE = os.path.dirname(__file__)
-DB_FILE = os.path.join(HERE, "ems.db")
-DB_FILE = DB_FILE.replace("\\", "/")
-DATABASE_URL = f"sqlite:///{DB_FILE}"
 
+def normalize_database_url(url: str) -> URL:
+    """
+    Parse DATABASE_URL, mapping bare PostgreSQL URLs onto the psycopg (v3) driver.
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    Example:
+        normalize_database_url("postgres://u:p@db/pets")
+        # -> postgresql+psycopg://u:p@db/pets
+    """
+    parsed = make_url(url)
+    if parsed.drivername in ("postgres", "postgresql"):
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    return parsed
+
+
+def async_database_url(url: str) -> URL:
+    """
+    Map DATABASE_URL onto the matching asyncio driver (aiosqlite / asyncpg).
+
+    Example:
+        async_database_url("sqlite:///app/ems.db")      # -> sqlite+aiosqlite:///app/ems.db
+        async_database_url("postgresql://u:p@db/pets")  # -> postgresql+asyncpg://u:p@db/pets
+    """
+    parsed = normalize_database_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite")
+    if parsed.get_backend_name() == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg")
+    return parsed
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite tuning settings from config to each new connection."""
+    if not config.SQLITE_TUNED:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size=-{config.SQLITE_CACHE_SIZE_KB}")  # negative = KiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def engine_options(url: URL) -> dict:
+    """
+    Create the engine keyword arguments for a database URL.
+    Shared by the sync and async engines so both get the same pool settings.
+
+    SQLite:
+        File databases get the tuned pragmas above and a QueuePool sized by
+        DB_POOL_SIZE / DB_MAX_OVERFLOW. In-memory databases keep SQLAlchemy's
+        default single-connection pool.
+
+    PostgreSQL:
+        QueuePool sized by DB_POOL_SIZE / DB_MAX_OVERFLOW, with pre-ping so
+        connections dropped by the server or a proxy are replaced transparently,
+        and recycling after DB_POOL_RECYCLE seconds.
+    """
+    pool = {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+    }
+
+    if url.get_backend_name() == "sqlite":
+        connect_args = {
+            "check_same_thread": False,
+            "timeout": config.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        }
+        if url.database in (None, "", ":memory:"):
+            return {"connect_args": connect_args}
+        return {"connect_args": connect_args, **pool}
+
+    return {**pool, "pool_pre_ping": True, "pool_recycle": config.DB_POOL_RECYCLE}
+
+
+def create_db_engine(url: str):
+    """Create the sync engine (startup DDL, seed script, CLI tools)."""
+    url = normalize_database_url(url)
+    engine = create_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+def create_async_db_engine(url: str):
+    """Create the asyncio engine used by the API request handlers."""
+    url = async_database_url(url)
+    engine = create_async_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+engine = create_db_engine(config.DATABASE_URL)
+async_engine = create_async_db_engine(config.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# expire_on_commit=False: attributes can't be lazy-loaded under asyncio, so
+# objects must stay readable after commit (handlers refresh explicitly)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -20,3 +117,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Request-scoped AsyncSession dependency for the API routers."""
+    async with AsyncSessionLocal() as db:
+        yield db
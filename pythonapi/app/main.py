@@ -5,10 +5,11 @@ Entry point for the Pet Gallery backend API.
 Configures CORS, database, routers, and serves static files.
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from app.db import Base, engine
 from app.schemas import models
@@ -19,15 +20,62 @@ from app.api.pets_endpoints import router as pets_router
 from app.api.applications_endpoints import router as applications_router
 from app.api.favorites_endpoints import router as favorites_router
 from app.api.test_endpoints import router as test_router
+from app.api.metrics_endpoints import router as metrics_router
+from app.services.schema_service import upgrade_schema
+from app.services.search_service import ensure_pet_search_index
+from app.services.catalog_version_service import ensure_catalog_versions
+from app.services.application_stats_service import ensure_application_stats
+from app.services.application_stats_service import run_periodically as run_stats_reconcile
+from app.services.files_service import UploadLimitMiddleware
+from app.services.static_service import UploadRedirects, UploadStaticFiles
+from app.services.storage_service import LocalStorage, get_storage
+from app.services.image_job_service import image_worker
+from app.services.upload_gc_service import run_periodically as run_upload_gc
 from app import config
 import uvicorn
-from pathlib import Path
 
 # Create all database tables
 Base.metadata.create_all(bind=engine)
 
+# create_all() skips tables that already exist, so add any indexes
+# declared since the database file was first created
+upgrade_schema(engine)
+
+# Full-text search table for GET /pets/search
+ensure_pet_search_index(engine)
+
+# Change counters behind the catalog ETags
+ensure_catalog_versions(engine)
+
+# Counters behind GET /applications/stats (built once for existing applications)
+ensure_application_stats(engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background image worker (and optional upload GC / stats reconcile) for as long as the API is up."""
+    if config.IMAGE_WORKER_ENABLED:
+        image_worker.start()
+    upload_gc = None
+    if config.UPLOAD_GC_INTERVAL_MINUTES > 0:
+        upload_gc = asyncio.create_task(
+            run_upload_gc(engine, get_storage(), config.UPLOAD_GC_INTERVAL_MINUTES)
+        )
+    stats_reconcile = None
+    if config.APPLICATION_STATS_RECONCILE_MINUTES > 0:
+        stats_reconcile = asyncio.create_task(
+            run_stats_reconcile(engine, config.APPLICATION_STATS_RECONCILE_MINUTES)
+        )
+    yield
+    if upload_gc:
+        upload_gc.cancel()
+    if stats_reconcile:
+        stats_reconcile.cancel()
+    await image_worker.stop()
+
+
 # Initialize FastAPI application
-app = FastAPI(title="Pet Gallery API")
+app = FastAPI(title="Pet Gallery API", lifespan=lifespan)
 
 # Add SessionMiddleware for OAuth support (must be added before other middleware)
 app.add_middleware(
@@ -39,6 +87,14 @@ app.add_middleware(
     https_only=False
 )
 
+# Reject photo uploads over MAX_UPLOAD_MB before their body is read
+# (added before CORS so the 413 still carries CORS headers)
+app.add_middleware(
+    UploadLimitMiddleware,
+    max_bytes=config.MAX_UPLOAD_MB * 1024 * 1024,
+    import_max_bytes=config.IMPORT_MAX_MB * 1024 * 1024,
+)
+
 # Configure CORS (Cross-Origin Resource Sharing)
 origins = [os.getenv("CORS_ORIGINS", "http://localhost:5173")]
 if isinstance(origins, str) and "," in origins:
@@ -50,6 +106,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Register API routers
@@ -60,14 +117,18 @@ app.include_router(pets_router)
 app.include_router(applications_router)
 app.include_router(favorites_router)
 app.include_router(test_router)
+app.include_router(metrics_router)
 
-# Configure static file serving for uploaded images
-BASE_DIR = Path(__file__).resolve().parent
-UPLOAD_DIR = BASE_DIR / "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Configure serving of uploaded images (STORAGE_BACKEND)
+storage = get_storage()
 
-# Serve files at http://localhost:8000/uploads/<file>
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
+if isinstance(storage, LocalStorage):
+    # Serve files at http://localhost:8000/uploads/<file>
+    # (immutable caching, strong ETags, ranges and format negotiation)
+    app.mount("/uploads", UploadStaticFiles(directory=storage.root), name="uploads")
+else:
+    # Redirect /uploads/<file> to the object store, so photo_url values stay valid
+    app.mount("/uploads", UploadRedirects(storage), name="uploads")
 
 # Run the application
 if __name__ == "__main__":
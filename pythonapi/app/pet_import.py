@@ -0,0 +1,70 @@
+"""
+Bulk Pet Import
+---------------
+Imports pets from an NDJSON or CSV file straight into the database, e.g. when
+onboarding a new shelter (same rules as POST /pets/bulk).
+
+Usage:
+    python -m app.pet_import pets.csv --dry-run          # validate only
+    python -m app.pet_import pets.ndjson
+    python -m app.pet_import pets.csv --photos photos.zip --batch-size 1000
+
+Rows carry name, species, age, description, location_id and optionally a
+"photo" file name inside the --photos archive. Photo variants are generated
+by the image worker of a running API. Like seed.py, this expects the database
+tables to exist (start the backend once first).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import zipfile
+from app import config
+from app.db import AsyncSessionLocal, async_engine
+from app.services.pet_import_service import IMPORT_FORMATS, import_pets
+from app.services.storage_service import get_storage
+
+
+async def run(path: str, fmt: str, photos: str | None, batch_size: int, dry_run: bool) -> dict:
+    archive = zipfile.ZipFile(photos) if photos else None
+    try:
+        with open(path, "rb") as stream:
+            async with AsyncSessionLocal() as db:
+                return await import_pets(
+                    db, stream, fmt, archive=archive, storage=get_storage(),
+                    batch_size=batch_size, dry_run=dry_run,
+                )
+    finally:
+        if archive:
+            archive.close()
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import pets from an NDJSON or CSV file")
+    parser.add_argument("file", help="pets as .ndjson/.jsonl or .csv")
+    parser.add_argument("--photos", help="ZIP archive with the photos named in the rows")
+    parser.add_argument("--batch-size", type=int, default=config.IMPORT_BATCH_SIZE,
+                        help="rows per INSERT and transaction")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    args = parser.parse_args()
+
+    fmt = IMPORT_FORMATS.get(os.path.splitext(args.file)[1].lower())
+    if fmt is None:
+        parser.error("file must end in .ndjson, .jsonl or .csv")
+
+    report = asyncio.run(run(args.file, fmt, args.photos, args.batch_size, args.dry_run))
+
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {error['error']}")
+    if args.dry_run:
+        print(f"\n{report['rows'] - report['failed']} of {report['rows']} rows are valid")
+    else:
+        print(f"\nImported {report['inserted']} of {report['rows']} pets ({report['photos']} photos queued)")
+    if report["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Application Stats Reconcile
+---------------------------
+Rebuilds the counters behind GET /applications/stats from the applications
+table, e.g. after editing applications directly in the database or restoring
+a backup.
+
+Usage:
+    python -m app.reconcile_stats
+
+The API keeps the counters up to date on its own; set
+APPLICATION_STATS_RECONCILE_MINUTES to also rebuild them periodically.
+Like seed.py, this expects the database tables to exist (start the backend
+once first).
+"""
+
+import argparse
+from app.db import engine
+from app.services.application_stats_service import reconcile
+
+
+def main():
+    argparse.ArgumentParser(description="Rebuild the application stats counters").parse_args()
+    report = reconcile(engine)
+    print(f"Counted {report['applications']} applications "
+          f"for {report['pets']} pets over {report['days']} days")
+
+
+if __name__ == "__main__":
+    main()
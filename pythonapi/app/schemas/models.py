@@ -5,7 +5,7 @@ Defines the database structure using SQLAlchemy ORM.
 This file contains all table definitions for the pet adoption system.
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Date, DateTime, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
@@ -85,6 +85,8 @@ class Pet(Base):
         - age: Pet's age in years
         - description: Detailed information about the pet
         - photo_url: URL/path to pet's photo
+        - photo_variants: Resized copies of the photo ({"thumb": url, "card": url, "full": url})
+        - photo_status: Variant processing state ("processing" | "ready" | "failed", None without photo)
         - location_id: Foreign key to Location
         - status: Approval status ("pending" or "approved")
 
@@ -92,8 +94,23 @@ class Pet(Base):
         - location: Many-to-one relationship with Location model
         - applications: One-to-many relationship with Application model
         - favorites: One-to-many relationship with Favorite model
+        - image_jobs: One-to-many relationship with ImageJob model
+
+    Indexes:
+        The species, status and location_id filters are paired with pet_id
+        so GET /pets can seek straight to the cursor position and walk the
+        index newest-first. ix_pets_age_pet_id only narrows age ranges: their
+        pages are still ordered by pet_id, so the range is walked, not seeked.
+        ix_pets_location_id_pet_id also serves plain location_id lookups
+        (e.g. the pet count checked before deleting a location).
     """
     __tablename__ = "pets"
+    __table_args__ = (
+        Index("ix_pets_status_pet_id", "status", "pet_id"),
+        Index("ix_pets_species_pet_id", "species", "pet_id"),
+        Index("ix_pets_location_id_pet_id", "location_id", "pet_id"),
+        Index("ix_pets_age_pet_id", "age", "pet_id"),
+    )
 
     pet_id = Column(Integer, primary_key=True, index=True)
     name = Column(String(120), nullable=False)
@@ -101,6 +118,8 @@ class Pet(Base):
     age = Column(Integer, nullable=False)
     description = Column(Text, nullable=True)
     photo_url = Column(String(255), nullable=True)
+    photo_variants = Column(JSON, nullable=True)
+    photo_status = Column(String(20), nullable=True)  # "processing" | "ready" | "failed"
     location_id = Column(Integer, ForeignKey("locations.location_id"), nullable=False)
     status = Column(String(20), nullable=False, default="pending")  # "pending" | "approved"
 
@@ -108,6 +127,7 @@ class Pet(Base):
     location = relationship("Location", back_populates="pets")
     applications = relationship("Application", back_populates="pet", cascade="all, delete-orphan")
     favorites = relationship("Favorite", back_populates="pet", cascade="all, delete-orphan")
+    image_jobs = relationship("ImageJob", back_populates="pet", cascade="all, delete-orphan")
 
 
 class Application(Base):
@@ -133,8 +153,22 @@ class Application(Base):
     Relationships:
         - user: Many-to-one relationship with User model
         - pet: Many-to-one relationship with Pet model
+
+    Indexes:
+        - (user_id, pet_id, status): a user's applications and the
+          pending-duplicate check in create_application
+        - (status, application_date): admin list filtered by status, either order
+        - (application_date, application_id): the unfiltered admin list and
+          date ranges, walked by GET /applications' keyset cursor
+        - pet_id: cascade deletes and lookups by pet
     """
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_user_id_pet_id_status", "user_id", "pet_id", "status"),
+        Index("ix_applications_status_application_date", "status", "application_date"),
+        Index("ix_applications_pet_id", "pet_id"),
+        Index("ix_applications_application_date_application_id", "application_date", "application_id"),
+    )
 
     application_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
@@ -169,8 +203,17 @@ class Favorite(Base):
     Relationships:
         - user: Many-to-one relationship with User model
         - pet: Many-to-one relationship with Pet model
+
+    Indexes:
+        - (user_id, pet_id) unique: a pet can be favorited once per user;
+          also serves every per-user favorites lookup
+        - pet_id: cascade deletes when a pet is removed
     """
     __tablename__ = "favorites"
+    __table_args__ = (
+        Index("ux_favorites_user_id_pet_id", "user_id", "pet_id", unique=True),
+        Index("ix_favorites_pet_id", "pet_id"),
+    )
 
     favorite_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
@@ -179,4 +222,104 @@ class Favorite(Base):
 
     # Relationships
     user = relationship("User", back_populates="favorites")
-    pet = relationship("Pet", back_populates="favorites")
\ No newline at end of file
+    pet = relationship("Pet", back_populates="favorites")
+
+
+class CatalogVersion(Base):
+    """
+    Catalog Version Model
+    ---------------------
+    Change counter for a cacheable table (pets, locations).
+    Write endpoints increment the counter in the same transaction as their change,
+    and read endpoints derive their ETag from it.
+
+    Columns:
+        - table_name: Name of the tracked table (primary key)
+        - version: Incremented on every write to that table
+    """
+    __tablename__ = "catalog_versions"
+
+    table_name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class ApplicationCount(Base):
+    """
+    Application Count Model
+    -----------------------
+    Number of applications per pet and status, kept up to date by the
+    application write endpoints (see application_stats_service).
+    The row with pet_id 0 holds the totals across all pets.
+
+    Columns:
+        - pet_id: Pet the applications are for, or 0 for all pets (primary key)
+        - status: Application status (primary key)
+        - count: Applications of that pet currently in that status
+    """
+    __tablename__ = "application_counts"
+
+    pet_id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(20), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ApplicationDailyCount(Base):
+    """
+    Application Daily Count Model
+    -----------------------------
+    Applications submitted and decided per day (UTC), kept up to date by the
+    application write endpoints (see application_stats_service).
+
+    Columns:
+        - day: Calendar day (primary key)
+        - event: "submitted", "approved" or "rejected" (primary key)
+        - count: Current applications submitted (by application_date) or
+          decided (by reviewed_at) on that day
+    """
+    __tablename__ = "application_daily_counts"
+
+    day = Column(Date, primary_key=True)
+    event = Column(String(20), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ImageJob(Base):
+    """
+    Image Job Model
+    ---------------
+    Queued image processing for an uploaded pet photo (variant generation).
+    Rows are written in the same transaction as the upload, so queued work
+    survives restarts; the worker in image_job_service picks them up.
+
+    Columns:
+        - job_id: Primary key
+        - pet_id: Foreign key to Pet
+        - photo_url: Upload to process (the pet's photo_url when queued)
+        - status: "queued" | "running" | "failed" (finished jobs are deleted)
+        - attempts: Number of times a worker has started the job
+        - last_error: Error from the most recent failed attempt
+        - run_after: Earliest time the job may run (retry backoff)
+        - locked_at: When a worker claimed the job; stale claims are retried
+        - created_at: When the job was queued
+
+    Relationships:
+        - pet: Many-to-one relationship with Pet model
+    """
+    __tablename__ = "image_jobs"
+    __table_args__ = (
+        Index("ix_image_jobs_status_run_after", "status", "run_after"),
+        Index("ix_image_jobs_pet_id", "pet_id"),
+    )
+
+    job_id = Column(Integer, primary_key=True)
+    pet_id = Column(Integer, ForeignKey("pets.pet_id"), nullable=False)
+    photo_url = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    pet = relationship("Pet", back_populates="image_jobs")
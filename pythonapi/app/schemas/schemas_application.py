@@ -25,6 +25,16 @@ class ApplicationUpdate(BaseModel):
     admin_notes: Optional[str] = Field(None, max_length=2000)
 
 
+class ApplicationBulkReview(BaseModel):
+    """Schema for admin reviewing many applications at once (POST /applications/bulk-review)"""
+    application_ids: list[int] = Field(..., min_length=1, max_length=5000)
+    status: str = Field(..., pattern="^(pending|approved|rejected)$")
+    admin_notes: Optional[str] = Field(None, max_length=2000)
+    # When approving: also reject the other pending applications for the same pets
+    reject_other_pending: bool = False
+    rejection_notes: Optional[str] = Field(None, max_length=2000)
+
+
 class ApplicationOut(BaseModel):
     """Schema for application output"""
     application_id: int
@@ -43,6 +53,27 @@ class ApplicationOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ApplicationSummary(BaseModel):
+    """Schema for application list rows without the long text fields (GET /applications?view=summary)"""
+    application_id: int
+    user_id: int
+    pet_id: int
+    contact_phone: str
+    living_situation: str
+    has_other_pets: bool
+    status: str
+    application_date: datetime
+    reviewed_at: Optional[datetime]
+    # User details
+    user_email: str
+    user_name: str
+    # Pet details
+    pet_name: str
+    pet_species: str
+    pet_age: int
+    pet_photo_url: Optional[str]
+
+
 class ApplicationWithDetails(BaseModel):
     """Schema for application with user and pet details"""
     application_id: int
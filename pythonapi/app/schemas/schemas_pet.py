@@ -2,7 +2,7 @@
 # Pydantic schemas for pet validation
 
 from pydantic import BaseModel, Field, constr, conint, ConfigDict
-from typing import Optional
+from typing import Dict, Optional
 
 # Base schema with shared pet fields
 class PetBase(BaseModel):
@@ -19,5 +19,49 @@ class PetCreate(PetBase): pass
 class PetOut(PetBase):
     pet_id: int
     photo_url: Optional[str] = None
+    photo_variants: Optional[Dict[str, str]] = None  # e.g. {"thumb": ..., "card": ..., "full": ...}
+    photo_status: Optional[str] = None  # "processing" until photo_variants are ready
     status: str
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# Schema for requesting a direct-to-storage photo upload
+class PhotoUploadRequest(BaseModel):
+    filename: constr(min_length=1, max_length=255)
+    size: conint(gt=0)
+    sha256: constr(pattern=r"^[0-9a-fA-F]{64}$")  # hex SHA-256 of the file
+
+# Presigned request the client sends the photo with
+class PresignedUpload(BaseModel):
+    method: str
+    url: str
+    headers: Dict[str, str]
+    expires_in: int
+
+# Schema for POST /pets/photo-uploads responses
+class PhotoUploadTicket(BaseModel):
+    photo_url: str  # send as photo_url to POST/PUT /pets once uploaded
+    upload: Optional[PresignedUpload] = None  # None if the same photo is already stored
+
+# One rejected row of a bulk import
+class PetImportError(BaseModel):
+    line: int
+    error: str
+
+# Schema for POST /pets/bulk responses
+class PetImportReport(BaseModel):
+    rows: int
+    inserted: int
+    failed: int
+    photos: int  # photos stored and queued for variant generation
+    errors: list[PetImportError]
+
+# Schema for GET /pets/count responses
+class PetCount(BaseModel):
+    count: int
+
+# Pets targeted by a bulk approve/delete: explicit ids and/or a filter (combined with AND)
+class PetSelection(BaseModel):
+    pet_ids: Optional[list[int]] = Field(default=None, min_length=1, max_length=10000)
+    status: Optional[str] = None  # "pending" | "approved"
+    location_id: Optional[int] = None
+    species: Optional[str] = None
@@ -16,9 +16,15 @@ Purpose:
     - Useful for development and testing
 """
 
-from app.db import SessionLocal
+import os
+from app import config
+from app.db import SessionLocal, engine
 from app.schemas import models as m
-from app.api.auth_endpoints import hash_password
+from app.services.password_service import hash_password
+from app.services.catalog_version_service import bump_version
+from app.services.application_stats_service import reconcile
+from app.services.image_service import create_variants
+from app.services.storage_service import get_storage
 
 
 def seed_database():
@@ -100,6 +106,7 @@ def seed_database():
         for location in locations:
             db.add(location)
 
+        db.execute(bump_version(m.Location.__tablename__))
         db.commit()
 
         for location in locations:
@@ -185,9 +192,20 @@ def seed_database():
             ),
         ]
 
+        # Resized variants for the sample photos that exist in the uploads folder
+        # (copied into the storage backend first when it isn't that folder)
+        storage = get_storage()
+        for pet in pets:
+            sample = os.path.join(config.UPLOAD_DIR, os.path.basename(pet.photo_url))
+            if os.path.exists(sample):
+                storage.store_file(os.path.basename(pet.photo_url), sample)
+                pet.photo_variants = create_variants(pet.photo_url, storage)
+                pet.photo_status = "ready"
+
         for pet in pets:
             db.add(pet)
 
+        db.execute(bump_version(m.Pet.__tablename__))
         db.commit()
 
         for pet in pets:
@@ -234,6 +252,7 @@ def seed_database():
             db.add(app)
 
         db.commit()
+        reconcile(engine)  # count them for GET /applications/stats
 
         print(f"Added {len(applications)} sample applications\n")
 
@@ -0,0 +1,218 @@
+"""
+Application Events Service
+--------------------------
+In-process publish/subscribe for application changes, behind
+GET /applications/events (Server-Sent Events).
+
+create_application, update_application and delete_application publish an
+event once their change is committed, and so do the pet and user deletes
+that remove applications with them (see deleted_applications). Every open
+stream receives the events its user may see: admins get all of them,
+applicants only those about their own applications.
+
+Features:
+    - Event ids are "<process epoch>-<sequence>". The last
+      APPLICATION_EVENTS_BUFFER events are kept, so a client reconnecting
+      with Last-Event-ID receives exactly what it missed
+    - An id the buffer no longer covers (too old, or from before a restart)
+      gets a "reset" event instead: reload the lists once, then carry on
+    - A subscriber that falls APPLICATION_EVENTS_QUEUE_SIZE events behind is
+      disconnected rather than buffering without limit; its EventSource
+      reconnects and resumes from the buffer
+    - Publishing never awaits, so a slow client can't hold up a request
+
+Events only reach streams served by the API worker that published them.
+With several workers, a shared broker (Redis pub/sub, PostgreSQL
+LISTEN/NOTIFY) would take the place of EventBroker.
+
+Usage:
+    application_events.publish("application.updated", application, previous_status="pending")
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import AsyncIterator
+from pydantic_core import to_json
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import config
+from app.schemas.models import Application
+
+# Event types sent on the stream
+CREATED = "application.created"
+UPDATED = "application.updated"
+DELETED = "application.deleted"
+RESET = "reset"
+
+
+async def deleted_applications(db: AsyncSession, condition) -> list:
+    """
+    Snapshot the applications a bulk or cascaded delete is about to remove, so
+    a DELETED event can be published for each once the delete is committed:
+
+        removed = await deleted_applications(db, Application.pet_id == pet_id)
+        await db.delete(pet)
+        await db.commit()
+        for application in removed:
+            application_events.publish(DELETED, application)
+
+    Returns:
+        list: Rows with the columns publish() reads
+    """
+    result = await db.execute(
+        select(
+            Application.application_id, Application.user_id, Application.pet_id,
+            Application.status, Application.reviewed_at,
+        ).where(condition)
+    )
+    return result.all()
+
+
+class Subscription:
+    """One open event stream: the events visible to its user, queued for delivery."""
+
+    def __init__(self, user_id: int, is_admin: bool, queue_size: int):
+        self.user_id = user_id
+        self.is_admin = is_admin
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def visible(self, event: tuple) -> bool:
+        return self.is_admin or event[2] == self.user_id
+
+    def offer(self, event: tuple) -> bool:
+        """Queue an event if the user may see it. Returns False once the queue overflowed."""
+        if not self.visible(event):
+            return True
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.closed = True
+            return False
+
+
+class EventBroker:
+    """
+    Fan-out of application events to the open streams of this process.
+    Events are (sequence, type, user_id, data) tuples.
+    """
+
+    def __init__(self, buffer_size: int, queue_size: int):
+        self.epoch = os.urandom(4).hex()
+        self.sequence = 0
+        self.queue_size = queue_size
+        self.buffer: deque[tuple] = deque(maxlen=buffer_size)
+        self.subscribers: set[Subscription] = set()
+        self.published = 0
+        self.dropped = 0
+
+    def event_id(self, sequence: int) -> str:
+        return f"{self.epoch}-{sequence}"
+
+    def publish(self, event_type: str, application: Application, previous_status: str | None = None) -> None:
+        """
+        Send an event about an application to every subscriber allowed to see it.
+        Call after db.commit(), so clients reacting to it read the committed state.
+        """
+        data = {
+            "application_id": application.application_id,
+            "user_id": application.user_id,
+            "pet_id": application.pet_id,
+            "status": application.status,
+            "previous_status": previous_status,
+            "reviewed_at": application.reviewed_at,
+        }
+        self.sequence += 1
+        event = (self.sequence, event_type, application.user_id, data)
+        self.buffer.append(event)
+        self.published += 1
+        for subscription in list(self.subscribers):
+            if not subscription.offer(event):
+                self.subscribers.discard(subscription)
+                self.dropped += 1
+
+    def subscribe(self, user_id: int, is_admin: bool, last_event_id: str | None) -> tuple[Subscription, bool]:
+        """
+        Open a subscription, pre-filled with the buffered events after last_event_id.
+
+        Returns:
+            (subscription, reset): reset is True when last_event_id can't be
+            resumed from and the client should reload instead
+        """
+        subscription = Subscription(user_id, is_admin, self.queue_size)
+        reset = False
+        if last_event_id:
+            epoch, _, sequence = last_event_id.partition("-")
+            oldest = self.buffer[0][0] if self.buffer else self.sequence + 1
+            if epoch != self.epoch or not sequence.isdigit() or not oldest - 1 <= int(sequence) <= self.sequence:
+                reset = True
+            else:
+                for event in self.buffer:
+                    if event[0] > int(sequence) and not subscription.offer(event):
+                        reset = True  # missed more than one queue holds
+                        subscription = Subscription(user_id, is_admin, self.queue_size)
+                        break
+        self.subscribers.add(subscription)
+        return subscription, reset
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscribers.discard(subscription)
+
+    def format(self, event: tuple) -> str:
+        """Encode an event in the text/event-stream format."""
+        sequence, event_type, _, data = event
+        return f"id: {self.event_id(sequence)}\nevent: {event_type}\ndata: {to_json(data).decode()}\n\n"
+
+    async def stream(self, user_id: int, is_admin: bool, last_event_id: str | None) -> AsyncIterator[str]:
+        """
+        Server-Sent Events for one client, with a comment line every
+        APPLICATION_EVENTS_HEARTBEAT_SECONDS to keep proxies from closing the
+        connection. Ends after APPLICATION_EVENTS_MAX_SECONDS (the browser
+        reconnects with Last-Event-ID, and the login is checked again) or
+        when the subscriber fell behind.
+
+        The subscription is opened when the response starts, so it is always
+        closed again by the finally block.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.APPLICATION_EVENTS_MAX_SECONDS
+        subscription, reset = self.subscribe(user_id, is_admin, last_event_id)
+        try:
+            yield f"retry: {config.APPLICATION_EVENTS_RETRY_MS}\n\n"
+            if reset:
+                yield f"id: {self.event_id(self.sequence)}\nevent: {RESET}\ndata: {{}}\n\n"
+            while True:
+                if subscription.closed and subscription.queue.empty():
+                    return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        min(config.APPLICATION_EVENTS_HEARTBEAT_SECONDS, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.format(event)
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        """Counters for the /metrics/application-events endpoint."""
+        return {
+            "subscribers": len(self.subscribers),
+            "published": self.published,
+            "buffered": len(self.buffer),
+            "dropped_subscribers": self.dropped,
+        }
+
+
+# Shared broker for this API process
+application_events = EventBroker(
+    buffer_size=config.APPLICATION_EVENTS_BUFFER,
+    queue_size=config.APPLICATION_EVENTS_QUEUE_SIZE,
+)
@@ -0,0 +1,353 @@
+"""
+Application Stats Service
+-------------------------
+Counters behind GET /applications/stats, so the admin dashboard reads a few
+rows instead of counting the whole applications table on every refresh.
+
+Two tables are maintained:
+
+    - application_counts: applications per (pet, status), with the totals
+      across all pets under pet_id 0. Per-location numbers are summed from
+      the per-pet rows, so moving a pet to another location needs no update
+    - application_daily_counts: applications submitted (by application_date)
+      and approved/rejected (by reviewed_at) per day
+
+Every write to the applications table adjusts the counters in its own
+transaction: record_change() for single applications, remove_applications()
+for set-based and cascading deletes. reconcile() rebuilds both tables from
+scratch; it runs at startup when the counters are empty (a database created
+before they existed, or filled by seed.py), from python -m app.reconcile_stats,
+and every APPLICATION_STATS_RECONCILE_MINUTES if set.
+
+The counters describe the applications that exist right now: a deleted
+application also leaves its submission and decision days, so a rebuild
+always yields the same numbers as the incremental updates.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import date
+from sqlalchemy import Date, Integer, String, delete, func, insert, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.models import Application, ApplicationCount, ApplicationDailyCount, Location, Pet
+
+logger = logging.getLogger(__name__)
+
+STATUSES = ("pending", "approved", "rejected")
+DECISIONS = ("approved", "rejected")
+
+# pet_id of the totals row in application_counts
+ALL_PETS = 0
+
+
+def stats_state(application: Application) -> tuple[int, str, date, date | None]:
+    """
+    What one application contributes to the counters:
+    (pet_id, status, submission day, decision day or None). Works on an
+    Application or any row with those columns.
+
+    Take the state before changing an application and pass it to
+    record_change() together with the state afterwards.
+    """
+    decided = None
+    if application.status in DECISIONS and application.reviewed_at is not None:
+        decided = application.reviewed_at.date()
+    return application.pet_id, application.status, application.application_date.date(), decided
+
+
+async def _apply(db: AsyncSession, counts: Counter, daily: Counter) -> None:
+    """
+    Add the non-zero deltas to their counter rows (INSERT ... ON CONFLICT DO UPDATE).
+    Rows are written in key order, so concurrent transactions lock them in the
+    same order and can't deadlock each other.
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    tables = (
+        (ApplicationCount, ("pet_id", "status"), counts),
+        (ApplicationDailyCount, ("day", "event"), daily),
+    )
+    for model, keys, deltas in tables:
+        rows = [
+            {keys[0]: first, keys[1]: second, "count": delta}
+            for (first, second), delta in sorted(deltas.items()) if delta
+        ]
+        if not rows:
+            continue
+        stmt = dialect.insert(model).values(rows)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={"count": model.count + stmt.excluded.count},
+        ))
+
+
+async def record_change(db: AsyncSession, before: tuple | None, after: tuple | None) -> None:
+    """
+    Update the counters for one created, changed or deleted application.
+    Call it before db.commit(), so the counters change in the same transaction:
+
+        before = stats_state(application)
+        application.status = "approved"
+        await record_change(db, before, stats_state(application))
+
+    Args:
+        db: Async database session
+        before: stats_state() before the change (None for a new application)
+        after: stats_state() after the change (None for a deleted application)
+    """
+    await record_changes(db, [(before, after)])
+
+
+async def record_changes(db: AsyncSession, changes: list[tuple[tuple | None, tuple | None]]) -> None:
+    """
+    Update the counters for many applications at once, e.g. a bulk review:
+    the deltas are summed first, so each counter row is written only once.
+
+    Args:
+        db: Async database session
+        changes: (before, after) stats_state() pairs, as for record_change()
+    """
+    counts, daily = Counter(), Counter()
+    for before, after in changes:
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            pet_id, status, submitted, decided = state
+            counts[(ALL_PETS, status)] += sign
+            counts[(pet_id, status)] += sign
+            daily[(submitted, "submitted")] += sign
+            if decided is not None:
+                daily[(decided, status)] += sign
+    await _apply(db, counts, daily)
+
+
+async def remove_applications(db: AsyncSession, condition) -> None:
+    """
+    Subtract every application matching condition from the counters.
+    Call it right before deleting them in bulk or through an ORM cascade:
+
+        await remove_applications(db, Application.pet_id == pet_id)
+        await db.delete(pet)
+
+    Only the applications being deleted are counted (three grouped queries
+    over an indexed column), never the whole table.
+    """
+    counts, daily = Counter(), Counter()
+    for pet_id, status, n in await db.execute(
+        select(Application.pet_id, Application.status, func.count())
+        .where(condition)
+        .group_by(Application.pet_id, Application.status)
+    ):
+        counts[(ALL_PETS, status)] -= n
+        counts[(pet_id, status)] -= n
+
+    submitted = func.date(Application.application_date, type_=Date)
+    for day, n in await db.execute(
+        select(submitted, func.count()).where(condition).group_by(submitted)
+    ):
+        daily[(day, "submitted")] -= n
+
+    decided = func.date(Application.reviewed_at, type_=Date)
+    for day, status, n in await db.execute(
+        select(decided, Application.status, func.count())
+        .where(condition, Application.status.in_(DECISIONS), Application.reviewed_at.is_not(None))
+        .group_by(decided, Application.status)
+    ):
+        daily[(day, status)] -= n
+
+    await _apply(db, counts, daily)
+    # Pets whose applications are all gone don't need rows of zeros
+    await db.execute(delete(ApplicationCount).where(
+        ApplicationCount.pet_id != ALL_PETS, ApplicationCount.count == 0
+    ))
+
+
+def reconcile(engine: Engine) -> dict:
+    """
+    Reconcile Application Stats
+    ---------------------------
+    Rebuild both counter tables from the applications table in one transaction.
+
+    Args:
+        engine: SQLAlchemy engine for the application database
+
+    Returns:
+        dict: {"applications": 5000, "pets": 120, "days": 365} counted
+
+    Note:
+        On PostgreSQL the counter tables are locked for the rebuild, so
+        applications written meanwhile wait and are counted exactly once.
+        SQLite allows a single writer anyway.
+    """
+    count = func.count()
+    submitted = func.date(Application.application_date, type_=Date)
+    decided = func.date(Application.reviewed_at, type_=Date)
+
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(
+                "LOCK TABLE application_counts, application_daily_counts IN EXCLUSIVE MODE"
+            ))
+        conn.execute(delete(ApplicationCount))
+        conn.execute(delete(ApplicationDailyCount))
+
+        columns = ["pet_id", "status", "count"]
+        conn.execute(insert(ApplicationCount).from_select(columns, select(
+            literal(ALL_PETS, Integer), Application.status, count
+        ).group_by(Application.status)))
+        conn.execute(insert(ApplicationCount).from_select(columns, select(
+            Application.pet_id, Application.status, count
+        ).group_by(Application.pet_id, Application.status)))
+
+        columns = ["day", "event", "count"]
+        conn.execute(insert(ApplicationDailyCount).from_select(columns, select(
+            submitted, literal("submitted", String), count
+        ).group_by(submitted)))
+        conn.execute(insert(ApplicationDailyCount).from_select(columns, select(
+            decided, Application.status, count
+        ).where(
+            Application.status.in_(DECISIONS), Application.reviewed_at.is_not(None)
+        ).group_by(decided, Application.status)))
+
+        return {
+            "applications": conn.scalar(
+                select(func.coalesce(func.sum(ApplicationCount.count), 0))
+                .where(ApplicationCount.pet_id == ALL_PETS)
+            ),
+            "pets": conn.scalar(
+                select(func.count(func.distinct(ApplicationCount.pet_id)))
+                .where(ApplicationCount.pet_id != ALL_PETS)
+            ),
+            "days": conn.scalar(select(func.count(func.distinct(ApplicationDailyCount.day)))),
+        }
+
+
+def ensure_application_stats(engine: Engine) -> None:
+    """Build the counters if applications exist but haven't been counted yet (run once at startup)."""
+    with engine.connect() as conn:
+        counted = conn.scalar(select(ApplicationCount.pet_id).limit(1)) is not None
+        has_applications = conn.scalar(select(Application.application_id).limit(1)) is not None
+    if has_applications and not counted:
+        report = reconcile(engine)
+        logger.info("Counted %s existing applications for the stats", report["applications"])
+
+
+async def run_periodically(engine: Engine, interval_minutes: float) -> None:
+    """Rebuild the counters every interval_minutes (started from the API lifespan)."""
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            await asyncio.to_thread(reconcile, engine)
+        except Exception:
+            logger.exception("Application stats reconcile failed")
+
+
+def _pivot(rows) -> dict:
+    """{key: {"pending": n, "approved": n, "rejected": n, "total": n}} from (key, status, count) rows."""
+    result = {}
+    for key, status, n in rows:
+        entry = result.setdefault(key, {status: 0 for status in STATUSES} | {"total": 0})
+        entry[status] = entry.get(status, 0) + n
+        entry["total"] += n
+    return result
+
+
+async def status_totals(db: AsyncSession) -> dict:
+    """
+    Applications per status across all pets.
+
+    Returns:
+        dict: {"pending": 3, "approved": 10, "rejected": 2, "total": 15}
+    """
+    rows = await db.execute(
+        select(ApplicationCount.pet_id, ApplicationCount.status, ApplicationCount.count)
+        .where(ApplicationCount.pet_id == ALL_PETS)
+    )
+    return _pivot(rows).get(ALL_PETS, {status: 0 for status in STATUSES} | {"total": 0})
+
+
+async def user_totals(db: AsyncSession, user_id: int) -> dict:
+    """
+    Applications per status for one applicant. Counted directly rather than
+    from the counters: a user has a handful of applications, found through
+    the (user_id, pet_id, status) index.
+
+    Returns:
+        dict: {"pending": 1, "approved": 0, "rejected": 1, "total": 2}
+    """
+    rows = await db.execute(
+        select(Application.status, func.count())
+        .where(Application.user_id == user_id)
+        .group_by(Application.status)
+    )
+    totals = _pivot((user_id, status, n) for status, n in rows)
+    return totals.get(user_id, {status: 0 for status in STATUSES} | {"total": 0})
+
+
+async def pet_breakdown(db: AsyncSession, limit: int) -> list[dict]:
+    """
+    Applications per status for the pets with the most applications.
+
+    Returns:
+        list: [{"pet_id": 4, "pet_name": "Max", "pending": 2, ..., "total": 5}, ...]
+    """
+    busiest = (
+        select(ApplicationCount.pet_id)
+        .where(ApplicationCount.pet_id != ALL_PETS)
+        .group_by(ApplicationCount.pet_id)
+        .order_by(func.sum(ApplicationCount.count).desc(), ApplicationCount.pet_id)
+        .limit(limit)
+        .subquery()
+    )
+    rows = (await db.execute(
+        select(ApplicationCount.pet_id, Pet.name, ApplicationCount.status, ApplicationCount.count)
+        .join(busiest, busiest.c.pet_id == ApplicationCount.pet_id)
+        .join(Pet, Pet.pet_id == ApplicationCount.pet_id)
+    )).all()
+    names = {pet_id: name for pet_id, name, _, _ in rows}
+    pivot = _pivot((pet_id, status, n) for pet_id, _, status, n in rows)
+    result = [{"pet_id": pet_id, "pet_name": names[pet_id], **counts} for pet_id, counts in pivot.items()]
+    result.sort(key=lambda entry: (-entry["total"], entry["pet_id"]))
+    return result
+
+
+async def location_breakdown(db: AsyncSession) -> list[dict]:
+    """
+    Applications per status for each location, summed from the per-pet counters.
+
+    Returns:
+        list: [{"location_id": 1, "location_name": "Downtown", "pending": 2, ..., "total": 9}, ...]
+    """
+    rows = (await db.execute(
+        select(Location.location_id, Location.name, ApplicationCount.status, func.sum(ApplicationCount.count))
+        .join(Pet, Pet.pet_id == ApplicationCount.pet_id)
+        .join(Location, Location.location_id == Pet.location_id)
+        .group_by(Location.location_id, Location.name, ApplicationCount.status)
+    )).all()
+    names = {location_id: name for location_id, name, _, _ in rows}
+    pivot = _pivot((location_id, status, n) for location_id, _, status, n in rows)
+    return [
+        {"location_id": location_id, "location_name": names[location_id], **counts}
+        for location_id, counts in sorted(pivot.items())
+    ]
+
+
+async def daily_counts(db: AsyncSession, date_from: date, date_to: date) -> list[dict]:
+    """
+    Applications submitted, approved and rejected per day, for days with any activity.
+
+    Returns:
+        list: [{"day": "2024-05-01", "submitted": 4, "approved": 1, "rejected": 0}, ...]
+    """
+    rows = await db.execute(
+        select(ApplicationDailyCount.day, ApplicationDailyCount.event, ApplicationDailyCount.count)
+        .where(ApplicationDailyCount.day >= date_from, ApplicationDailyCount.day <= date_to)
+        .order_by(ApplicationDailyCount.day)
+    )
+    days = {}
+    for day, event, n in rows:
+        entry = days.setdefault(day, {"day": day, "submitted": 0, "approved": 0, "rejected": 0})
+        entry[event] = n
+    return [entry for entry in days.values() if entry["submitted"] or entry["approved"] or entry["rejected"]]
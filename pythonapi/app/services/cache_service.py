@@ -0,0 +1,133 @@
+"""
+Cache Service
+-------------
+Bounded in-process caches.
+
+    - catalog_cache: pre-serialized JSON for the catalog reads (GET /pets,
+      GET /pets/{pet_id}, GET /locations), so repeat requests skip both the
+      SQL query and Pydantic serialization
+    - principal_cache: verified users for JWTs (see get_current_user), so
+      authenticated requests skip the users table lookup
+
+Features:
+    - LRU eviction once max_entries is reached
+    - Per-entry TTL as a safety net
+    - Entries grouped by namespace so write endpoints can drop exactly
+      the entries they affect
+    - Hit/miss/eviction counters for the /metrics/cache endpoint
+
+Catalog callers include the table's ETag in their keys, so a write made by
+another API worker (which bumps the shared catalog version) also causes a miss.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+from fastapi import Response
+from app import config
+from app.services.catalog_version_service import set_etag
+
+# Namespaces used by the catalog endpoints
+PETS_LIST = "pets:list"
+LOCATIONS_LIST = "locations:list"
+
+
+def pet_namespace(pet_id: int) -> str:
+    """Namespace holding the cached GET /pets/{pet_id} response."""
+    return f"pets:{pet_id}"
+
+
+class LRUCache:
+    """
+    Thread-safe LRU + TTL cache.
+    Keys are (namespace, key) pairs; a whole namespace can be invalidated at once.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[(namespace, key)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((namespace, key))
+            self.hits += 1
+            return entry[1]
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry stored under the given namespaces."""
+        namespaces = set(namespaces)  # bulk operations pass one per pet
+        with self._lock:
+            stale = [k for k in self._entries if k[0] in namespaces]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Shared cache for the catalog endpoints.
+# Values are (body, headers) tuples: the JSON body as bytes plus any extra
+# response headers (e.g. X-Next-Cursor) that belong to it.
+catalog_cache = LRUCache(
+    max_entries=config.CATALOG_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.CATALOG_CACHE_TTL_SECONDS,
+)
+
+# Verified principals for get_current_user.
+# Namespace is the user's email (the JWT "sub"), key is the token itself.
+principal_cache = LRUCache(
+    max_entries=config.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def cached_json_response(value: tuple[bytes, dict], etag: str) -> Response:
+    """Build a JSON response from a cached (body, headers) value."""
+    body, headers = value
+    response = Response(content=body, media_type="application/json", headers=headers)
+    set_etag(response, etag)
+    return response
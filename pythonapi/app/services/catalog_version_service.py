@@ -0,0 +1,84 @@
+"""
+Catalog Version Service
+-----------------------
+Change counters and ETags for the public catalog (pets and locations).
+
+Every write endpoint executes bump_version() before committing, so the
+counter changes in the same transaction as the data. Read endpoints turn the
+current counter into a weak ETag and answer If-None-Match with 304 Not Modified
+before running the real query or any response serialization.
+
+The counters live in the database (catalog_versions table) rather than in
+process memory, so all API workers agree on the current version.
+"""
+
+from fastapi import Request, Response
+from sqlalchemy import Update, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.models import CatalogVersion, Location, Pet
+
+# Tables whose reads are versioned
+VERSIONED_TABLES = (Pet.__tablename__, Location.__tablename__)
+
+
+def ensure_catalog_versions(engine: Engine) -> None:
+    """Create the counter row for each versioned table (run once at startup)."""
+    with engine.begin() as conn:
+        existing = set(conn.execute(select(CatalogVersion.table_name)).scalars())
+        missing = [name for name in VERSIONED_TABLES if name not in existing]
+        if missing:
+            conn.execute(insert(CatalogVersion), [{"table_name": name, "version": 0} for name in missing])
+
+
+def bump_version(table_name: str) -> Update:
+    """
+    Build the statement that increments a table's change counter.
+    Execute it before db.commit() so it is part of the write's transaction:
+
+        await db.execute(bump_version(Pet.__tablename__))
+    """
+    return (
+        update(CatalogVersion)
+        .where(CatalogVersion.table_name == table_name)
+        .values(version=CatalogVersion.version + 1)
+    )
+
+
+async def catalog_etag(db: AsyncSession, table_name: str) -> str:
+    """Build the weak ETag for the current version of a table, e.g. W/"pets-12"."""
+    version = await db.scalar(
+        select(CatalogVersion.version).where(CatalogVersion.table_name == table_name)
+    )
+    return f'W/"{table_name}-{version or 0}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+    Uses weak comparison, as required for If-None-Match.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(opaque(tag) == opaque(etag) for tag in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach an ETag and ask clients to revalidate it before reusing a copy."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching ETag."""
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
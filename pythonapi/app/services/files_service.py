@@ -7,99 +7,319 @@ Provides validation, size checking, and safe storage of uploaded images.
 Features:
     - File type validation (only JPG/PNG allowed)
     - File size limits (configurable)
-    - Automatic filename sanitization
-    - Duplicate filename handling
-    - Streaming upload to prevent memory issues
+    - Content-addressed storage: files are named after the SHA-256 of their
+      bytes, so re-uploading the same photo reuses the stored file
+    - Sharded keys (uploads/ab/cd/<hash>.jpg) keep every folder small
+    - Streaming upload to prevent memory issues (hash computed while streaming)
+    - Spooled to a unique temporary file and checked to be a decodable image
+      before it reaches the storage backend (local directory or S3, see
+      storage_service)
+    - Direct uploads: direct_upload_ticket() presigns a PUT straight to the
+      object store for a photo's announced SHA-256, and check_uploaded_photo()
+      accepts the resulting photo_url on the pet endpoints
+    - Async variant (save_image_async) that keeps disk IO and hashing off the
+      event loop, plus UploadLimitMiddleware, which rejects oversized uploads
+      (photos and bulk imports) from their Content-Length before the body is read
 """
 
+import hashlib
 import os
-import shutil
+import re
+import tempfile
+from typing import BinaryIO
 from fastapi import UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from PIL import Image, UnidentifiedImageError
+from starlette.datastructures import Headers
+from app.services.storage_service import content_type
 
 # Allowed image file extensions
 ALLOWED_EXT = {".jpg", ".jpeg", ".png"}
 
+# Read size for streaming uploads
+CHUNK_SIZE = 1024 * 1024
 
-def save_image_or_error(f: UploadFile, upload_dir: str, max_bytes: int) -> str:
+
+def content_path(digest: str, ext: str) -> str:
+    """
+    Relative storage path for a file with the given SHA-256 hex digest.
+
+    Example:
+        content_path("ab12cd...", ".jpg") -> "ab/12/ab12cd....jpg"
+    """
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def storage_key(photo_url: str) -> str:
+    """
+    Storage backend key of an upload from its web path.
+
+    Example:
+        storage_key("uploads/ab/12/ab12....jpg") -> "ab/12/ab12....jpg"
+    """
+    return photo_url.removeprefix("uploads/")
+
+
+def _upload_ext(filename: str | None) -> str:
+    """Validate an upload's extension and return it normalized (.jpeg -> .jpg)."""
+    _, ext = os.path.splitext(filename or "")
+    ext = ext.lower()
+    if ext not in ALLOWED_EXT:
+        raise HTTPException(status_code=400, detail="Only JPG/PNG allowed")
+    return ".jpg" if ext == ".jpeg" else ext
+
+
+def _open_temp(temp_dir: str) -> tuple[int, str]:
+    """Create a uniquely named temporary file in the storage's spool directory."""
+    return tempfile.mkstemp(prefix="tmp_", dir=temp_dir)
+
+
+def _write_chunk(out, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+def _verify_image(tmp: str) -> None:
+    """Quick structural check (no decoding of pixels) before anything is stored."""
+    try:
+        with Image.open(tmp) as im:
+            im.verify()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        raise HTTPException(status_code=400, detail="Invalid image file")
+
+
+def _store(tmp: str, digest: str, ext: str, storage) -> str:
+    """Verify a completed temporary file and store it at its content address; returns the web path."""
+    _verify_image(tmp)
+    key = content_path(digest, ext)
+    storage.store_file(key, tmp)  # same bytes already stored: only touched
+    return "uploads/" + key
+
+
+def _discard(tmp: str) -> None:
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+
+def save_image_or_error(f: UploadFile, storage, max_bytes: int) -> str:
     """
     Save Uploaded Image File
     ------------------------
-    Validates and saves an uploaded image file to the specified directory.
+    Validates and saves an uploaded image file to the storage backend.
+    Blocks the calling thread; request handlers use save_image_async().
 
     Args:
         f: Uploaded file from FastAPI
-        upload_dir: Directory path where file should be saved
+        storage: Storage backend (storage_service.get_storage())
         max_bytes: Maximum allowed file size in bytes
 
     Returns:
-        str: Relative web path to saved file (e.g., "uploads/image.jpg")
+        str: Relative web path to saved file (e.g., "uploads/ab/12/ab12....jpg")
 
     Raises:
         HTTPException 400: Invalid file type (not JPG/PNG)
         HTTPException 400: File exceeds size limit
+        HTTPException 400: File is not a readable image
 
     Process:
         1. Validate file extension
-        2. Stream file to temporary location
+        2. Stream file to a unique temporary file, hashing it on the way
         3. Check size during streaming to avoid memory issues
-        4. Handle filename conflicts (add number suffix if needed)
-        5. Move to final location
-        6. Return web-accessible path
+        4. Check that the file is a decodable image
+        5. If a file with the same hash is already stored, reuse it
+        6. Otherwise store the temporary file under its sharded key
+           (a rename for local storage, a (multipart) PUT for S3)
+        7. Return web-accessible path
 
     Example:
         photo_url = save_image_or_error(
             uploaded_file,
-            "/app/uploads",
+            get_storage(),
             2 * 1024 * 1024  # 2MB limit
         )
-        # Returns: "uploads/dog_photo.jpg"
+        # Returns: "uploads/3f/a2/3fa2...9c.jpg"
     """
-    # Ensure upload directory exists
-    os.makedirs(upload_dir, exist_ok=True)
+    return save_image_stream(f.file, f.filename, storage, max_bytes)
 
-    # Extract and validate file extension
-    name, ext = os.path.splitext(f.filename or "")
-    ext = ext.lower()
-    if ext not in ALLOWED_EXT:
-        # Consume the file stream before raising error
-        _ = f.file.read()
-        raise HTTPException(status_code=400, detail="Only JPG/PNG allowed")
 
-    # Write to temporary file while checking size
-    tmp = os.path.join(upload_dir, f"tmp_{f.filename}")
-    with open(tmp, "wb") as out:
-        size = 0
-        # Read file in 1MB chunks to prevent memory issues
-        chunk = f.file.read(1024 * 1024)
-        while chunk:
-            size += len(chunk)
-            # Check if file exceeds maximum allowed size
-            if size > max_bytes:
-                out.close()
-                # Clean up temporary file
-                try:
-                    os.remove(tmp)
-                except:
-                    pass
-                # Consume remaining file stream
-                while chunk:
-                    chunk = f.file.read(1024 * 1024)
-                raise HTTPException(status_code=400, detail="File too large")
-            out.write(chunk)
-            chunk = f.file.read(1024 * 1024)
-
-    # Generate final filename (sanitize spaces)
-    final = os.path.join(upload_dir, name.replace(" ", "_") + ext)
-
-    # Handle duplicate filenames by adding numeric suffix
-    i = 1
-    while os.path.exists(final):
-        final = os.path.join(upload_dir, f"{name}_{i}{ext}")
-        i += 1
-
-    # Move from temporary to final location
-    shutil.move(tmp, final)
-
-    # Return web-accessible path (relative URL)
-    # Format: "uploads/filename.jpg" (works on both Windows and Unix)
-    return ("uploads/" + os.path.basename(final)).replace("\\", "/")
+def save_image_stream(src: BinaryIO, filename: str | None, storage, max_bytes: int) -> str:
+    """
+    Same as save_image_or_error() for any readable binary stream, e.g. a
+    member of a ZIP archive during a bulk import.
+
+    Example:
+        with archive.open("rex.jpg") as src:
+            photo_url = save_image_stream(src, "rex.jpg", get_storage(), 2 * 1024 * 1024)
+    """
+    ext = _upload_ext(filename)
+
+    # Write to a unique temporary file while hashing and checking size
+    digest = hashlib.sha256()
+    fd, tmp = _open_temp(storage.temp_dir)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            size = 0
+            chunk = src.read(CHUNK_SIZE)
+            while chunk:
+                size += len(chunk)
+                # Check if file exceeds maximum allowed size
+                if size > max_bytes:
+                    raise HTTPException(status_code=400, detail="File too large")
+                _write_chunk(out, digest, chunk)
+                chunk = src.read(CHUNK_SIZE)
+        return _store(tmp, digest.hexdigest(), ext, storage)
+    finally:
+        _discard(tmp)
+
+
+async def save_image_async(f: UploadFile, storage, max_bytes: int) -> str:
+    """
+    Save Uploaded Image File (async)
+    --------------------------------
+    Same result as save_image_or_error(), without blocking the event loop:
+    chunks are read with UploadFile's async API, and hashing, disk writes and
+    storing run in the threadpool one chunk at a time, so a large upload never
+    holds a worker thread for its whole duration.
+
+    Example:
+        photo_url = await save_image_async(photo, get_storage(), 2 * 1024 * 1024)
+    """
+    ext = _upload_ext(f.filename)
+
+    digest = hashlib.sha256()
+    fd, tmp = await run_in_threadpool(_open_temp, storage.temp_dir)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            size = 0
+            while chunk := await f.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(status_code=400, detail="File too large")
+                await run_in_threadpool(_write_chunk, out, digest, chunk)
+        return await run_in_threadpool(_store, tmp, digest.hexdigest(), ext, storage)
+    finally:
+        await run_in_threadpool(_discard, tmp)
+
+
+# photo_url values clients may hand back after a direct upload
+UPLOADED_PHOTO_URL = re.compile(r"^uploads/([0-9a-f]{2})/([0-9a-f]{2})/\1\2[0-9a-f]{60}\.(jpg|png)$")
+
+
+def direct_upload_ticket(filename: str, size: int, sha256: str, storage, max_bytes: int) -> dict:
+    """
+    Direct Upload Ticket
+    --------------------
+    Presign an upload that goes straight from the client to the object store.
+    The photo's key is derived from the SHA-256 the client announces, and the
+    store only accepts a body with exactly that size and checksum.
+
+    Args:
+        filename: Original file name (only the extension is used)
+        size: File size in bytes
+        sha256: Hex SHA-256 of the file
+        storage: Storage backend (must support presigned uploads)
+        max_bytes: Maximum allowed file size in bytes
+
+    Returns:
+        dict: photo_url to send to POST/PUT /pets, and the upload to perform
+              (None when the same photo is already stored)
+
+    Raises:
+        HTTPException 400: Invalid file type, size or checksum
+        HTTPException 501: Storage backend without direct uploads (local)
+    """
+    ext = _upload_ext(filename)
+    if size > max_bytes:
+        raise HTTPException(status_code=400, detail="File too large")
+    sha256 = sha256.lower()
+    if not re.fullmatch(r"[0-9a-f]{64}", sha256):
+        raise HTTPException(status_code=400, detail="sha256 must be 64 hex characters")
+
+    key = content_path(sha256, ext)
+    if storage.sizes([key]):
+        return {"photo_url": "uploads/" + key, "upload": None}
+    try:
+        upload = storage.presign_upload(key, size, sha256, content_type(key))
+    except NotImplementedError as exc:
+        raise HTTPException(status_code=501, detail=str(exc))
+    return {"photo_url": "uploads/" + key, "upload": upload}
+
+
+def check_uploaded_photo(photo_url: str, storage) -> str:
+    """
+    Validate a photo_url from a direct upload and check the object exists.
+    Only content-addressed JPG/PNG paths are accepted, so clients can't point
+    a pet at another pet's variant or at an arbitrary key.
+
+    Raises:
+        HTTPException 400: Malformed photo_url, or nothing stored under it
+    """
+    if not UPLOADED_PHOTO_URL.match(photo_url):
+        raise HTTPException(status_code=400, detail="Invalid photo_url")
+    if not storage.sizes([storage_key(photo_url)]):
+        raise HTTPException(status_code=400, detail="Uploaded photo not found")
+    return photo_url
+
+
+# Requests that carry a pet photo: POST /pets and PUT /pets/{pet_id}
+PHOTO_UPLOAD_ROUTES = re.compile(r"^/pets(/\d+)?$")
+
+# Bulk import uploads (rows file and photos ZIP): POST /pets/bulk
+IMPORT_UPLOAD_ROUTES = re.compile(r"^/pets/bulk$")
+
+# Room for the multipart boundaries and the other form fields next to the photo
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadLimitMiddleware:
+    """
+    Rejects oversized photo uploads and bulk imports with 413 before the body
+    is read, each against its own limit.
+
+    Starlette parses (and spools to disk) the whole multipart body before an
+    endpoint or its dependencies run, so the size check has to happen here:
+        - a Content-Length above the limit is answered immediately
+        - bodies without Content-Length (chunked) are counted as they
+          arrive and cut off as soon as they pass the limit
+    """
+
+    def __init__(self, app, max_bytes: int, import_max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes + FORM_OVERHEAD_BYTES
+        self.import_max_bytes = import_max_bytes + FORM_OVERHEAD_BYTES
+
+    def _limit(self, scope) -> int | None:
+        """Body size limit for a request, or None if it isn't an upload route."""
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT"):
+            return None
+        if scope["method"] == "POST" and IMPORT_UPLOAD_ROUTES.match(scope["path"]):
+            return self.import_max_bytes
+        if PHOTO_UPLOAD_ROUTES.match(scope["path"]):
+            return self.max_bytes
+        return None
+
+    async def __call__(self, scope, receive, send):
+        max_bytes = self._limit(scope)
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        length = Headers(scope=scope).get("content-length")
+        if length and length.isdigit() and int(length) > max_bytes:
+            response = JSONResponse({"detail": "File too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    raise HTTPException(status_code=413, detail="File too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,272 @@
+"""
+Image Job Service
+-----------------
+Database-backed queue and process-pool worker for pet photo processing.
+
+Upload requests only store the original and queue an ImageJob row in the same
+transaction, so they return in milliseconds. The worker then generates the
+variants off the request path:
+
+    - Jobs live in the image_jobs table, so queued work survives restarts
+    - Variants are generated in a process pool (IMAGE_WORKER_PROCESSES),
+      using every core without holding the GIL of the API process
+    - Jobs are claimed with a compare-and-set UPDATE, so several API worker
+      processes can share one queue; claims older than IMAGE_JOB_LEASE_SECONDS
+      (a crashed worker) are taken over, unless that was the last allowed
+      attempt, in which case the job fails
+    - Failed attempts are retried with exponential backoff up to
+      IMAGE_JOB_MAX_ATTEMPTS; undecodable images fail immediately
+    - Progress is visible on the pet as photo_status
+      ("processing" -> "ready" | "failed")
+
+Usage:
+    queue_image_job(db, pet, photo_url)   # inside the upload transaction
+    await db.commit()
+    image_worker.notify()                 # wake the local worker right away
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import config
+from app.db import AsyncSessionLocal
+from app.schemas.models import ImageJob, Pet
+from app.services.cache_service import PETS_LIST, catalog_cache, pet_namespace
+from app.services.catalog_version_service import bump_version
+from app.services.image_service import create_variants
+from app.services.storage_service import get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidImageError(Exception):
+    """Raised in a pool process when a job's file can't be decoded."""
+
+
+def run_image_job(photo_url: str) -> dict[str, str]:
+    """
+    Pool entry point; each pool process opens its own storage backend.
+    HTTPException doesn't survive the trip back from a child process, so
+    undecodable images are reported as InvalidImageError.
+    """
+    try:
+        return create_variants(photo_url, get_storage())
+    except HTTPException as exc:
+        raise InvalidImageError(exc.detail) from None
+
+
+def queue_image_job(db: AsyncSession, pet: Pet, photo_url: str) -> None:
+    """
+    Mark a pet's photo as processing and queue its variant generation.
+    Call before db.commit() so the job is saved together with the upload.
+    The pet must already have a pet_id (flush new pets first).
+    """
+    pet.photo_url = photo_url
+    pet.photo_variants = None
+    pet.photo_status = "processing"
+    db.add(ImageJob(pet_id=pet.pet_id, photo_url=photo_url))
+
+
+class ImageJobWorker:
+    """Claims queued ImageJob rows and runs them on a process pool."""
+
+    def __init__(self, processes: int):
+        self.processes = max(1, processes)
+        self._pool: ProcessPoolExecutor | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the pool and the polling loop (call from the running event loop)."""
+        if self._task is not None:
+            return
+        self._pool = self._new_pool()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop claiming jobs, wait for running ones and shut the pool down."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        self._pool.shutdown()
+        self._task = None
+        self._pool = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn: forking an API process that already runs threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def notify(self) -> None:
+        """Wake the worker after queueing a job, instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                while len(self._running) < self.processes:
+                    job = await self._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(self._process(job))
+                    self._running.add(task)
+                    task.add_done_callback(self._finished)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Image job worker: failed to claim jobs")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=config.IMAGE_JOB_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        # A slot is free: look for more work right away
+        self._wakeup.set()
+
+    async def _claim(self) -> ImageJob | None:
+        """Take the oldest runnable job, or None if there is nothing to do."""
+        async with AsyncSessionLocal() as db:
+            while True:
+                now = datetime.utcnow()
+                stale = now - timedelta(seconds=config.IMAGE_JOB_LEASE_SECONDS)
+                # populate_existing: after a lost compare-and-set the job is
+                # still in the session's identity map, and the retry must see
+                # the attempts value the winner wrote, not the cached one
+                job = await db.scalar(
+                    select(ImageJob).where(or_(
+                        and_(ImageJob.status == "queued", ImageJob.run_after <= now),
+                        and_(ImageJob.status == "running", ImageJob.locked_at < stale),
+                    )).order_by(ImageJob.job_id).limit(1)
+                    .execution_options(populate_existing=True)
+                )
+                if job is None:
+                    return None
+
+                # A worker died during the last allowed attempt: fail the job
+                # instead of running it again
+                exhausted = job.status == "running" and job.attempts >= config.IMAGE_JOB_MAX_ATTEMPTS
+
+                # Compare-and-set: only one worker process wins each attempt
+                values = (
+                    dict(status="failed", locked_at=None) if exhausted
+                    else dict(status="running", locked_at=now, attempts=job.attempts + 1)
+                )
+                result = await db.execute(
+                    update(ImageJob)
+                    .where(ImageJob.job_id == job.job_id, ImageJob.status == job.status,
+                           ImageJob.attempts == job.attempts)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                if result.rowcount != 1:
+                    continue
+                if exhausted:
+                    await self._fail(job, "Lease expired during the last attempt", retry=False)
+                    continue
+                job.attempts += 1
+                return job
+
+    async def _process(self, job: ImageJob) -> None:
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            variants = await loop.run_in_executor(pool, run_image_job, job.photo_url)
+        except InvalidImageError as exc:
+            # Not a decodable image: retrying won't help
+            await self._fail(job, str(exc), retry=False)
+        except BrokenProcessPool as exc:
+            # A child died (e.g. killed for memory); later jobs need a fresh pool
+            if self._pool is pool:
+                pool.shutdown(wait=False)
+                self._pool = self._new_pool()
+            await self._fail(job, repr(exc), retry=job.attempts < config.IMAGE_JOB_MAX_ATTEMPTS)
+        except Exception as exc:
+            await self._fail(job, repr(exc), retry=job.attempts < config.IMAGE_JOB_MAX_ATTEMPTS)
+        else:
+            await self._complete(job, variants)
+
+    async def _complete(self, job: ImageJob, variants: dict[str, str]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ImageJob).where(ImageJob.job_id == job.job_id))
+            # Skip the pet if its photo was replaced (or the pet deleted) meanwhile
+            updated = await db.execute(
+                update(Pet)
+                .where(Pet.pet_id == job.pet_id, Pet.photo_url == job.photo_url)
+                .values(photo_variants=variants, photo_status="ready")
+            )
+            if updated.rowcount:
+                await db.execute(bump_version(Pet.__tablename__))
+            await db.commit()
+        catalog_cache.invalidate(PETS_LIST, pet_namespace(job.pet_id))
+        self.completed += 1
+
+    async def _fail(self, job: ImageJob, error: str, retry: bool) -> None:
+        async with AsyncSessionLocal() as db:
+            if retry:
+                delay = config.IMAGE_JOB_RETRY_SECONDS * 2 ** (job.attempts - 1)
+                await db.execute(
+                    update(ImageJob).where(ImageJob.job_id == job.job_id).values(
+                        status="queued", last_error=error, locked_at=None,
+                        run_after=datetime.utcnow() + timedelta(seconds=delay),
+                    )
+                )
+                self.retried += 1
+            else:
+                await db.execute(
+                    update(ImageJob).where(ImageJob.job_id == job.job_id)
+                    .values(status="failed", last_error=error, locked_at=None)
+                )
+                updated = await db.execute(
+                    update(Pet)
+                    .where(Pet.pet_id == job.pet_id, Pet.photo_url == job.photo_url)
+                    .values(photo_status="failed")
+                )
+                if updated.rowcount:
+                    await db.execute(bump_version(Pet.__tablename__))
+                self.failed += 1
+            await db.commit()
+        if not retry:
+            catalog_cache.invalidate(PETS_LIST, pet_namespace(job.pet_id))
+        logger.warning("Image job %s for pet %s failed (attempt %s): %s",
+                       job.job_id, job.pet_id, job.attempts, error)
+
+    async def stats(self) -> dict:
+        """Queue depth by status plus this process's counters."""
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(ImageJob.status, func.count()).group_by(ImageJob.status)
+            )).all()
+        return {
+            "processes": self.processes,
+            "running_here": len(self._running),
+            "jobs": {status: count for status, count in rows},
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+image_worker = ImageJobWorker(processes=config.IMAGE_WORKER_PROCESSES)
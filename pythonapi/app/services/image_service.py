@@ -0,0 +1,177 @@
+"""
+Image Variant Service
+---------------------
+Generates resized copies of uploaded pet photos.
+
+Every upload gets one variant per entry in PHOTO_VARIANT_WIDTHS
+(thumb/card/full by default), stored next to the original (in the
+configured storage backend) as "<hash>.<variant>.<ext>". Their web paths are recorded on the pet
+(Pet.photo_variants) and returned in PetOut, so list views can load
+a small card image instead of a multi-megabyte original. Uploads are
+content-addressed, so variants that already exist for the same bytes
+are reused rather than re-encoded.
+
+Features:
+    - Never upscales: images narrower than a variant are only re-encoded
+    - Applies the EXIF orientation, then drops EXIF metadata
+    - Photos with transparency stay PNG, everything else becomes
+      progressive JPEG at PHOTO_JPEG_QUALITY
+    - Each variant is also written as AVIF and WebP ("<hash>.card.avif",
+      "<hash>.card.webp") when Pillow supports them; the /uploads route
+      serves the best format the browser's Accept header allows
+    - Rejects files that aren't decodable images, and originals whose bytes
+      don't match the SHA-256 in their name (direct uploads to S3 are only
+      as honest as the store's checksum validation)
+
+create_variants() is CPU-heavy; request handlers only store the upload and
+queue the resize through image_job_service.
+"""
+
+import hashlib
+import os
+import tempfile
+from fastapi import HTTPException
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+from app import config
+from app.services.files_service import CHUNK_SIZE, storage_key
+from app.services.static_service import CONTENT_ADDRESSED
+
+
+def variant_path(photo_url: str, variant: str, ext: str) -> str:
+    """
+    Build the web path of a variant from the original's web path.
+
+    Example:
+        variant_path("uploads/ab/12/ab12....jpg", "thumb", ".jpg") -> "uploads/ab/12/ab12....thumb.jpg"
+    """
+    stem, _ = os.path.splitext(photo_url)
+    return f"{stem}.{variant}{ext}"
+
+
+def modern_formats() -> list[tuple[str, str]]:
+    """
+    (extension, Pillow format) for each PHOTO_MODERN_FORMATS entry this Pillow
+    build can encode, best first.
+
+    Example:
+        modern_formats() -> [(".avif", "AVIF"), (".webp", "WEBP")]
+    """
+    return [
+        (f".{name}", name.upper())
+        for name in config.PHOTO_MODERN_FORMATS
+        if features.check(name)
+    ]
+
+
+def _save(image: Image.Image, storage, key: str, fmt: str) -> None:
+    """
+    Encode an image to a temporary file and store it under key, so a
+    concurrent request for the same photo never sees a half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(prefix="tmp_", dir=storage.temp_dir)
+    os.close(fd)
+    try:
+        if fmt == "PNG":
+            image.save(tmp, fmt, optimize=True)
+        elif fmt == "JPEG":
+            image.save(tmp, fmt, quality=config.PHOTO_JPEG_QUALITY, optimize=True, progressive=True)
+        elif fmt == "WEBP":
+            image.save(tmp, fmt, quality=config.PHOTO_WEBP_QUALITY, method=6)
+        else:
+            image.save(tmp, fmt, quality=config.PHOTO_AVIF_QUALITY)
+        storage.store_file(key, tmp)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _content_matches(path: str, photo_url: str) -> bool:
+    """Check a content-addressed file's bytes against the hash in its name."""
+    name = photo_url.rsplit("/", 1)[-1]
+    if not CONTENT_ADDRESSED.match(name):
+        return True  # older uploads named after the original file
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest() == name.split(".", 1)[0]
+
+
+def _undecodable(exc: Exception) -> bool:
+    """
+    Tell bad image data from a failed read. Pillow reports unknown, truncated
+    or corrupt data as an OSError without an errno; disk and network errors
+    carry one and are worth retrying. A missing source (not yet visible in
+    object storage) is never the image's fault.
+    """
+    if isinstance(exc, (UnidentifiedImageError, Image.DecompressionBombError)):
+        return True
+    if isinstance(exc, FileNotFoundError):
+        return False
+    return isinstance(exc, OSError) and exc.errno is None
+
+
+def _reject(storage, key: str) -> HTTPException:
+    """Remove an upload that isn't a usable image and build the 400 error."""
+    try:
+        storage.delete([key])
+    except OSError:
+        pass
+    return HTTPException(status_code=400, detail="Invalid image file")
+
+
+def create_variants(photo_url: str, storage) -> dict[str, str]:
+    """
+    Create Photo Variants
+    ---------------------
+    Resize a stored upload into every configured variant width.
+
+    Args:
+        photo_url: Web path returned by save_image_or_error
+        storage: Storage backend holding the upload (storage_service.get_storage())
+
+    Returns:
+        dict: Variant name -> web path, e.g. {"thumb": "uploads/ab/12/ab12....thumb.jpg", ...}
+
+    Raises:
+        HTTPException 400: File is not a readable image (the upload is removed)
+        OSError: Reading or writing storage failed, or the upload isn't
+            there (yet); the upload is kept, so the job can be retried
+    """
+    source = storage_key(photo_url)
+    try:
+        with storage.local_copy(source) as path, Image.open(path) as im:
+            if not _content_matches(path, photo_url):
+                raise _reject(storage, source)
+            # Image.open() only reads the header; pixels are decoded on demand
+            has_alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+            ext = ".png" if has_alpha else ".jpg"
+            variants = {name: variant_path(photo_url, name, ext) for name in config.PHOTO_VARIANT_WIDTHS}
+            outputs = [(ext, "PNG" if has_alpha else "JPEG")] + modern_formats()
+            wanted = [
+                (name, out_ext, fmt)
+                for name in config.PHOTO_VARIANT_WIDTHS
+                for out_ext, fmt in outputs
+            ]
+            # One lookup for all of them (a single LIST request on S3)
+            existing = storage.sizes([storage_key(variant_path(photo_url, *w[:2])) for w in wanted])
+            missing = [w for w in wanted if storage_key(variant_path(photo_url, *w[:2])) not in existing]
+            if not missing:
+                return variants
+
+            im = ImageOps.exif_transpose(im)
+            im = im.convert("RGBA" if has_alpha else "RGB")
+    except (Image.DecompressionBombError, OSError) as exc:
+        if not _undecodable(exc):
+            raise
+        raise _reject(storage, source)
+
+    resized = {}
+    for name, out_ext, fmt in missing:
+        if name not in resized:
+            width = config.PHOTO_VARIANT_WIDTHS[name]
+            resized[name] = im.copy()
+            # thumbnail() keeps the aspect ratio and never enlarges
+            resized[name].thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+        _save(resized[name], storage, storage_key(variant_path(photo_url, name, out_ext)), fmt)
+    return variants
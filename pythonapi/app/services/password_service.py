@@ -0,0 +1,136 @@
+"""
+Password Hashing Service
+------------------------
+bcrypt hashing and verification on a dedicated, size-limited thread pool.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call).
+Running it on Starlette's shared threadpool lets a burst of logins occupy
+every worker thread and stall unrelated endpoints. Here:
+
+    - bcrypt runs on its own pool of BCRYPT_MAX_WORKERS threads
+    - at most BCRYPT_MAX_QUEUE further calls may wait for a free thread;
+      beyond that requests are rejected with 503 + Retry-After instead of
+      piling up, so login bursts can tie up only a bounded number of threads
+    - the work factor is configurable (BCRYPT_ROUNDS), and needs_rehash()
+      lets login upgrade hashes created with a different cost
+    - queue depth and throughput counters are exposed at /metrics/bcrypt
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from fastapi import HTTPException
+import bcrypt
+from app import config
+
+
+class PasswordHasher:
+    """Runs bcrypt calls on a bounded executor and tracks queue depth."""
+
+    def __init__(self, rounds: int, max_workers: int, max_queue: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _run(self, fn, *args):
+        with self._lock:
+            self.active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _done(self, _: Future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Schedule a bcrypt call on the dedicated pool.
+
+        Raises:
+            HTTPException 503: Pool and queue are both full
+        """
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server is busy, please try again",
+                    headers={"Retry-After": "1"},
+                )
+            self.in_flight += 1
+        future = self._executor.submit(self._run, fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def stats(self) -> dict:
+        """Snapshot of the pool counters."""
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.in_flight - self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+hasher = PasswordHasher(
+    rounds=config.BCRYPT_ROUNDS,
+    max_workers=config.BCRYPT_MAX_WORKERS,
+    max_queue=config.BCRYPT_MAX_QUEUE,
+)
+
+
+def _hash(password: str, rounds: int) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def hash_password(password: str) -> str:
+    """Hash a password using bcrypt (blocks the calling thread until done)."""
+    return hasher.submit(_hash, password, hasher.rounds).result()
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (blocks the calling thread until done)."""
+    return hasher.submit(_verify, plain_password, hashed_password).result()
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password using bcrypt without blocking the event loop."""
+    return await asyncio.wrap_future(hasher.submit(_hash, password, hasher.rounds))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    return await asyncio.wrap_future(hasher.submit(_verify, plain_password, hashed_password))
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses a different work factor than BCRYPT_ROUNDS.
+
+    Example:
+        needs_rehash("$2b$10$...")  # True when BCRYPT_ROUNDS is 12
+    """
+    try:
+        cost = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != hasher.rounds
@@ -0,0 +1,266 @@
+"""
+Pet Import Service
+------------------
+Bulk pet import for onboarding a shelter (POST /pets/bulk and
+python -m app.pet_import), instead of one POST /pets call per pet.
+
+Rows come from NDJSON (one JSON object per line) or CSV (with a header row)
+and carry the PetCreate fields, plus an optional "photo" naming an image
+inside a ZIP archive:
+
+    {"name": "Rex", "species": "Dog", "age": 3, "location_id": 1, "photo": "rex.jpg"}
+
+    name,species,age,description,location_id,photo
+    Rex,Dog,3,Friendly,1,rex.jpg
+
+Features:
+    - Every row is validated with PetCreate, and location_ids are checked
+      against one query; bad rows are reported with their line number and
+      skipped instead of failing the import
+    - Valid rows are inserted IMPORT_BATCH_SIZE at a time: one executemany
+      INSERT ... RETURNING per batch, each batch in its own transaction
+    - Photos are streamed out of the archive and stored like uploads
+      (content-addressed, verified, any storage backend); their ImageJob rows
+      are inserted with the batch, so the image worker generates variants
+      in the background
+    - One catalog version bump per batch instead of one per pet
+    - dry_run validates everything without writing
+"""
+
+import csv
+import io
+import json
+import zipfile
+from typing import BinaryIO, Iterator
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import config
+from app.schemas.models import ImageJob, Location, Pet
+from app.schemas.schemas_pet import PetCreate
+from app.services.cache_service import PETS_LIST, catalog_cache
+from app.services.catalog_version_service import bump_version
+from app.services.files_service import save_image_stream
+
+# Accepted import formats (request file extension -> format)
+IMPORT_FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+
+
+def read_rows(stream: BinaryIO, fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Parse an NDJSON or CSV stream.
+
+    Yields:
+        (line number, fields, error): fields is None when the line couldn't be parsed
+
+    Example:
+        list(read_rows(io.BytesIO(b'{"name": "Rex"}\\n'), "ndjson")) -> [(1, {"name": "Rex"}, None)]
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            try:
+                for record in reader:
+                    # Empty cells mean "not given", e.g. no description
+                    fields = {k.strip(): (v.strip() or None) for k, v in record.items() if k and isinstance(v, str)}
+                    yield reader.line_num, fields, None
+            except csv.Error as exc:
+                # The reader can't resync after e.g. an over-long field: report
+                # the line it failed on (not yet counted in line_num) and stop
+                yield reader.line_num + 1, None, f"Invalid CSV: {exc}"
+            return
+
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                fields = json.loads(line)
+            except ValueError as exc:
+                yield line_no, None, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(fields, dict):
+                yield line_no, None, "Expected a JSON object"
+                continue
+            yield line_no, fields, None
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import file must be UTF-8")
+    finally:
+        text.detach()  # leave the caller's stream open
+
+
+def _describe(exc: ValidationError) -> str:
+    """One-line summary of a PetCreate validation error."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors()
+    )
+
+
+def parse_import(stream: BinaryIO, fmt: str) -> tuple[list[tuple[int, PetCreate, str | None]], list[dict]]:
+    """
+    Parse and validate every row (runs in a worker thread for API requests).
+
+    Returns:
+        (valid rows as (line, payload, photo name), errors as {"line": n, "error": "..."})
+    """
+    valid, errors = [], []
+    for line, fields, error in read_rows(stream, fmt):
+        if error:
+            errors.append({"line": line, "error": error})
+            continue
+        photo = fields.pop("photo", None)
+        try:
+            valid.append((line, PetCreate(**fields), photo))
+        except ValidationError as exc:
+            errors.append({"line": line, "error": _describe(exc)})
+    return valid, errors
+
+
+def archive_members(archive: zipfile.ZipFile) -> dict[str, zipfile.ZipInfo]:
+    """Archive files by path and by bare file name, so rows may use either."""
+    members = {}
+    for info in archive.infolist():
+        if not info.is_dir():
+            members.setdefault(info.filename, info)
+            members.setdefault(info.filename.rsplit("/", 1)[-1], info)
+    return members
+
+
+def _store_photos(
+        archive: zipfile.ZipFile, members: dict, names: list[str | None], storage, max_bytes: int
+) -> list:
+    """
+    Store the archive photos of one batch (runs in a worker thread).
+
+    Returns:
+        list: photo_url, None (no photo) or an HTTPException per name
+    """
+    results = []
+    for name in names:
+        if not name:
+            results.append(None)
+            continue
+        info = members.get(name)
+        if info is None:
+            results.append(HTTPException(status_code=400, detail=f"Photo {name!r} not in archive"))
+            continue
+        if info.file_size > max_bytes:
+            results.append(HTTPException(status_code=400, detail="File too large"))
+            continue
+        try:
+            with archive.open(info) as src:
+                results.append(save_image_stream(src, info.filename, storage, max_bytes))
+        except HTTPException as exc:
+            results.append(exc)
+        except (zipfile.BadZipFile, OSError) as exc:
+            results.append(HTTPException(status_code=400, detail=f"Unreadable photo: {exc}"))
+    return results
+
+
+async def import_pets(
+        db: AsyncSession,
+        stream: BinaryIO,
+        fmt: str,
+        archive: zipfile.ZipFile | None = None,
+        storage=None,
+        batch_size: int = config.IMPORT_BATCH_SIZE,
+        dry_run: bool = False,
+) -> dict:
+    """
+    Import Pets
+    -----------
+    Validate and insert pets from an NDJSON/CSV stream in batched transactions.
+
+    Args:
+        db: Async database session
+        stream: Binary NDJSON or CSV data
+        fmt: "ndjson" or "csv"
+        archive: Optional ZIP archive holding the photos named in the rows
+        storage: Storage backend for the photos (required with an archive)
+        batch_size: Rows per INSERT and transaction
+        dry_run: Only validate, write nothing
+
+    Returns:
+        dict: {"rows": 120, "inserted": 118, "failed": 2, "photos": 90,
+               "errors": [{"line": 7, "error": "age: Input should be ..."}, ...]}
+
+    Note:
+        Batches are committed as they go, so a failure part-way keeps the
+        batches before it. New pets start as "pending", like POST /pets.
+    """
+    valid, errors = await run_in_threadpool(parse_import, stream, fmt)
+    rows = len(valid) + len(errors)
+
+    location_ids = set(await db.scalars(select(Location.location_id)))
+    members = await run_in_threadpool(archive_members, archive) if archive is not None else {}
+    checked = []
+    for line, payload, photo in valid:
+        if payload.location_id not in location_ids:
+            errors.append({"line": line, "error": f"location_id: Unknown location {payload.location_id}"})
+        elif photo and archive is None:
+            errors.append({"line": line, "error": "photo: No photo archive given"})
+        elif photo and dry_run and photo not in members:
+            errors.append({"line": line, "error": f"photo: Photo {photo!r} not in archive"})
+        else:
+            checked.append((line, payload, photo))
+
+    inserted = photos = 0
+    if not dry_run:
+        for start in range(0, len(checked), batch_size):
+            batch = checked[start:start + batch_size]
+
+            photo_urls = [None] * len(batch)
+            if archive is not None:
+                photo_urls = await run_in_threadpool(
+                    _store_photos, archive, members, [photo for _, _, photo in batch],
+                    storage, config.MAX_UPLOAD_MB * 1024 * 1024,
+                )
+
+            values = []
+            for (line, payload, _), photo_url in zip(batch, photo_urls):
+                if isinstance(photo_url, HTTPException):
+                    errors.append({"line": line, "error": f"photo: {photo_url.detail}"})
+                    continue
+                values.append({
+                    **payload.model_dump(),
+                    "photo_url": photo_url,
+                    "photo_status": "processing" if photo_url else None,
+                })
+            if not values:
+                continue
+
+            try:
+                pet_ids = list(await db.scalars(
+                    insert(Pet).returning(Pet.pet_id, sort_by_parameter_order=True), values
+                ))
+                jobs = [
+                    {"pet_id": pet_id, "photo_url": row["photo_url"]}
+                    for pet_id, row in zip(pet_ids, values) if row["photo_url"]
+                ]
+                if jobs:
+                    await db.execute(insert(ImageJob), jobs)
+                await db.execute(bump_version(Pet.__tablename__))
+                await db.commit()
+            except SQLAlchemyError as exc:
+                await db.rollback()
+                lines = [line for line, _, _ in batch]
+                errors.append({
+                    "line": lines[0],
+                    "error": f"Batch of lines {lines[0]}-{lines[-1]} not imported: {exc.__class__.__name__}",
+                })
+                continue
+            inserted += len(pet_ids)
+            photos += len(jobs)
+            catalog_cache.invalidate(PETS_LIST)
+
+    errors.sort(key=lambda e: e["line"])
+    return {
+        "rows": rows,
+        "inserted": inserted,
+        "failed": rows - inserted if not dry_run else len(errors),
+        "photos": photos,
+        "errors": errors,
+    }
@@ -0,0 +1,83 @@
+"""
+Schema Upgrade Service
+----------------------
+Brings an existing database up to the indexes declared in app/schemas/models.py.
+
+Base.metadata.create_all() only creates missing tables, so a database created
+by an older version keeps its old columns and indexes. upgrade_schema() runs at
+startup and:
+
+    - adds declared columns missing from existing tables (so new columns
+      must be nullable)
+    - removes duplicate favorites (keeping the oldest row per user and pet),
+      which would otherwise make the unique index impossible to build
+    - creates every declared index that doesn't exist yet
+
+Both steps are idempotent and cheap once the database is up to date.
+"""
+
+from sqlalchemy import delete, func, inspect, select, text
+from sqlalchemy.engine import Engine
+from app.db import Base
+from app.schemas.models import Favorite
+
+
+def dedupe_favorites(conn) -> int:
+    """
+    Delete duplicate (user_id, pet_id) favorites, keeping the lowest favorite_id.
+
+    Returns:
+        int: Number of rows deleted
+    """
+    keep = (
+        select(func.min(Favorite.favorite_id))
+        .group_by(Favorite.user_id, Favorite.pet_id)
+        .scalar_subquery()
+    )
+    result = conn.execute(delete(Favorite).where(Favorite.favorite_id.not_in(keep)))
+    return result.rowcount
+
+
+def add_missing_columns(conn) -> list[str]:
+    """
+    ALTER TABLE ... ADD COLUMN for every declared column the database lacks.
+
+    Returns:
+        list: "table.column" names that were added
+    """
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    added = []
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = (
+                f"ALTER TABLE {preparer.format_table(table)} "
+                f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(conn.dialect)}"
+            )
+            conn.execute(text(ddl))
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Upgrade Schema
+    --------------
+    Add any declared column or index missing from an existing database.
+
+    Args:
+        engine: SQLAlchemy engine for the application database
+    """
+    with engine.begin() as conn:
+        add_missing_columns(conn)
+
+        existing = {index["name"] for index in inspect(conn).get_indexes(Favorite.__tablename__)}
+        if "ux_favorites_user_id_pet_id" not in existing:
+            dedupe_favorites(conn)
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
@@ -0,0 +1,188 @@
+"""
+Pet Search Service
+------------------
+Full-text search over pet names, species and descriptions.
+
+SQLite (FTS5):
+    - External-content FTS5 table (pets_fts) that indexes the pets table
+      without storing a second copy of the text
+    - Triggers keep the index in sync with every INSERT/UPDATE/DELETE on pets,
+      including bulk statements that bypass the API (seed script, test reset)
+    - bm25 ranking with name matches weighted above species and description
+    - Porter stemming so "puppies" also finds "puppy"
+
+PostgreSQL (tsvector):
+    - GIN expression index over a weighted tsvector (name A, species B,
+      description C), maintained by PostgreSQL itself
+    - ts_rank ranking and English stemming
+
+Results are paged with a keyset on (score, pet_id): each page continues
+after the last row of the previous one instead of skipping and re-ranking
+every earlier match.
+"""
+
+import re
+from sqlalchemy import Float, column, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.models import Pet
+
+# bm25 column weights, in pets_fts column order (name, species, description)
+BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+# PostgreSQL: weighted document vector; must match the GIN index expression exactly
+_PG_VECTOR = (
+    "(setweight(to_tsvector('english', coalesce(pets.name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(pets.species, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(pets.description, '')), 'C'))"
+)
+
+_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS pets_fts USING fts5(
+        name, species, description,
+        content='pets', content_rowid='pet_id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_fts_ai AFTER INSERT ON pets BEGIN
+        INSERT INTO pets_fts(rowid, name, species, description)
+        VALUES (new.pet_id, new.name, new.species, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_fts_ad AFTER DELETE ON pets BEGIN
+        INSERT INTO pets_fts(pets_fts, rowid, name, species, description)
+        VALUES ('delete', old.pet_id, old.name, old.species, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_fts_au AFTER UPDATE OF name, species, description ON pets BEGIN
+        INSERT INTO pets_fts(pets_fts, rowid, name, species, description)
+        VALUES ('delete', old.pet_id, old.name, old.species, old.description);
+        INSERT INTO pets_fts(rowid, name, species, description)
+        VALUES (new.pet_id, new.name, new.species, new.description);
+    END
+    """,
+]
+
+
+def ensure_pet_search_index(engine: Engine) -> None:
+    """
+    Create Pet Search Index
+    -----------------------
+    SQLite: creates the FTS5 table and its sync triggers if they don't exist
+    yet. When the table is new, it is populated from the existing pets rows.
+
+    PostgreSQL: creates the GIN index over the weighted tsvector expression.
+
+    Args:
+        engine: SQLAlchemy engine for the application database
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_pets_search ON pets USING GIN ({_PG_VECTOR.replace('pets.', '')})"
+            ))
+        return
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pets_fts'")
+        ).first()
+
+        for statement in _DDL:
+            conn.execute(text(statement))
+
+        # Index pets that were created before search existed
+        if not exists:
+            conn.execute(text("INSERT INTO pets_fts(pets_fts) VALUES ('rebuild')"))
+
+
+def build_match_query(q: str, dialect: str = "sqlite") -> str:
+    """
+    Convert free text typed by a user into a safe full-text query expression.
+
+    Every word becomes a prefix term, so punctuation and query operators in the
+    input can't cause syntax errors, and partially typed words match.
+
+    Example:
+        build_match_query('golden retr') -> '"golden"* "retr"*'                 (FTS5 MATCH)
+        build_match_query('golden retr', 'postgresql') -> 'golden:* & retr:*'   (to_tsquery)
+    """
+    terms = re.findall(r"\w+", q)
+    if dialect == "postgresql":
+        return " & ".join(f"{term}:*" for term in terms)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+async def search_pets(
+        db: AsyncSession,
+        q: str,
+        limit: int,
+        after: tuple[float, int] | None = None,
+        species: str | None = None,
+        status: str | None = None,
+        location_id: int | None = None,
+) -> list[tuple[Pet, float]]:
+    """
+    Search Pets
+    -----------
+    Returns pets matching the query, best matches first.
+
+    Args:
+        db: Database session
+        q: Free-text search query
+        limit: Maximum number of pets to return
+        after: (score, pet_id) of the last pet on the previous page
+        species / status / location_id: Optional GET /pets filters
+
+    Returns:
+        List[tuple[Pet, float]]: Matching pets with their relevance score,
+        ordered by relevance (ties newest first)
+    """
+    dialect = db.get_bind().dialect.name
+    match = build_match_query(q, dialect)
+    if not match:
+        return []
+
+    params = {"match": match, "limit": limit}
+    filters = []
+    for name, value in (("species", species), ("status", status), ("location_id", location_id)):
+        if value is not None and value != "":
+            filters.append(f"pets.{name} = :{name}")
+            params[name] = value
+
+    # PostgreSQL: higher ts_rank is better; SQLite: lower bm25 is better
+    if dialect == "postgresql":
+        worse, order = "<", "DESC"
+        hits = (
+            f"SELECT pets.*, ts_rank({_PG_VECTOR}, query) AS score "
+            "FROM pets, to_tsquery('english', :match) AS query "
+            f"WHERE {_PG_VECTOR} @@ query"
+        )
+    else:
+        worse, order = ">", "ASC"
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        hits = (
+            f"SELECT pets.*, bm25(pets_fts, {weights}) AS score FROM pets_fts "
+            "JOIN pets ON pets.pet_id = pets_fts.rowid "
+            "WHERE pets_fts MATCH :match"
+        )
+    hits += "".join(f" AND {condition}" for condition in filters)
+
+    page_filter = ""
+    if after is not None:
+        page_filter = (
+            f"WHERE score {worse} :after_score "
+            "OR (score = :after_score AND pet_id < :after_pet_id) "
+        )
+        params["after_score"], params["after_pet_id"] = after
+
+    statement = text(
+        f"SELECT * FROM ({hits}) AS hits {page_filter}"
+        f"ORDER BY score {order}, pet_id DESC LIMIT :limit"
+    )
+    result = await db.execute(select(Pet, column("score", Float)).from_statement(statement), params)
+    return [(pet, score) for pet, score in result]
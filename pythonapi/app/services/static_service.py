@@ -0,0 +1,234 @@
+"""
+Upload Static Files
+-------------------
+Serves /uploads with cache-friendly headers.
+
+Features:
+    - Content-addressed files (named after their SHA-256, see files_service)
+      never change, so they are sent with
+      "Cache-Control: public, max-age=31536000, immutable" and repeat
+      visitors don't re-request them at all
+    - Strong ETags derived from the content hash, identical on every API node
+      (other files keep Starlette's size/mtime ETag and a short max-age)
+    - Last-Modified, If-None-Match / If-Modified-Since (304) and byte ranges
+      (206), as provided by Starlette's FileResponse
+    - Alternate formats: if "<name>.avif" or "<name>.webp" exists next to a
+      JPG/PNG (see image_service), the smallest file among the original and
+      the formats the client's Accept header lists is served (Vary: Accept)
+    - Precompressed files: "<file>.br" / "<file>.gz" are served with the
+      matching Content-Encoding when Accept-Encoding allows
+      (Vary: Accept-Encoding)
+    - Dot files and directories (the .tmp spool directory) and tmp_* files
+      are never served
+
+With STORAGE_BACKEND=s3, UploadRedirects takes the place of UploadStaticFiles:
+it picks the format the same way (one LIST request) and answers with a 307
+to the object's public or presigned URL, so the bytes never pass through
+the API.
+"""
+
+import mimetypes
+import os
+import re
+import stat
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+from app import config
+
+# "<sha256>.<ext>" or "<sha256>.<variant>.<ext>"
+CONTENT_ADDRESSED = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]+)+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Alternate image formats: (file extension, media type)
+ALTERNATE_FORMATS = ((".avif", "image/avif"), (".webp", "image/webp"))
+ALTERNATE_SOURCES = {".jpg", ".jpeg", ".png"}
+
+# Precompressed siblings, best first: (file suffix, content coding)
+PRECOMPRESSED = ((".br", "br"), (".gz", "gzip"))
+
+
+def hidden(path: str) -> bool:
+    """
+    Check whether a request path points into a dot directory or at a spool
+    file, which /uploads must not expose.
+
+    Example:
+        hidden(".tmp/tmp_x1y2") -> True; hidden("ab/12/ab12....jpg") -> False
+    """
+    parts = path.replace(os.sep, "/").split("/")
+    return any(part.startswith(".") for part in parts) or parts[-1].startswith("tmp_")
+
+
+def alternates(path: str) -> list[tuple[str, str]]:
+    """
+    Alternate-format candidates for a JPG/PNG path: (path, media type).
+
+    Example:
+        alternates("ab/12/ab12....card.jpg") -> [("ab/12/ab12....card.avif", "image/avif"), ...]
+    """
+    stem, ext = os.path.splitext(path)
+    if ext.lower() not in ALTERNATE_SOURCES:
+        return []
+    return [(stem + alt_ext, alt_type) for alt_ext, alt_type in ALTERNATE_FORMATS]
+
+
+def accepts(header: str, token: str) -> bool:
+    """
+    Check whether an Accept / Accept-Encoding header explicitly lists a token
+    with a non-zero quality. Wildcards don't count: browsers that support AVIF
+    or WebP name them explicitly.
+
+    Example:
+        accepts("image/avif,image/webp,*/*;q=0.8", "image/webp") -> True
+    """
+    for part in header.split(","):
+        value, *params = part.split(";")
+        if value.strip().lower() != token:
+            continue
+        for param in params:
+            name, _, q = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(q) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class UploadStaticFiles(StaticFiles):
+    """StaticFiles for the uploads directory with negotiation and long-lived caching."""
+
+    def _select(self, path: str, request_headers: Headers):
+        """
+        Pick the file to send for a request path (runs in a worker thread).
+
+        Returns:
+            (full_path, stat_result, served_path, headers, media_type); stat_result is
+            None when the requested file doesn't exist
+        """
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return full_path, None, path, {}, None
+
+        served = (full_path, stat_result, path)
+        headers = {}
+        media_type = None
+        vary = []
+
+        accept = request_headers.get("accept", "")
+        for alt, alt_type in alternates(path):
+            alt_path, alt_stat = self.lookup_path(alt)
+            if alt_stat is None:
+                continue
+            if "Accept" not in vary:
+                vary.append("Accept")
+            # AVIF usually wins, but not always (e.g. tiny thumbnails)
+            if accepts(accept, alt_type) and alt_stat.st_size < served[1].st_size:
+                served = (alt_path, alt_stat, alt)
+
+        accept_encoding = request_headers.get("accept-encoding", "")
+        for suffix, coding in PRECOMPRESSED:
+            enc_path, enc_stat = self.lookup_path(served[2] + suffix)
+            if enc_stat is None:
+                continue
+            if "Accept-Encoding" not in vary:
+                vary.append("Accept-Encoding")
+            if "content-encoding" not in headers and accepts(accept_encoding, coding):
+                media_type = mimetypes.guess_type(served[2])[0]
+                served = (enc_path, enc_stat, served[2] + suffix)
+                headers["content-encoding"] = coding
+
+        full_path, stat_result, served_path = served
+        name = os.path.basename(served_path)
+        if CONTENT_ADDRESSED.match(name):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+            headers["etag"] = f'"{name}"'
+        else:
+            headers["cache-control"] = f"public, max-age={config.UPLOAD_CACHE_MAX_AGE}"
+        if vary:
+            headers["vary"] = ", ".join(vary)
+        return full_path, stat_result, served_path, headers, media_type
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        if hidden(path):
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        try:
+            full_path, stat_result, _, headers, media_type = await anyio.to_thread.run_sync(
+                self._select, path, request_headers
+            )
+        except PermissionError:
+            raise HTTPException(status_code=401)
+        except (OSError, ValueError):
+            # Over-long names, null bytes and similar can't be stored uploads
+            raise HTTPException(status_code=404)
+
+        if stat_result is None:
+            raise HTTPException(status_code=404)
+
+        response = FileResponse(
+            full_path, stat_result=stat_result, headers=headers, media_type=media_type
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class UploadRedirects(StaticFiles):
+    """/uploads for an object storage backend: redirects to the stored object."""
+
+    def __init__(self, storage):
+        super().__init__(directory=None, check_dir=False)
+        self.storage = storage
+
+    def _select(self, key: str, request_headers: Headers) -> tuple[str | None, dict]:
+        """
+        Pick the object to redirect to (runs in a worker thread).
+
+        Returns:
+            (url, headers); url is None when the requested key doesn't exist
+        """
+        candidates = alternates(key)
+        sizes = self.storage.sizes([key] + [alt for alt, _ in candidates])
+        if key not in sizes:
+            return None, {}
+
+        served = key
+        headers = {}
+        accept = request_headers.get("accept", "")
+        for alt, alt_type in candidates:
+            if alt not in sizes:
+                continue
+            headers["vary"] = "Accept"
+            if accepts(accept, alt_type) and sizes[alt] < sizes[served]:
+                served = alt
+
+        if config.STORAGE_S3_PUBLIC_URL:
+            headers["cache-control"] = f"public, max-age={config.UPLOAD_CACHE_MAX_AGE}"
+        else:
+            # Presigned URLs expire: never let a cached redirect outlive its target
+            max_age = min(config.UPLOAD_CACHE_MAX_AGE, config.STORAGE_S3_URL_EXPIRES // 2)
+            headers["cache-control"] = f"private, max-age={max_age}"
+        return self.storage.url(served), headers
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+
+        key = path.replace(os.sep, "/")
+        if key in (".", "") or key.startswith(".."):
+            raise HTTPException(status_code=404)
+
+        url, headers = await anyio.to_thread.run_sync(self._select, key, Headers(scope=scope))
+        if url is None:
+            raise HTTPException(status_code=404)
+        return RedirectResponse(url, status_code=307, headers=headers)
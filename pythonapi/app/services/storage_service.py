@@ -0,0 +1,313 @@
+"""
+Storage Service
+---------------
+Where uploaded pet photos (and their variants) are kept.
+
+Two backends share one interface, chosen with STORAGE_BACKEND:
+
+    - "local": files under UPLOAD_DIR, served by the API at /uploads
+      (single node / development)
+    - "s3": an S3-compatible object store (AWS S3, MinIO, Ceph, ...), so every
+      API node sees every upload. /uploads redirects to the object, and
+      clients can upload straight to the bucket with a presigned PUT, keeping
+      image bytes off the API workers entirely
+
+Objects are addressed by key, the web path without its "uploads/" prefix
+("ab/12/ab12....jpg", see files_service.content_path). All methods block, so
+async code calls them through run_in_threadpool.
+
+Local development against S3: point STORAGE_S3_ENDPOINT_URL at a MinIO
+container or a moto server (pip install "moto[server]"; moto_server -p 9000)
+and set the usual AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY variables.
+
+Usage:
+    storage = get_storage()
+    storage.store_file("ab/12/ab12....jpg", "/tmp/tmp_x1y2")
+    with storage.local_copy("ab/12/ab12....jpg") as path:
+        Image.open(path)
+"""
+
+import base64
+import errno
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+from app import config
+from app.services.static_service import CONTENT_ADDRESSED, IMMUTABLE_CACHE_CONTROL
+
+# Spool directory of LocalStorage, inside the uploads directory
+TEMP_DIR = ".tmp"
+
+
+class LocalStorage:
+    """Uploads kept in a directory on this machine."""
+
+    kind = "local"
+
+    def __init__(self, root: str):
+        self.root = root
+        # Spool files on the same filesystem so store_file() is a rename, but
+        # in a dot directory that /uploads never serves (see static_service)
+        self.temp_dir = os.path.join(root, TEMP_DIR)
+        os.makedirs(self.temp_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Filesystem path of a key."""
+        return os.path.join(self.root, *key.split("/"))
+
+    def store_file(self, key: str, source: str) -> None:
+        """
+        Store a file under key. The source is moved into place (atomically), so
+        pass a temporary file; if the key already exists its mtime is refreshed
+        instead, so the upload GC's grace period covers the reused file until
+        the new reference is committed.
+        """
+        final = self.path(key)
+        if os.path.abspath(source) == os.path.abspath(final):
+            return
+        if os.path.exists(final):
+            os.utime(final)
+            return
+        os.makedirs(os.path.dirname(final), exist_ok=True)
+        os.chmod(source, 0o644)  # mkstemp creates files readable by the owner only
+        os.replace(source, final)  # readers see the old state or the whole file
+
+    def sizes(self, keys: list[str]) -> dict[str, int]:
+        """Size in bytes of each key that exists (missing keys are left out)."""
+        found = {}
+        for key in keys:
+            try:
+                found[key] = os.stat(self.path(key)).st_size
+            except (OSError, ValueError):
+                pass
+        return found
+
+    @contextmanager
+    def local_copy(self, key: str) -> Iterator[str]:
+        """Filesystem path to read a key from (the file itself, no copy needed)."""
+        path = self.path(key)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), key)
+        yield path
+
+    def iter_objects(self) -> Iterator[tuple[str, int, float]]:
+        """Every stored file as (key, size in bytes, modification time)."""
+        pending = [self.root]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat_result = entry.stat(follow_symlinks=False)
+                        key = os.path.relpath(entry.path, self.root).replace(os.sep, "/")
+                        yield key, stat_result.st_size, stat_result.st_mtime
+
+    def delete(self, keys: list[str]) -> int:
+        """Delete keys, then prune shard directories left empty. Returns the number deleted."""
+        deleted = 0
+        parents = set()
+        for key in keys:
+            path = self.path(key)
+            try:
+                os.remove(path)
+                deleted += 1
+                parents.add(os.path.dirname(path))
+            except FileNotFoundError:
+                pass
+
+        # Deepest directories first, never the root or the spool directory
+        keep = {os.path.abspath(self.root), os.path.abspath(self.temp_dir)}
+        for directory in sorted(parents, key=len, reverse=True):
+            while os.path.abspath(directory) not in keep:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break  # not empty
+                directory = os.path.dirname(directory)
+        return deleted
+
+    def presign_upload(self, key: str, size: int, sha256: str, content_type: str) -> dict:
+        raise NotImplementedError("Direct uploads need STORAGE_BACKEND=s3")
+
+
+class S3Storage:
+    """Uploads kept in an S3-compatible bucket."""
+
+    kind = "s3"
+
+    def __init__(self, bucket: str, endpoint_url: str | None = None, region: str | None = None):
+        try:
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError("STORAGE_BACKEND=s3 needs boto3 (pip install boto3)") from None
+        if not bucket:
+            raise RuntimeError("STORAGE_BACKEND=s3 needs STORAGE_S3_BUCKET")
+
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            config=Config(
+                signature_version="s3v4",
+                # Path-style URLs work with MinIO and moto without wildcard DNS
+                s3={"addressing_style": "path" if endpoint_url else "auto"},
+                max_pool_connections=32,
+            ),
+        )
+        # Files above the threshold are sent as a multipart upload, parts in parallel
+        part_size = config.STORAGE_S3_MULTIPART_MB * 1024 * 1024
+        self.transfer = TransferConfig(multipart_threshold=part_size, multipart_chunksize=part_size)
+        self.temp_dir = config.STORAGE_SPOOL_DIR or tempfile.gettempdir()
+        os.makedirs(self.temp_dir, exist_ok=True)
+
+    def _missing(self, exc) -> bool:
+        return exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def store_file(self, key: str, source: str) -> None:
+        """
+        Upload a local file under key, as a multipart upload above
+        STORAGE_S3_MULTIPART_MB. Keys that already exist hold the same bytes
+        (content addressing), so they are only touched: a server-side copy
+        onto themselves refreshes LastModified for the upload GC's grace period.
+        """
+        extra = {"ContentType": content_type(key)}
+        if CONTENT_ADDRESSED.match(key.rsplit("/", 1)[-1]):
+            extra["CacheControl"] = IMMUTABLE_CACHE_CONTROL
+        if self.sizes([key]):
+            self.client.copy_object(
+                Bucket=self.bucket, Key=key, CopySource={"Bucket": self.bucket, "Key": key},
+                MetadataDirective="REPLACE", **extra,
+            )
+            return
+        self.client.upload_file(source, self.bucket, key, ExtraArgs=extra, Config=self.transfer)
+
+    def sizes(self, keys: list[str]) -> dict[str, int]:
+        """
+        Size in bytes of each key that exists. Keys sharing a photo's hash
+        ("<hash>.jpg", "<hash>.card.webp", ...) are answered with one LIST request.
+        """
+        if not keys:
+            return {}
+        wanted = set(keys)
+        found = {}
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=os.path.commonprefix(keys)):
+            for item in page.get("Contents", ()):
+                if item["Key"] in wanted:
+                    found[item["Key"]] = item["Size"]
+        return found
+
+    @contextmanager
+    def local_copy(self, key: str) -> Iterator[str]:
+        """Download a key to a temporary file for the duration of the block."""
+        from botocore.exceptions import ClientError
+
+        fd, path = tempfile.mkstemp(prefix="tmp_", dir=self.temp_dir)
+        os.close(fd)
+        try:
+            try:
+                self.client.download_file(self.bucket, key, path)
+            except ClientError as exc:
+                # With ENOENT, like a missing local file: the key may just not
+                # be visible yet (direct upload in progress), so jobs retry
+                if self._missing(exc):
+                    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), key) from None
+                raise
+            yield path
+        finally:
+            os.remove(path)
+
+    def iter_objects(self) -> Iterator[tuple[str, int, float]]:
+        """Every object in the bucket as (key, size in bytes, modification time)."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket):
+            for item in page.get("Contents", ()):
+                yield item["Key"], item["Size"], item["LastModified"].timestamp()
+
+    def delete(self, keys: list[str]) -> int:
+        """Delete keys (up to 1000 per request). Returns the number deleted."""
+        deleted = 0
+        for start in range(0, len(keys), 1000):
+            result = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True},
+            )
+            deleted += min(1000, len(keys) - start) - len(result.get("Errors", ()))
+        return deleted
+
+    def url(self, key: str) -> str:
+        """Where clients fetch a key: STORAGE_S3_PUBLIC_URL (e.g. a CDN) or a presigned GET."""
+        if config.STORAGE_S3_PUBLIC_URL:
+            return f"{config.STORAGE_S3_PUBLIC_URL.rstrip('/')}/{key}"
+        return self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=config.STORAGE_S3_URL_EXPIRES,
+        )
+
+    def presign_upload(self, key: str, size: int, sha256: str, content_type: str) -> dict:
+        """
+        Presigned PUT for a direct upload. Length, type and SHA-256 checksum are
+        part of the signature, so the store rejects any other bytes than the
+        ones the client announced (and the content address stays honest).
+
+        Returns:
+            dict: method, url, and the headers the client must send
+        """
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        params = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "ContentLength": size,
+            "ContentType": content_type,
+            "CacheControl": IMMUTABLE_CACHE_CONTROL,
+            "ChecksumSHA256": checksum,
+        }
+        url = self.client.generate_presigned_url(
+            "put_object", Params=params, ExpiresIn=config.STORAGE_PRESIGN_EXPIRES
+        )
+        return {
+            "method": "PUT",
+            "url": url,
+            "headers": {
+                "Content-Type": content_type,
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+                "x-amz-checksum-sha256": checksum,
+            },
+            "expires_in": config.STORAGE_PRESIGN_EXPIRES,
+        }
+
+
+CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+}
+
+
+def content_type(key: str) -> str:
+    """Media type of a stored key from its extension."""
+    return CONTENT_TYPES.get(os.path.splitext(key)[1].lower(), "application/octet-stream")
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> LocalStorage | S3Storage:
+    """
+    The configured backend, created once per process (image job pool
+    processes build their own).
+    """
+    if config.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            config.STORAGE_S3_BUCKET,
+            endpoint_url=config.STORAGE_S3_ENDPOINT_URL,
+            region=config.STORAGE_S3_REGION,
+        )
+    if config.STORAGE_BACKEND != "local":
+        raise RuntimeError(f"Unknown STORAGE_BACKEND {config.STORAGE_BACKEND!r} (use local or s3)")
+    return LocalStorage(config.UPLOAD_DIR)
@@ -0,0 +1,159 @@
+"""
+Upload GC Service
+-----------------
+Finds and removes uploads that nothing references, in whichever storage
+backend is configured (uploads directory or S3 bucket).
+
+Photos become orphaned when update_pet replaces them or delete_pet removes the
+pet, and aborted uploads can leave tmp_* files behind. collect_garbage():
+
+    - loads every referenced upload (Pet.photo_url, Pet.photo_variants and
+      queued ImageJob photos) in one pass
+    - lists every stored object and treats a content-addressed one as
+      referenced when it shares its content hash with a referenced file
+      ("<sha256>.card.webp" belongs to "<sha256>.jpg")
+    - only ever deletes content-addressed files and tmp_* spool files;
+      anything else (older uploads named after the original file, the
+      sample photos shipped in app/uploads) is left alone
+    - skips anything modified within the grace period, so uploads whose pet
+      row isn't committed yet are never touched
+    - deletes in batches (optionally pausing between them); the local
+      backend also removes shard directories left empty
+
+Run it from the command line (python -m app.upload_gc) or periodically from
+the API by setting UPLOAD_GC_INTERVAL_MINUTES.
+"""
+
+import asyncio
+import logging
+import time
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from app import config
+from app.schemas.models import ImageJob, Pet
+from app.services.static_service import CONTENT_ADDRESSED
+
+logger = logging.getLogger(__name__)
+
+
+def reference_key(name: str) -> str:
+    """
+    Key shared by a content-addressed upload and all files derived from it.
+
+    Example:
+        reference_key("3fa2...9c.card.webp") -> "3fa2...9c"
+    """
+    return name.split(".", 1)[0]
+
+
+def load_references(engine: Engine) -> set[str]:
+    """Reference keys of every upload the database still points at."""
+    urls = []
+    with engine.connect() as conn:
+        for photo_url, variants in conn.execute(select(Pet.photo_url, Pet.photo_variants)):
+            if photo_url:
+                urls.append(photo_url)
+            if variants:
+                urls.extend(variants.values())
+        # Queued/running jobs: their pet row may not point at the photo for long
+        urls.extend(conn.execute(
+            select(ImageJob.photo_url).where(ImageJob.status != "failed")
+        ).scalars())
+    return {reference_key(url.rsplit("/", 1)[-1]) for url in urls}
+
+
+def find_orphans(storage, references: set[str], grace_seconds: float) -> list[tuple[str, int]]:
+    """
+    List the stored objects that are unreferenced and older than the grace period.
+
+    Returns:
+        list: (key, size in bytes) of each orphaned object
+    """
+    cutoff = time.time() - grace_seconds
+    orphans = []
+    for key, size, mtime in storage.iter_objects():
+        if mtime > cutoff:
+            continue
+        name = key.rsplit("/", 1)[-1]
+        if name.startswith("tmp_"):
+            orphans.append((key, size))
+        elif CONTENT_ADDRESSED.match(name) and reference_key(name) not in references:
+            orphans.append((key, size))
+    return orphans
+
+
+def delete_in_batches(storage, keys: list[str], batch_size: int, pause_seconds: float = 0.0) -> int:
+    """
+    Delete objects batch by batch.
+
+    Returns:
+        int: Number of objects deleted
+    """
+    deleted = 0
+    for start in range(0, len(keys), batch_size):
+        deleted += storage.delete(keys[start:start + batch_size])
+        if pause_seconds and start + batch_size < len(keys):
+            time.sleep(pause_seconds)
+    return deleted
+
+
+def collect_garbage(
+        engine: Engine,
+        storage,
+        grace_hours: float = config.UPLOAD_GC_GRACE_HOURS,
+        batch_size: int = config.UPLOAD_GC_BATCH_SIZE,
+        dry_run: bool = True,
+        pause_seconds: float = 0.0,
+) -> dict:
+    """
+    Collect Garbage
+    ---------------
+    Find (and unless dry_run, delete) orphaned uploads.
+
+    Args:
+        engine: SQLAlchemy engine for the application database
+        storage: Storage backend holding the uploads (storage_service.get_storage())
+        grace_hours: Files modified more recently than this are kept
+        batch_size: Files deleted per batch
+        dry_run: Only report what would be deleted
+        pause_seconds: Sleep between batches to limit disk load
+
+    Returns:
+        dict: Report with scanned references, orphan count, bytes, deleted count
+              and the orphaned keys
+
+    Example:
+        collect_garbage(engine, get_storage())                 # dry run
+        collect_garbage(engine, get_storage(), dry_run=False)  # delete
+    """
+    references = load_references(engine)
+    orphans = find_orphans(storage, references, grace_hours * 3600)
+    keys = [key for key, _ in orphans]
+
+    deleted = 0
+    if not dry_run:
+        deleted = delete_in_batches(storage, keys, batch_size, pause_seconds)
+
+    return {
+        "dry_run": dry_run,
+        "referenced": len(references),
+        "orphans": len(orphans),
+        "orphan_bytes": sum(size for _, size in orphans),
+        "deleted": deleted,
+        "files": sorted(keys),
+    }
+
+
+async def run_periodically(engine: Engine, storage, interval_minutes: float) -> None:
+    """Delete orphaned uploads every interval_minutes (started from the API lifespan)."""
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            report = await asyncio.to_thread(
+                collect_garbage, engine, storage, dry_run=False, pause_seconds=0.05
+            )
+            if report["deleted"]:
+                logger.info("Upload GC deleted %s files (%s bytes)",
+                            report["deleted"], report["orphan_bytes"])
+        except Exception:
+            logger.exception("Upload GC failed")
@@ -0,0 +1,60 @@
+"""
+Upload Garbage Collector
+------------------------
+Reports (and optionally deletes) uploads that no pet references any more:
+replaced or deleted pet photos, their variants, and leftover tmp_* files from
+aborted uploads. Only content-addressed photos are considered, so files
+named after their original (like the sample photos) are always kept. Works
+on the configured storage backend (STORAGE_BACKEND).
+
+Usage:
+    python -m app.upload_gc                      # dry run: list what would be deleted
+    python -m app.upload_gc --delete             # delete orphaned files
+    python -m app.upload_gc --grace-hours 1 --batch-size 200 --delete
+
+Files modified within the grace period (UPLOAD_GC_GRACE_HOURS, default 24)
+are always kept. Like seed.py, this expects the database tables to exist
+(start the backend once first).
+"""
+
+import argparse
+from app import config
+from app.db import engine
+from app.services.storage_service import get_storage
+from app.services.upload_gc_service import collect_garbage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove unreferenced uploads from the configured storage")
+    parser.add_argument("--delete", action="store_true", help="delete orphans (default: dry run)")
+    parser.add_argument("--grace-hours", type=float, default=config.UPLOAD_GC_GRACE_HOURS,
+                        help="keep files modified within this many hours")
+    parser.add_argument("--batch-size", type=int, default=config.UPLOAD_GC_BATCH_SIZE,
+                        help="files deleted per batch")
+    parser.add_argument("--pause", type=float, default=0.0,
+                        help="seconds to sleep between batches")
+    parser.add_argument("--quiet", action="store_true", help="don't list individual files")
+    args = parser.parse_args()
+
+    report = collect_garbage(
+        engine,
+        get_storage(),
+        grace_hours=args.grace_hours,
+        batch_size=args.batch_size,
+        dry_run=not args.delete,
+        pause_seconds=args.pause,
+    )
+
+    if not args.quiet:
+        for name in report["files"]:
+            print(f"  {name}")
+    mb = report["orphan_bytes"] / (1024 * 1024)
+    if report["dry_run"]:
+        print(f"\n{report['orphans']} orphaned files ({mb:.1f} MB) would be deleted")
+        print("Run again with --delete to remove them")
+    else:
+        print(f"\nDeleted {report['deleted']} of {report['orphans']} orphaned files ({mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Tests for GET /applications/events (Server-Sent Events): resuming with
+Last-Event-ID, per-user visibility and the reset event.
+"""
+
+import json
+from collections import deque
+import pytest
+from fastapi.testclient import TestClient
+from app import config
+from app.main import app
+from app.services.application_events_service import RESET, application_events
+
+
+@pytest.fixture(autouse=True)
+def short_streams(monkeypatch):
+    """End each stream after a moment, so a test can read the whole response."""
+    monkeypatch.setattr(config, "APPLICATION_EVENTS_MAX_SECONDS", 0.3)
+
+
+def read_events(client, header: str | None = None, **params) -> list[dict]:
+    """
+    The events of one stream, resumed from the Last-Event-ID header if given,
+    as {"id", "event", "data"} dicts (retry and comment lines left out).
+    """
+    headers = {"Last-Event-ID": header} if header else {}
+    response = client.get("/applications/events", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in response.text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append({**fields, "data": json.loads(fields["data"])})
+    return events
+
+
+def last_id() -> str:
+    return application_events.event_id(application_events.sequence)
+
+
+def test_resume_replays_exactly_the_missed_events(login, apply, make_pet):
+    admin, alice = login("admin"), login("alice")
+    rex, tom = make_pet("Rex"), make_pet("Tom")
+    first = apply(alice, rex)
+    seen = last_id()
+
+    admin.patch(f"/applications/{first['application_id']}", json={"status": "approved"})
+    second = apply(alice, tom)
+
+    events = read_events(admin, seen)
+    assert [(e["event"], e["data"]["application_id"]) for e in events] == [
+        ("application.updated", first["application_id"]),
+        ("application.created", second["application_id"]),
+    ]
+    assert events[0]["data"]["previous_status"] == "pending"
+    assert events[-1]["id"] == last_id()
+    # Resuming from the newest id replays nothing
+    assert read_events(admin, last_id()) == []
+
+
+def test_resume_only_replays_the_users_own_events(login, apply, make_pet):
+    alice, bob = login("alice"), login("bob")
+    rex = make_pet("Rex")
+    seen = last_id()
+
+    apply(alice, rex)
+    own = apply(bob, rex)
+
+    assert [e["data"]["application_id"] for e in read_events(bob, seen)] == [own["application_id"]]
+
+
+def test_query_parameter_resumes_and_the_header_wins(login, apply, make_pet):
+    admin, alice = login("admin"), login("alice")
+    seen = last_id()
+    apply(alice, make_pet("Rex"))
+    latest = last_id()
+
+    assert len(read_events(admin, last_event_id=seen)) == 1
+    assert len(read_events(admin, latest, last_event_id=seen)) == 0
+
+
+@pytest.mark.parametrize("event_id", ["0000-1", "not-an-id", "stale"])
+def test_unknown_id_gets_a_reset(login, event_id):
+    events = read_events(login("admin"), event_id)
+
+    assert [e["event"] for e in events] == [RESET]
+    assert events[0]["id"] == last_id()
+
+
+def test_id_older_than_the_buffer_gets_a_reset(login, apply, make_pet, monkeypatch):
+    monkeypatch.setattr(application_events, "buffer", deque(maxlen=1))
+    admin, alice = login("admin"), login("alice")
+    apply(alice, make_pet("Rex"))
+    seen = last_id()
+    apply(alice, make_pet("Tom"))
+    apply(alice, make_pet("Bo"))
+
+    assert [e["event"] for e in read_events(admin, seen)] == [RESET]
+
+
+def test_stream_requires_login():
+    with TestClient(app) as client:
+        assert client.get("/applications/events").status_code == 401
@@ -0,0 +1,72 @@
+"""
+Tests for GET /applications (keyset pages in either order, filters, visibility).
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from app.db import engine
+from app.schemas.models import Application
+
+
+def pet_names(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [app["pet_name"] for app in response.json()]
+
+
+def all_pages(client, **params) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        response = client.get("/applications", params=params | ({"cursor": cursor} if cursor else {}))
+        pages.append(pet_names(response))
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+def submitted_days_apart(login, apply, make_pet, names) -> None:
+    """Alice applies for each named pet, one day apart, the first one oldest."""
+    alice = login("alice")
+    applications = [apply(alice, make_pet(name)) for name in names]
+    start = datetime(2024, 5, 1, 9, 0)
+    with engine.begin() as conn:
+        for day, application in enumerate(applications):
+            conn.execute(
+                update(Application)
+                .where(Application.application_id == application["application_id"])
+                .values(application_date=start + timedelta(days=day))
+            )
+
+
+def test_pages_newest_or_oldest_first(login, apply, make_pet):
+    submitted_days_apart(login, apply, make_pet, ["A", "B", "C", "D", "E"])
+    admin = login("admin")
+
+    assert all_pages(admin, limit=2) == [["E", "D"], ["C", "B"], ["A"]]
+    assert all_pages(admin, limit=2, order="oldest") == [["A", "B"], ["C", "D"], ["E"]]
+
+
+def test_pending_queue_longest_waiting_first(login, apply, make_pet):
+    submitted_days_apart(login, apply, make_pet, ["A", "B", "C", "D"])
+    admin = login("admin")
+    b = next(app for app in admin.get("/applications").json() if app["pet_name"] == "B")
+    admin.patch(f"/applications/{b['application_id']}", json={"status": "approved"})
+
+    pages = all_pages(admin, status="pending", order="oldest", view="summary", limit=2)
+
+    assert pages == [["A", "C"], ["D"]]
+
+
+def test_users_page_through_their_own_applications(login, apply, make_pet):
+    submitted_days_apart(login, apply, make_pet, ["A", "B", "C"])
+    bob = login("bob")
+    apply(bob, make_pet("Z"))
+
+    assert all_pages(bob, limit=1) == [["Z"]]
+    assert all_pages(login("alice"), limit=2) == [["C", "B"], ["A"]]
+
+
+def test_malformed_cursor_is_rejected(login):
+    admin = login("admin")
+
+    assert admin.get("/applications", params={"cursor": "yesterday"}).status_code == 400
+    assert admin.get("/applications", params={"order": "random"}).status_code == 422
@@ -0,0 +1,107 @@
+"""
+Tests for the application stats counters: upserts on every write, the
+reconcile rebuild, and the GET /applications/stats endpoints.
+"""
+
+import pytest
+from sqlalchemy import delete
+from app.db import engine
+from app.schemas.models import ApplicationCount, ApplicationDailyCount
+from app.services.application_stats_service import reconcile
+
+
+def test_counters_follow_application_writes(login, apply, make_pet, counter_rows):
+    admin, alice, bob = login("admin"), login("alice"), login("bob")
+    rex, tom = make_pet("Rex"), make_pet("Tom", species="Cat")
+
+    first = apply(alice, rex)
+    second = apply(bob, rex)
+    third = apply(alice, tom)
+    assert admin.patch(f"/applications/{first['application_id']}", json={"status": "approved"}).status_code == 200
+    assert admin.patch(f"/applications/{second['application_id']}", json={"status": "rejected"}).status_code == 200
+    assert admin.patch(f"/applications/{third['application_id']}", json={"admin_notes": "Call back"}).status_code == 200
+    assert admin.delete(f"/applications/{second['application_id']}").status_code == 200
+
+    assert admin.get("/applications/stats").json() == {"pending": 1, "approved": 1, "rejected": 0, "total": 2}
+    by_pet = {row["pet_name"]: row for row in admin.get("/applications/stats/pets").json()}
+    assert by_pet["Rex"]["approved"] == 1 and by_pet["Rex"]["total"] == 1
+    assert by_pet["Tom"]["pending"] == 1 and by_pet["Tom"]["total"] == 1
+
+    # The incrementally maintained rows equal a rebuild from scratch
+    maintained = counter_rows()
+    reconcile(engine)
+    assert counter_rows() == maintained
+
+
+def test_counter_writes_are_upserts(login, apply, make_pet, sql_log):
+    apply(login("alice"), make_pet("Rex"))
+
+    upserts = [s for s in sql_log if s.lstrip().upper().startswith("INSERT INTO APPLICATION_COUNTS")]
+    assert upserts and all("ON CONFLICT (pet_id, status) DO UPDATE" in s for s in upserts)
+    daily = [s for s in sql_log if s.lstrip().upper().startswith("INSERT INTO APPLICATION_DAILY_COUNTS")]
+    assert daily and all("ON CONFLICT (day, event) DO UPDATE" in s for s in daily)
+
+
+def test_cascaded_deletes_update_counters(login, apply, make_pet, counter_rows):
+    admin, alice, bob = login("admin"), login("alice"), login("bob")
+    rex, tom, max_ = make_pet("Rex"), make_pet("Tom"), make_pet("Max")
+    apply(alice, rex)
+    apply(bob, rex)
+    apply(alice, tom)
+    apply(bob, max_)
+
+    assert admin.delete(f"/pets/{rex.pet_id}").status_code == 200
+    assert admin.get("/applications/stats").json()["total"] == 2
+    assert admin.post("/pets/bulk-delete", json={"pet_ids": [tom.pet_id]}).status_code == 200
+    assert admin.get("/applications/stats").json()["total"] == 1
+
+    maintained = counter_rows()
+    reconcile(engine)
+    assert counter_rows() == maintained
+
+
+def test_reconcile_rebuilds_lost_counters(login, apply, make_pet):
+    admin, alice = login("admin"), login("alice")
+    application = apply(alice, make_pet("Rex"))
+    admin.patch(f"/applications/{application['application_id']}", json={"status": "approved"})
+    apply(alice, make_pet("Tom"))
+    expected = admin.get("/applications/stats").json()
+
+    with engine.begin() as conn:
+        conn.execute(delete(ApplicationCount))
+        conn.execute(delete(ApplicationDailyCount))
+
+    report = reconcile(engine)
+
+    assert report == {"applications": 2, "pets": 2, "days": 1}
+    assert admin.get("/applications/stats").json() == expected
+
+
+@pytest.mark.postgresql
+def test_postgresql_reconcile_locks_the_counter_tables(sql_log):
+    reconcile(engine)
+
+    # Concurrent counter writes wait for the rebuild instead of being lost
+    locks = [s for s in sql_log if s.startswith("LOCK TABLE")]
+    assert len(locks) == 1
+    assert "application_counts" in locks[0] and "application_daily_counts" in locks[0]
+
+
+@pytest.mark.sqlite
+def test_sqlite_reconcile_needs_no_lock(sql_log):
+    reconcile(engine)
+
+    # SQLite has a single writer, so the rebuild transaction already excludes other writes
+    assert not any(s.startswith("LOCK TABLE") for s in sql_log)
+
+
+def test_applicants_get_their_own_counts(login, apply, make_pet):
+    alice, bob = login("alice"), login("bob")
+    rex, tom = make_pet("Rex"), make_pet("Tom")
+    apply(alice, rex)
+    apply(alice, tom)
+    apply(bob, rex)
+
+    assert alice.get("/applications/stats").json() == {"pending": 2, "approved": 0, "rejected": 0, "total": 2}
+    assert bob.get("/applications/stats").json()["total"] == 1
+    assert bob.get("/applications/stats/pets").status_code == 403
@@ -0,0 +1,111 @@
+"""
+Tests for the admin bulk operations POST /pets/bulk-approve and POST /pets/bulk-delete.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from app.db import SessionLocal
+from app.schemas.models import Application, Favorite, ImageJob, Location, Pet
+
+
+def statuses() -> dict[str, str]:
+    with SessionLocal() as db:
+        return {pet.name: pet.status for pet in db.scalars(select(Pet))}
+
+
+def count(model) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.fixture
+def second_location() -> Location:
+    with SessionLocal(expire_on_commit=False) as db:
+        location = Location(name="Airport Kennel", address="2 Runway Rd", phone="306-555-0101")
+        db.add(location)
+        db.commit()
+    return location
+
+
+def test_approve_by_ids_reports_missing_ids(login, make_pet):
+    admin = login("admin")
+    rex, tom = make_pet("Rex", status="pending"), make_pet("Tom", status="approved")
+    make_pet("Bo", status="pending")
+
+    response = admin.post("/pets/bulk-approve", json={"pet_ids": [rex.pet_id, tom.pet_id, 999]})
+
+    assert response.status_code == 200, response.text
+    # Tom was already approved: found, but not counted
+    assert response.json() == {"approved": 1, "not_found": [999]}
+    assert statuses() == {"Rex": "approved", "Tom": "approved", "Bo": "pending"}
+
+
+def test_approve_by_filter(login, make_pet, second_location):
+    admin = login("admin")
+    make_pet("Rex", status="pending")
+    make_pet("Tom", species="Cat", status="pending")
+    with SessionLocal() as db:
+        db.add(Pet(name="Bo", species="Dog", age=2, status="pending", location_id=second_location.location_id))
+        db.commit()
+
+    response = admin.post("/pets/bulk-approve", json={
+        "status": "pending", "species": "Dog", "location_id": second_location.location_id,
+    })
+
+    assert response.json() == {"approved": 1, "not_found": []}
+    assert statuses() == {"Rex": "pending", "Tom": "pending", "Bo": "approved"}
+    assert [pet["name"] for pet in admin.get("/pets", params={"status": "approved"}).json()] == ["Bo"]
+
+
+def test_delete_cascades_to_applications_and_favorites(login, make_pet, apply):
+    admin, alice, bob = login("admin"), login("alice"), login("bob")
+    rex, tom, bo = make_pet("Rex"), make_pet("Tom"), make_pet("Bo")
+    for client in (alice, bob):
+        apply(client, rex)
+        assert client.post(f"/favorites/{rex.pet_id}").status_code == 200
+    apply(alice, bo)
+    alice.post(f"/favorites/{bo.pet_id}")
+    with SessionLocal() as db:
+        db.add(ImageJob(pet_id=tom.pet_id, photo_url="uploads/ab/cd/tom.jpg"))
+        db.commit()
+
+    response = admin.post("/pets/bulk-delete", json={"pet_ids": [rex.pet_id, tom.pet_id, 999]})
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "pets": 2, "applications": 2, "favorites": 2, "image_jobs": 1, "not_found": [999],
+    }
+    assert statuses() == {"Bo": "approved"}
+    assert (count(Application), count(Favorite), count(ImageJob)) == (1, 1, 0)
+    assert admin.get("/applications/stats").json()["total"] == 1
+    assert admin.get(f"/pets/{rex.pet_id}").status_code == 404
+
+
+def test_delete_by_filter(login, make_pet):
+    admin = login("admin")
+    make_pet("Rex", status="pending")
+    make_pet("Tom", species="Cat", status="pending")
+    make_pet("Bo")
+
+    response = admin.post("/pets/bulk-delete", json={"status": "pending", "species": "Dog"})
+
+    assert response.json()["pets"] == 1
+    assert statuses() == {"Tom": "pending", "Bo": "approved"}
+
+
+@pytest.mark.parametrize("path", ["/pets/bulk-approve", "/pets/bulk-delete"])
+def test_empty_selection_is_rejected(login, make_pet, path):
+    admin = login("admin")
+    make_pet("Rex", status="pending")
+
+    assert admin.post(path, json={}).status_code == 400
+    assert admin.post(path, json={"pet_ids": []}).status_code == 422
+    assert statuses() == {"Rex": "pending"}
+
+
+@pytest.mark.parametrize("path", ["/pets/bulk-approve", "/pets/bulk-delete"])
+def test_bulk_operations_are_admin_only(login, make_pet, path):
+    rex = make_pet("Rex", status="pending")
+
+    assert login("alice").post(path, json={"pet_ids": [rex.pet_id]}).status_code == 403
+    assert statuses() == {"Rex": "pending"}
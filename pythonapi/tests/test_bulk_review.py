@@ -0,0 +1,73 @@
+"""
+Tests for POST /applications/bulk-review.
+"""
+
+import pytest
+from app.db import engine
+from app.services.application_stats_service import reconcile
+
+
+def test_approve_rejects_other_pending_applications(login, apply, make_pet, counter_rows):
+    admin, alice, bob = login("admin"), login("alice"), login("bob")
+    rex, tom = make_pet("Rex"), make_pet("Tom")
+    chosen = apply(alice, rex)
+    other = apply(bob, rex)
+    unrelated = apply(alice, tom)
+
+    response = admin.post("/applications/bulk-review", json={
+        "application_ids": [chosen["application_id"], 999999],
+        "status": "approved",
+        "reject_other_pending": True,
+        "rejection_notes": "Rex found a home",
+    })
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"updated": 1, "auto_rejected": 1, "not_found": [999999]}
+    statuses = {
+        app["application_id"]: (app["status"], app["admin_notes"])
+        for app in admin.get("/applications").json()
+    }
+    assert statuses[chosen["application_id"]] == ("approved", None)
+    assert statuses[other["application_id"]] == ("rejected", "Rex found a home")
+    assert statuses[unrelated["application_id"]] == ("pending", None)
+
+    maintained = counter_rows()
+    reconcile(engine)
+    assert counter_rows() == maintained
+
+
+def locked_selects(login, apply, make_pet, sql_log) -> list[str]:
+    """Review one application and return the SELECTs on applications that took row locks."""
+    admin = login("admin")
+    application = apply(login("alice"), make_pet("Rex"))
+    sql_log.clear()
+
+    response = admin.post("/applications/bulk-review", json={
+        "application_ids": [application["application_id"]], "status": "rejected",
+    })
+
+    assert response.status_code == 200, response.text
+    selects = [s for s in sql_log if s.lstrip().upper().startswith("SELECT") and "FROM applications" in s]
+    return [s for s in selects if "FOR UPDATE" in s]
+
+
+@pytest.mark.postgresql
+def test_postgresql_locks_the_reviewed_rows(login, apply, make_pet, sql_log):
+    assert len(locked_selects(login, apply, make_pet, sql_log)) == 1
+
+
+@pytest.mark.sqlite
+def test_sqlite_reviews_without_row_locks(login, apply, make_pet, sql_log):
+    # SQLite has no row locks (one writer at a time), so the clause is left out there
+    assert locked_selects(login, apply, make_pet, sql_log) == []
+
+
+def test_bulk_review_requires_admin(login, apply, make_pet):
+    alice = login("alice")
+    application = apply(alice, make_pet("Rex"))
+
+    response = alice.post("/applications/bulk-review", json={
+        "application_ids": [application["application_id"]], "status": "approved",
+    })
+
+    assert response.status_code == 403
@@ -0,0 +1,52 @@
+"""
+Tests for the in-process catalog response cache and its invalidation on writes.
+"""
+
+from app.services.cache_service import catalog_cache
+
+
+def pet_reads(sql_log) -> list[str]:
+    return [s for s in sql_log if s.lstrip().upper().startswith("SELECT") and "FROM pets" in s]
+
+
+def test_repeat_reads_are_served_from_the_cache(login, make_pet, sql_log):
+    client = login("alice")
+    pet = make_pet("Rex")
+    first = client.get("/pets").content
+    client.get(f"/pets/{pet.pet_id}")
+    sql_log.clear()
+    hits = catalog_cache.stats()["hits"]
+
+    assert client.get("/pets").content == first
+    client.get(f"/pets/{pet.pet_id}")
+
+    # Only the version lookup for the ETag reaches the database
+    assert pet_reads(sql_log) == []
+    assert catalog_cache.stats()["hits"] == hits + 2
+
+
+def test_pet_writes_invalidate_cached_pages(login, make_pet):
+    admin = login("admin")
+    rex = make_pet("Rex", status="pending")
+    tom = make_pet("Tom")
+    admin.get("/pets")
+    admin.get(f"/pets/{rex.pet_id}")
+    admin.get("/pets/count", params={"status": "approved"})
+
+    admin.patch(f"/pets/{rex.pet_id}/approve")
+    assert admin.get(f"/pets/{rex.pet_id}").json()["status"] == "approved"
+    assert admin.get("/pets/count", params={"status": "approved"}).json() == {"count": 2}
+
+    admin.delete(f"/pets/{tom.pet_id}")
+    assert [pet["name"] for pet in admin.get("/pets").json()] == ["Rex"]
+    assert admin.get(f"/pets/{tom.pet_id}").status_code == 404
+
+
+def test_location_writes_invalidate_the_location_list(login, location):
+    admin = login("admin")
+    assert [loc["name"] for loc in admin.get("/locations").json()] == ["Downtown Shelter"]
+
+    response = admin.post("/locations", json={"name": "Airport Kennel", "address": "2 Runway Rd", "phone": "306-555-0101"})
+    assert response.status_code == 200, response.text
+
+    assert [loc["name"] for loc in admin.get("/locations").json()] == ["Airport Kennel", "Downtown Shelter"]
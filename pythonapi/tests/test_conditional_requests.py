@@ -0,0 +1,47 @@
+"""
+Tests for ETag / If-None-Match on the catalog reads (GET /pets, /pets/{id}, /locations).
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/pets", "/pets/count", "/pets/species", "/locations"])
+def test_matching_etag_gets_304(login, make_pet, path):
+    client = login("alice")
+    make_pet("Rex")
+
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    repeat = client.get(path, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200 and first.headers["Cache-Control"] == "no-cache"
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["ETag"] == etag
+
+
+def test_etag_comparison_is_weak_and_accepts_lists(login, make_pet):
+    client = login("alice")
+    pet = make_pet("Rex")
+    etag = client.get(f"/pets/{pet.pet_id}").headers["ETag"]
+    strong = etag.removeprefix("W/")
+
+    for header in (strong, f'"stale", {etag}', "*"):
+        assert client.get(f"/pets/{pet.pet_id}", headers={"If-None-Match": header}).status_code == 304
+    assert client.get(f"/pets/{pet.pet_id}", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_pet_write_changes_the_etag(login, make_pet):
+    admin = login("admin")
+    pet = make_pet("Rex", status="pending")
+    etag = admin.get("/pets").headers["ETag"]
+    locations_etag = admin.get("/locations").headers["ETag"]
+
+    assert admin.patch(f"/pets/{pet.pet_id}/approve").status_code == 200
+
+    response = admin.get("/pets", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["status"] == "approved"
+    # Pets and locations are versioned separately
+    assert admin.get("/locations", headers={"If-None-Match": locations_etag}).status_code == 304
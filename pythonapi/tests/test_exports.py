@@ -0,0 +1,93 @@
+"""
+Tests for the streaming CSV/NDJSON exports (GET /pets/export, GET /applications/export).
+"""
+
+import csv
+import io
+import json
+from fastapi.testclient import TestClient
+from app.api.users_endpoints import require_admin
+from app.main import app
+from app.schemas.schemas_auth import UserOut
+
+
+def csv_rows(response) -> list[list[str]]:
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+def ndjson_rows(response) -> list[dict]:
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_pet_csv_has_a_header_and_escapes_formulas(login, make_pet):
+    admin = login("admin")
+    rex = make_pet("Rex", description='=HYPERLINK("http://evil.example")')
+    make_pet("-Tom", species="Cat", status="pending")
+
+    response = admin.get("/pets/export")
+
+    header, *rows = csv_rows(response)
+    assert header == [
+        "pet_id", "name", "species", "age", "description", "status",
+        "location_id", "location_name", "photo_url", "photo_status",
+    ]
+    assert [row[1] for row in rows] == ["Rex", "'-Tom"]
+    assert rows[0][4] == "'=HYPERLINK(\"http://evil.example\")"
+    assert rows[0][0] == str(rex.pet_id) and rows[0][7] == "Downtown Shelter"
+    assert rows[1][4] == ""  # no description
+    assert response.headers["Content-Disposition"].startswith('attachment; filename="pets-')
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_pet_ndjson_applies_the_filters(login, make_pet):
+    admin = login("admin")
+    make_pet("Rex")
+    make_pet("Tom", species="Cat")
+    make_pet("Bo", status="pending")
+
+    rows = ndjson_rows(admin.get("/pets/export", params={"format": "ndjson", "species": "Dog", "status": "approved"}))
+
+    assert [(row["name"], row["age"], row["location_name"]) for row in rows] == [("Rex", 3, "Downtown Shelter")]
+    assert csv_rows(admin.get("/pets/export", params={"species": "Lizard"})) == [csv_rows(admin.get("/pets/export"))[0]]
+
+
+def test_pet_export_is_admin_only(login):
+    assert login("alice").get("/pets/export").status_code == 403
+    with TestClient(app) as anonymous:
+        assert anonymous.get("/pets/export").status_code == 401
+
+
+def test_pet_export_auth_is_an_overridable_dependency(users, make_pet):
+    make_pet("Rex")
+    app.dependency_overrides[require_admin] = lambda: UserOut.model_validate(users["admin"], from_attributes=True)
+    try:
+        with TestClient(app) as client:
+            assert [row["name"] for row in ndjson_rows(client.get("/pets/export", params={"format": "ndjson"}))] == ["Rex"]
+    finally:
+        app.dependency_overrides.pop(require_admin)
+
+
+def test_application_export_shows_users_their_own(login, apply, make_pet, users):
+    admin, alice, bob = login("admin"), login("alice"), login("bob")
+    rex, tom = make_pet("Rex"), make_pet("Tom")
+    apply(alice, rex)
+    apply(alice, tom)
+    apply(bob, rex)
+
+    everything = ndjson_rows(admin.get("/applications/export", params={"format": "ndjson"}))
+    assert [(row["user_email"], row["pet_name"]) for row in everything] == [
+        ("alice@test.ca", "Rex"), ("alice@test.ca", "Tom"), ("bob@test.ca", "Rex"),
+    ]
+    header, *rows = csv_rows(bob.get("/applications/export"))
+    assert "application_message" in header and "admin_notes" in header
+    assert [row[header.index("pet_name")] for row in rows] == ["Rex"]
+    filtered = csv_rows(admin.get("/applications/export", params={"pet_id": tom.pet_id}))
+    assert len(filtered) == 2
+
+    assert bob.get("/applications/export", params={"user_id": users["alice"].user_id}).status_code == 403
+    with TestClient(app) as anonymous:
+        assert anonymous.get("/applications/export").status_code == 401
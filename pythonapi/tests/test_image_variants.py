@@ -0,0 +1,121 @@
+"""
+Tests for variant generation (create_variants) and how the image job worker
+treats its failures: bad image data fails the job, a missing or unreadable
+source leaves it queued for a retry.
+"""
+
+import asyncio
+import errno
+import hashlib
+import os
+import tempfile
+import pytest
+from fastapi import HTTPException
+from PIL import Image
+from app import config
+from app.db import SessionLocal, async_engine
+from app.schemas.models import ImageJob, Pet
+from app.services.files_service import content_path
+from app.services.image_job_service import ImageJobWorker
+from app.services.image_service import create_variants
+from app.services.storage_service import get_storage
+
+
+def run(coroutine):
+    """Run worker code on a fresh event loop, with its own database connections."""
+    async def main():
+        # Pooled connections belong to the test client's event loop
+        await async_engine.dispose(close=False)
+        try:
+            return await coroutine
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def store(data: bytes, ext: str = ".jpg") -> str:
+    """Store bytes at their content address and return the web path."""
+    key = content_path(hashlib.sha256(data).hexdigest(), ext)
+    fd, path = tempfile.mkstemp(prefix="tmp_", dir=get_storage().temp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    get_storage().store_file(key, path)
+    return "uploads/" + key
+
+
+def jpeg(tmp_path, size=(1000, 500)) -> bytes:
+    path = tmp_path / "photo.jpg"
+    Image.new("RGB", size, (10, 120, 200)).save(path, "JPEG")
+    return path.read_bytes()
+
+
+@pytest.fixture
+def queued_job(make_pet):
+    """Factory for a pet whose photo is processing, with its claimed ImageJob."""
+    def _queued_job(photo_url: str) -> ImageJob:
+        pet = make_pet("Rex")
+        with SessionLocal(expire_on_commit=False) as db:
+            row = db.get(Pet, pet.pet_id)
+            row.photo_url, row.photo_status = photo_url, "processing"
+            job = ImageJob(pet_id=pet.pet_id, photo_url=photo_url, status="running", attempts=1)
+            db.add(job)
+            db.commit()
+        return job
+    return _queued_job
+
+
+def job_state(job: ImageJob) -> tuple[str, str, str | None]:
+    """(job status, pet photo_status, last_error) after the worker ran."""
+    with SessionLocal() as db:
+        row = db.get(ImageJob, job.job_id)
+        return row.status, db.get(Pet, job.pet_id).photo_status, row.last_error
+
+
+def test_variants_are_resized_and_reused(tmp_path):
+    photo_url = store(jpeg(tmp_path))
+
+    variants = create_variants(photo_url, get_storage())
+
+    assert set(variants) == set(config.PHOTO_VARIANT_WIDTHS)
+    for name, web_path in variants.items():
+        with Image.open(get_storage().path(web_path.removeprefix("uploads/"))) as im:
+            assert im.width == min(config.PHOTO_VARIANT_WIDTHS[name], 1000)
+    assert create_variants(photo_url, get_storage()) == variants
+
+
+def test_missing_source_is_not_an_invalid_image():
+    photo_url = "uploads/" + content_path("ab" * 32, ".jpg")
+
+    with pytest.raises(FileNotFoundError) as raised:
+        create_variants(photo_url, get_storage())
+
+    assert raised.value.errno == errno.ENOENT
+
+
+def test_undecodable_upload_is_rejected_and_removed():
+    photo_url = store(b"not an image at all")
+
+    with pytest.raises(HTTPException) as raised:
+        create_variants(photo_url, get_storage())
+
+    assert raised.value.status_code == 400
+    assert get_storage().sizes([photo_url.removeprefix("uploads/")]) == {}
+
+
+def test_missing_source_leaves_job_retryable(queued_job):
+    job = queued_job("uploads/" + content_path("cd" * 32, ".jpg"))
+
+    run(ImageJobWorker(processes=1)._process(job))
+
+    status, photo_status, error = job_state(job)
+    assert status == "queued"
+    assert photo_status == "processing"
+    assert "FileNotFoundError" in error
+
+
+def test_undecodable_source_fails_job(queued_job):
+    job = queued_job(store(b"still not an image"))
+
+    run(ImageJobWorker(processes=1)._process(job))
+
+    assert job_state(job) == ("failed", "failed", "Invalid image file")
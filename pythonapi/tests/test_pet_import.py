@@ -0,0 +1,137 @@
+"""
+Tests for the bulk pet import (POST /pets/bulk and pet_import_service).
+"""
+
+import io
+import json
+import zipfile
+from PIL import Image
+from sqlalchemy import select
+from app.db import SessionLocal
+from app.schemas.models import ImageJob, Pet
+
+
+def ndjson(*rows: dict) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def jpeg(color=(10, 120, 200)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (40, 30), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def photo_zip(photos: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in photos.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def imported() -> dict[str, Pet]:
+    with SessionLocal() as db:
+        return {pet.name: pet for pet in db.scalars(select(Pet))}
+
+
+def test_bad_rows_are_reported_by_line_and_skipped(login, location):
+    admin = login("admin")
+    data = (
+        b"name,species,age,description,location_id\n"
+        + f"Rex,Dog,3,Friendly,{location.location_id}\n".encode()
+        + f"Tom,Cat,old,,{location.location_id}\n".encode()
+        + b"Lulu,Cat,2,,999\n"
+        + f"Bo,Dog,5,,{location.location_id}\n".encode()
+    )
+
+    response = admin.post("/pets/bulk", files={"file": ("pets.csv", data)})
+
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert (report["rows"], report["inserted"], report["failed"]) == (4, 2, 2)
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert report["errors"][0]["error"].startswith("age:")
+    assert report["errors"][1]["error"] == "location_id: Unknown location 999"
+    pets = imported()
+    assert set(pets) == {"Rex", "Bo"}
+    assert pets["Rex"].status == "pending" and pets["Rex"].description == "Friendly"
+
+
+def test_dry_run_writes_nothing(login, location):
+    admin = login("admin")
+    data = ndjson({"name": "Rex", "species": "Dog", "age": 3, "location_id": location.location_id}, [1, 2])
+
+    response = admin.post("/pets/bulk", params={"dry_run": True}, files={"file": ("pets.ndjson", data)})
+
+    assert response.json()["errors"] == [{"line": 2, "error": "Expected a JSON object"}]
+    assert response.json()["inserted"] == 0
+    assert imported() == {}
+
+
+def test_photos_are_matched_from_the_archive(login, location):
+    admin = login("admin")
+    loc = location.location_id
+    data = ndjson(
+        {"name": "Rex", "species": "Dog", "age": 3, "location_id": loc, "photo": "rex.jpg"},
+        {"name": "Tom", "species": "Cat", "age": 2, "location_id": loc, "photo": "cats/tom.jpg"},
+        {"name": "Bo", "species": "Dog", "age": 5, "location_id": loc},
+        {"name": "Lulu", "species": "Cat", "age": 1, "location_id": loc, "photo": "lulu.jpg"},
+    )
+    photos = photo_zip({"dogs/rex.jpg": jpeg(), "cats/tom.jpg": jpeg((200, 10, 10))})
+
+    response = admin.post("/pets/bulk", files={
+        "file": ("pets.ndjson", data),
+        "photos": ("photos.zip", photos, "application/zip"),
+    })
+
+    report = response.json()
+    assert (report["inserted"], report["photos"]) == (3, 2)
+    assert report["errors"] == [{"line": 4, "error": "photo: Photo 'lulu.jpg' not in archive"}]
+    pets = imported()
+    # Matched by bare file name or by path inside the archive
+    assert pets["Rex"].photo_url.startswith("uploads/") and pets["Rex"].photo_status == "processing"
+    assert pets["Tom"].photo_url != pets["Rex"].photo_url
+    assert pets["Bo"].photo_url is None
+    with SessionLocal() as db:
+        jobs = {job.pet_id: job.photo_url for job in db.scalars(select(ImageJob))}
+    assert jobs == {pets["Rex"].pet_id: pets["Rex"].photo_url, pets["Tom"].pet_id: pets["Tom"].photo_url}
+
+
+def test_non_utf8_file_is_rejected(login):
+    admin = login("admin")
+    data = "name,species,age,location_id\nZoë,Dog,3,1\n".encode("latin-1")
+
+    response = admin.post("/pets/bulk", files={"file": ("pets.csv", data)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Import file must be UTF-8"
+
+
+def test_unknown_format_and_bad_archive_are_rejected(login, location):
+    admin = login("admin")
+
+    assert admin.post("/pets/bulk", files={"file": ("pets.xlsx", b"x")}).status_code == 400
+    response = admin.post("/pets/bulk", files={
+        "file": ("pets.ndjson", b""), "photos": ("photos.zip", b"not a zip"),
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "photos must be a ZIP archive"
+
+
+def test_import_over_the_size_limit_gets_413(login):
+    admin = login("admin")
+    data = b"\n" * (2 * 1024 * 1024)  # IMPORT_MAX_MB is 1 in the tests
+
+    response = admin.post("/pets/bulk", files={"file": ("pets.ndjson", data)})
+
+    assert response.status_code == 413
+    assert imported() == {}
+
+
+def test_import_is_admin_only(login, location):
+    data = ndjson({"name": "Rex", "species": "Dog", "age": 3, "location_id": location.location_id})
+
+    response = login("alice").post("/pets/bulk", files={"file": ("pets.ndjson", data)})
+
+    assert response.status_code == 403
+    assert imported() == {}
@@ -0,0 +1,50 @@
+"""
+Tests for GET /pets (keyset pages and filters), GET /pets/count and GET /pets/species.
+"""
+
+
+def names(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [pet["name"] for pet in response.json()]
+
+
+def test_pages_follow_the_cursor_newest_first(login, make_pet, sql_log):
+    client = login("alice")
+    for n in range(7):
+        make_pet(f"Pet {n}")
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 3} | ({"cursor": cursor} if cursor else {})
+        response = client.get("/pets", params=params)
+        pages.append(names(response))
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert pages == [["Pet 6", "Pet 5", "Pet 4"], ["Pet 3", "Pet 2", "Pet 1"], ["Pet 0"]]
+    # Later pages seek past the cursor instead of skipping rows
+    assert sum("pets.pet_id < " in statement for statement in sql_log) == 2
+
+
+def test_filters_narrow_every_page(login, make_pet, location):
+    client = login("alice")
+    make_pet("Rex", species="Dog", age=2)
+    make_pet("Tom", species="Cat", age=9)
+    make_pet("Fido", species="Dog", age=11, status="pending")
+
+    assert names(client.get("/pets", params={"species": "Dog"})) == ["Fido", "Rex"]
+    assert names(client.get("/pets", params={"status": "approved"})) == ["Tom", "Rex"]
+    assert names(client.get("/pets", params={"min_age": 5, "max_age": 10})) == ["Tom"]
+    assert names(client.get("/pets", params={"location_id": location.location_id + 1})) == []
+
+
+def test_count_and_species_cover_the_whole_catalog(login, make_pet):
+    client = login("alice")
+    for n in range(5):
+        make_pet(f"Dog {n}", species="Dog")
+    make_pet("Tom", species="Cat", status="pending")
+
+    assert client.get("/pets/count").json() == {"count": 6}
+    assert client.get("/pets/count", params={"species": "Dog", "status": "approved"}).json() == {"count": 5}
+    assert client.get("/pets/species").json() == ["Cat", "Dog"]
@@ -0,0 +1,70 @@
+"""
+Tests for the verified-principal cache in get_current_user.
+"""
+
+from sqlalchemy import update
+from app.api.auth_endpoints import invalidate_principal
+from app.db import engine
+from app.schemas.models import User
+from app.services.cache_service import principal_cache
+
+
+def user_reads(sql_log) -> list[str]:
+    return [s for s in sql_log if s.lstrip().upper().startswith("SELECT") and "FROM users" in s]
+
+
+def test_repeat_requests_skip_the_user_lookup(login, sql_log):
+    client = login("alice")
+    client.get("/auth/me")
+    sql_log.clear()
+
+    for _ in range(3):
+        assert client.get("/auth/me").json()["email"] == "alice@test.ca"
+
+    assert user_reads(sql_log) == []
+
+
+def test_deleted_user_is_dropped(login, users):
+    admin, alice = login("admin"), login("alice")
+    assert alice.get("/auth/me").status_code == 200
+
+    assert admin.delete(f"/users/{users['alice'].user_id}").status_code == 200
+
+    assert alice.get("/auth/me").status_code == 401
+
+
+def test_profile_changes_are_seen_at_once(login, users):
+    alice = login("alice")
+    alice.get("/auth/me")
+
+    response = alice.put(f"/users/{users['alice'].user_id}", json={"display_name": "Alice B."})
+    assert response.status_code == 200, response.text
+    assert alice.get("/auth/me").json()["display_name"] == "Alice B."
+
+    # The token names the old email, which no longer exists
+    alice.put(f"/users/{users['alice'].user_id}", json={"email": "alice.b@test.ca"})
+    assert alice.get("/auth/me").status_code == 401
+
+
+def test_role_change_applies_after_invalidation(login, users):
+    alice = login("alice")
+    assert alice.get("/users").status_code == 403
+
+    with engine.begin() as conn:
+        conn.execute(update(User).where(User.user_id == users["alice"].user_id).values(is_admin=True))
+    # Changed behind the API's back: the cached principal still applies
+    assert alice.get("/users").status_code == 403
+
+    invalidate_principal("alice@test.ca")
+    assert alice.get("/users").status_code == 200
+
+
+def test_cache_can_be_disabled(login, sql_log, monkeypatch):
+    monkeypatch.setattr(principal_cache, "max_entries", 0)
+    client = login("alice")
+    sql_log.clear()
+
+    client.get("/auth/me")
+    client.get("/auth/me")
+
+    assert len(user_reads(sql_log)) == 2
@@ -0,0 +1,184 @@
+"""
+Tests for the S3 storage backend against moto's in-memory S3.
+"""
+
+import errno
+import hashlib
+import os
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from boto3.s3.transfer import TransferConfig
+from fastapi import HTTPException
+from moto import mock_aws
+from PIL import Image
+from app import config
+from app.services.files_service import content_path
+from app.services.image_service import create_variants
+from app.services.static_service import IMMUTABLE_CACHE_CONTROL
+from app.services.storage_service import S3Storage
+
+BUCKET = "pets-test"
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    for name, value in (("AWS_ACCESS_KEY_ID", "testing"), ("AWS_SECRET_ACCESS_KEY", "testing"),
+                        ("AWS_SESSION_TOKEN", "testing"), ("AWS_DEFAULT_REGION", "us-east-1")):
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(config, "STORAGE_SPOOL_DIR", str(tmp_path / "spool"))
+    with mock_aws():
+        storage = S3Storage(BUCKET, region="us-east-1")
+        storage.client.create_bucket(Bucket=BUCKET)
+        yield storage
+
+
+@pytest.fixture
+def calls(storage) -> list[str]:
+    """Names of the S3 operations the storage's client sends, in order."""
+    operations = []
+
+    def record(model, **kwargs):
+        operations.append(model.name)
+
+    storage.client.meta.events.register("before-call.s3", record)
+    return operations
+
+
+def photo(tmp_path, size=(1200, 900), name="photo.jpg") -> tuple[str, str]:
+    """Write a JPEG and return (path, its content-addressed key)."""
+    path = tmp_path / name
+    Image.new("RGB", size, (200, 120, 40)).save(path, "JPEG")
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    return str(path), content_path(digest, ".jpg")
+
+
+def test_store_file_sets_type_and_cache_headers(storage, tmp_path):
+    path, key = photo(tmp_path)
+
+    storage.store_file(key, path)
+
+    head = storage.client.head_object(Bucket=BUCKET, Key=key)
+    assert head["ContentType"] == "image/jpeg"
+    assert head["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+    assert storage.sizes([key, key + ".missing"]) == {key: os.path.getsize(path)}
+    with storage.local_copy(key) as copy:
+        assert open(copy, "rb").read() == open(path, "rb").read()
+    assert not os.path.exists(copy)
+
+
+def test_existing_key_is_touched_not_uploaded(storage, calls, tmp_path):
+    path, key = photo(tmp_path)
+    storage.store_file(key, path)
+    calls.clear()
+
+    storage.store_file(key, path)
+
+    assert calls == ["ListObjectsV2", "CopyObject"]
+    head = storage.client.head_object(Bucket=BUCKET, Key=key)
+    assert head["CacheControl"] == IMMUTABLE_CACHE_CONTROL  # metadata survives the copy
+
+
+def test_large_files_use_multipart_upload(storage, calls, tmp_path):
+    storage.transfer = TransferConfig(multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024)
+    path = tmp_path / "large.bin"
+    path.write_bytes(os.urandom(6 * 1024 * 1024))
+
+    storage.store_file("large.bin", str(path))
+
+    assert "CreateMultipartUpload" in calls and calls.count("UploadPart") == 2
+    assert storage.sizes(["large.bin"]) == {"large.bin": 6 * 1024 * 1024}
+
+
+def test_create_variants_on_s3(storage, calls, tmp_path):
+    path, key = photo(tmp_path)
+    storage.store_file(key, path)
+
+    variants = create_variants("uploads/" + key, storage)
+
+    stem = key.removesuffix(".jpg")
+    assert variants == {name: f"uploads/{stem}.{name}.jpg" for name in config.PHOTO_VARIANT_WIDTHS}
+    stored = {k for k, _, _ in storage.iter_objects()}
+    for name, width in config.PHOTO_VARIANT_WIDTHS.items():
+        with storage.local_copy(f"{stem}.{name}.jpg") as copy, Image.open(copy) as im:
+            assert im.width == min(width, 1200)
+        assert f"{stem}.{name}.webp" in stored
+
+    # A second run downloads the original, finds every variant with one LIST and writes nothing
+    calls.clear()
+    create_variants("uploads/" + key, storage)
+    assert calls == ["HeadObject", "GetObject", "ListObjectsV2"]
+
+
+def test_undecodable_upload_is_rejected_and_removed(storage, tmp_path):
+    path = tmp_path / "junk.jpg"
+    path.write_bytes(b"not an image")
+    key = content_path(hashlib.sha256(b"not an image").hexdigest(), ".jpg")
+    storage.store_file(key, str(path))
+
+    with pytest.raises(HTTPException) as raised:
+        create_variants("uploads/" + key, storage)
+
+    assert raised.value.status_code == 400
+    assert storage.sizes([key]) == {}
+
+
+def test_missing_key_raises_file_not_found(storage):
+    with pytest.raises(FileNotFoundError) as raised:
+        with storage.local_copy("ab/cd/missing.jpg"):
+            pass
+
+    assert raised.value.errno == errno.ENOENT
+    assert raised.value.filename == "ab/cd/missing.jpg"
+
+
+def test_missing_source_is_retried_not_rejected(storage):
+    # e.g. a direct upload the client hasn't finished yet
+    key = content_path(hashlib.sha256(b"not uploaded yet").hexdigest(), ".jpg")
+
+    with pytest.raises(FileNotFoundError) as raised:
+        create_variants("uploads/" + key, storage)
+
+    assert raised.value.errno == errno.ENOENT
+    assert list(storage.iter_objects()) == []
+
+
+def test_presign_upload_signs_length_type_and_checksum(storage):
+    sha256 = hashlib.sha256(b"photo bytes").hexdigest()
+    key = content_path(sha256, ".jpg")
+
+    upload = storage.presign_upload(key, 11, sha256, "image/jpeg")
+
+    assert upload["method"] == "PUT"
+    assert upload["expires_in"] == config.STORAGE_PRESIGN_EXPIRES
+    assert upload["headers"] == {
+        "Content-Type": "image/jpeg",
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "x-amz-checksum-sha256": "KmknYT3ckDN58+AhRfIgdMzwSMd1PPoe2O4mx0ZoKZc=",
+    }
+    url = urlsplit(upload["url"])
+    assert url.path.endswith(key)
+    query = parse_qs(url.query)
+    signed = query["X-Amz-SignedHeaders"][0].split(";")
+    assert {"content-length", "content-type", "x-amz-checksum-sha256"} <= set(signed)
+    assert query["X-Amz-Expires"] == [str(config.STORAGE_PRESIGN_EXPIRES)]
+
+
+def test_url_is_presigned_unless_public(storage, monkeypatch):
+    url = urlsplit(storage.url("ab/12/ab12.jpg"))
+    assert url.path.endswith("ab/12/ab12.jpg") and "X-Amz-Signature" in url.query
+
+    monkeypatch.setattr(config, "STORAGE_S3_PUBLIC_URL", "https://cdn.example.com/")
+    assert storage.url("ab/12/ab12.jpg") == "https://cdn.example.com/ab/12/ab12.jpg"
+
+
+def test_delete_removes_keys_in_batches(storage, tmp_path):
+    path = tmp_path / "tiny.jpg"
+    path.write_bytes(b"x")
+    keys = [f"bulk/{n:04}.jpg" for n in range(1005)]
+    for key in keys[:5]:
+        storage.store_file(key, str(path))
+    for key in keys[5:]:
+        storage.client.put_object(Bucket=BUCKET, Key=key, Body=b"x")
+
+    assert storage.delete(keys) == 1005
+    assert list(storage.iter_objects()) == []
@@ -0,0 +1,118 @@
+"""
+Tests for GET /pets/search: FTS5 on SQLite, the weighted tsvector on PostgreSQL.
+"""
+
+import pytest
+from sqlalchemy import text
+from app.db import SessionLocal, engine
+from app.schemas.models import Pet
+
+
+def names(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [pet["name"] for pet in response.json()]
+
+
+def test_prefix_search_ranks_name_matches_first(login, make_pet):
+    client = login("alice")
+    make_pet("Max", species="Dog", description="Best friends with a golden retriever")
+    make_pet("Goldie", species="Fish", description="A calm companion")
+    make_pet("Tom", species="Cat", description="Sleeps all day")
+
+    assert names(client.get("/pets/search", params={"q": "gold"})) == ["Goldie", "Max"]
+
+
+@pytest.mark.sqlite
+def test_sqlite_searches_the_fts5_table(login, make_pet, sql_log):
+    make_pet("Goldie", species="Fish")
+
+    assert names(login("alice").get("/pets/search", params={"q": "gold"})) == ["Goldie"]
+    assert any("pets_fts MATCH" in statement for statement in sql_log)
+
+
+@pytest.mark.postgresql
+def test_postgresql_searches_the_weighted_tsvector(login, make_pet, sql_log):
+    make_pet("Goldie", species="Fish")
+
+    assert names(login("alice").get("/pets/search", params={"q": "gold"})) == ["Goldie"]
+    assert any("to_tsquery('english'" in statement and "ts_rank(" in statement for statement in sql_log)
+    with engine.connect() as conn:
+        index = conn.execute(text("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_pets_search'")).scalar()
+    assert index is not None and "USING gin" in index
+
+
+def test_search_stems_and_combines_terms(login, make_pet):
+    client = login("alice")
+    make_pet("Biscuit", species="Dog", description="Playful puppy who loves walks")
+    make_pet("Pepper", species="Dog", description="Quiet senior dog")
+
+    assert names(client.get("/pets/search", params={"q": "puppies"})) == ["Biscuit"]
+    assert names(client.get("/pets/search", params={"q": "dog quiet"})) == ["Pepper"]
+
+
+def test_search_ignores_query_syntax(login, make_pet):
+    client = login("alice")
+    make_pet("Rex")
+
+    for q in ['"', "NOT", "rex OR (", "* & | !"]:
+        response = client.get("/pets/search", params={"q": q})
+        assert response.status_code == 200, (q, response.text)
+    assert names(client.get("/pets/search", params={"q": "rex OR ("})) == []
+    assert names(client.get("/pets/search", params={"q": "(rex)"})) == ["Rex"]
+
+
+def test_search_index_follows_updates_and_deletes(login, make_pet):
+    client = login("alice")
+    pet = make_pet("Shadow", species="Cat")
+
+    with SessionLocal() as db:
+        db.get(Pet, pet.pet_id).name = "Pumpkin"
+        db.commit()
+    assert names(client.get("/pets/search", params={"q": "shadow"})) == []
+    assert names(client.get("/pets/search", params={"q": "pumpkin"})) == ["Pumpkin"]
+
+    with SessionLocal() as db:
+        db.delete(db.get(Pet, pet.pet_id))
+        db.commit()
+    assert names(client.get("/pets/search", params={"q": "pumpkin"})) == []
+
+
+def test_search_pages_with_keyset_cursor(login, make_pet, sql_log):
+    client = login("alice")
+    # Equal scores for most pets, so pages have to break ties on pet_id
+    for n in range(7):
+        make_pet(f"Lu{n}", species="Dog")
+    make_pet("Lulu", species="Cat", description="Lulu the lucky lurcher")
+
+    everything = names(client.get("/pets/search", params={"q": "lu", "limit": 100}))
+    seen, cursor = [], None
+    sql_log.clear()
+    while True:
+        params = {"q": "lu", "limit": 3} | ({"cursor": cursor} if cursor else {})
+        response = client.get("/pets/search", params=params)
+        seen += names(response)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == everything and len(seen) == 8
+    # No page skips earlier matches with OFFSET
+    assert not any("OFFSET" in statement for statement in sql_log)
+
+
+def test_search_applies_list_filters(login, make_pet, location):
+    client = login("alice")
+    make_pet("Goldie", species="Fish")
+    make_pet("Gold Dust", species="Dog", status="pending")
+    make_pet("Golden Boy", species="Dog")
+
+    assert names(client.get("/pets/search", params={"q": "gold", "species": "Dog"})) == ["Golden Boy", "Gold Dust"]
+    assert names(client.get("/pets/search", params={"q": "gold", "status": "pending"})) == ["Gold Dust"]
+    assert len(names(client.get("/pets/search", params={"q": "gold", "location_id": location.location_id}))) == 3
+    assert names(client.get("/pets/search", params={"q": "gold", "location_id": location.location_id + 1})) == []
+
+
+def test_search_rejects_malformed_cursor(login):
+    response = login("alice").get("/pets/search", params={"q": "rex", "cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,114 @@
+"""
+Tests for the orphaned upload garbage collector (collect_garbage and python -m app.upload_gc).
+"""
+
+import os
+import sys
+import time
+import pytest
+from app import upload_gc
+from app.db import SessionLocal, engine
+from app.schemas.models import ImageJob, Pet
+from app.services.storage_service import LocalStorage
+from app.services.upload_gc_service import collect_garbage
+
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalStorage:
+    return LocalStorage(str(tmp_path / "uploads"))
+
+
+def put(storage: LocalStorage, key: str, age_seconds: float = 2 * DAY) -> str:
+    """Write a stored file last modified age_seconds ago."""
+    path = storage.path(key) if not key.startswith(".tmp/") else os.path.join(storage.root, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * 10)
+    stamp = time.time() - age_seconds
+    os.utime(path, (stamp, stamp))
+    return key
+
+
+def stored(storage: LocalStorage) -> set[str]:
+    return {key for key, _, _ in storage.iter_objects()}
+
+
+def digest(n: int) -> str:
+    """A SHA-256-shaped hex digest with its own shard directory, e.g. "0404...04"."""
+    return f"{n:02x}" * 32
+
+
+def shard(n: int, suffix: str) -> str:
+    h = digest(n)
+    return f"{h[:2]}/{h[2:4]}/{h}{suffix}"
+
+
+@pytest.fixture
+def uploads(storage, make_pet):
+    """
+    A referenced photo with variants, a queued job's photo, a failed job's
+    photo, an orphan with variants, a recent orphan, spool files, and the
+    sample photos.
+    """
+    referenced = [put(storage, shard(1, ".jpg")), put(storage, shard(1, ".card.jpg")),
+                  put(storage, shard(1, ".card.webp"))]
+    queued = put(storage, shard(2, ".png"))
+    failed = put(storage, shard(3, ".jpg"))
+    orphans = [put(storage, shard(4, ".jpg")), put(storage, shard(4, ".thumb.jpg")),
+               put(storage, shard(4, ".thumb.avif"))]
+    recent = put(storage, shard(5, ".jpg"), age_seconds=60)
+    stale_spool = put(storage, ".tmp/tmp_abandoned", age_seconds=2 * DAY)
+    in_flight = put(storage, ".tmp/tmp_uploading", age_seconds=1)
+    samples = [put(storage, "Cute_dog_1.jpg"), put(storage, "Dog_Breeds.jpg")]
+
+    rex, tom = make_pet("Rex"), make_pet("Tom")
+    with SessionLocal() as db:
+        pet = db.get(Pet, rex.pet_id)
+        pet.photo_url = "uploads/" + referenced[0]
+        pet.photo_variants = {"card": "uploads/" + referenced[1]}
+        pet.photo_status = "ready"
+        db.add(ImageJob(pet_id=tom.pet_id, photo_url="uploads/" + queued))
+        db.add(ImageJob(pet_id=tom.pet_id, photo_url="uploads/" + failed, status="failed"))
+        db.commit()
+
+    return {
+        "kept": set(referenced) | {queued, recent, in_flight} | set(samples),
+        "deleted": set(orphans) | {failed, stale_spool},
+    }
+
+
+def test_dry_run_reports_without_deleting(storage, uploads):
+    before = stored(storage)
+
+    report = collect_garbage(engine, storage, grace_hours=24)
+
+    assert report["dry_run"] is True and report["deleted"] == 0
+    assert set(report["files"]) == uploads["deleted"]
+    assert report["orphan_bytes"] == 10 * len(uploads["deleted"])
+    assert stored(storage) == before
+
+
+def test_delete_keeps_referenced_recent_and_foreign_files(storage, uploads):
+    report = collect_garbage(engine, storage, grace_hours=24, batch_size=2, dry_run=False)
+
+    assert report["deleted"] == len(uploads["deleted"])
+    assert stored(storage) == uploads["kept"]
+    # Emptied shard directories go, the spool directory stays
+    assert not os.path.exists(os.path.join(storage.root, digest(4)[:2]))
+    assert os.path.isdir(storage.temp_dir)
+
+
+def test_cli_is_a_dry_run_unless_asked_to_delete(storage, uploads, monkeypatch, capsys):
+    monkeypatch.setattr(upload_gc, "get_storage", lambda: storage)
+    before = stored(storage)
+
+    monkeypatch.setattr(sys, "argv", ["upload_gc"])
+    upload_gc.main()
+    assert stored(storage) == before
+    assert f"{len(uploads['deleted'])} orphaned files" in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["upload_gc", "--delete", "--quiet"])
+    upload_gc.main()
+    assert stored(storage) == uploads["kept"]
@@ -56,7 +56,7 @@ export function QuickActions() {
 }
 
 // Table displaying pending adoption applications for admin review
-export function PendingApplicationsTable({ applications }) {
+export function PendingApplicationsTable({ applications, hasMore = false, loadingMore = false, onLoadMore }) {
     const navigate = useNavigate();
 
     // Format date to readable string
@@ -128,6 +128,18 @@ export function PendingApplicationsTable({ applications }) {
                 ))}
                 </tbody>
             </table>
+            {hasMore && (
+                <div className="text-center mt-4">
+                    <button
+                        onClick={onLoadMore}
+                        className="btn-sm"
+                        disabled={loadingMore}
+                        data-cy="load-more-applications"
+                    >
+                        {loadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
\ No newline at end of file
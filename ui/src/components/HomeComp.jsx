@@ -95,8 +95,8 @@ export function FeaturedPets({ pets, loading }) {
                             <div
                                 className="card-img"
                                 style={{
-                                    backgroundImage: pet.photo_url
-                                        ? `url(${API_BASE_URL}/${pet.photo_url})`
+                                    backgroundImage: (pet.photo_variants?.card || pet.photo_url)
+                                        ? `url(${API_BASE_URL}/${pet.photo_variants?.card || pet.photo_url})`
                                         : undefined
                                 }}
                             />
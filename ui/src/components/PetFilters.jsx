@@ -17,10 +17,10 @@ export default function PetFilters({
     return (
         <div className="panel mb-6">
             <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
-                {/* Search by name */}
+                {/* Full-text search over name, species and description */}
                 <input
                     type="text"
-                    placeholder="Search by name..."
+                    placeholder="Search pets..."
                     className="input"
                     value={filters.search}
                     onChange={(e) => handleChange('search', e.target.value)}
@@ -1,33 +1,67 @@
 // applicationHooks.js
 // Custom hooks for adoption application API operations
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { applicationsAPI } from '../services/api.js';
 
-// Hook to fetch all applications
-export function useApplications(status = null) {
+// Hook to page through the applications visible to the user, with optional
+// filters (status, view, order), pageSize applications at a time.
+// loadMore() appends the next page while hasMore is true.
+export function useApplications(filters = {}, pageSize = 20) {
     const [applications, setApplications] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState(null);
+    const filterKey = JSON.stringify(filters);
+    // Only the newest request may update state (e.g. after switching tabs)
+    const requestId = useRef(0);
+
+    const fetchPage = useCallback((cursor) => (
+        applicationsAPI.list({ ...JSON.parse(filterKey), limit: pageSize, cursor })
+    ), [filterKey, pageSize]);
 
     const fetchApplications = useCallback(async () => {
+        const id = ++requestId.current;
         setLoading(true);
         setError(null);
         try {
-            const data = await applicationsAPI.list(status);
-            setApplications(data);
+            const page = await fetchPage(null);
+            if (id !== requestId.current) return;
+            setApplications(page.items);
+            setNextCursor(page.nextCursor);
         } catch (err) {
+            if (id !== requestId.current) return;
             setError(err.response?.data?.detail || 'Failed to load applications');
         } finally {
-            setLoading(false);
+            if (id === requestId.current) setLoading(false);
         }
-    }, [status]);
+    }, [fetchPage]);
+
+    const loadMore = useCallback(async () => {
+        if (!nextCursor) return;
+        const id = ++requestId.current;
+        setLoadingMore(true);
+        try {
+            const page = await fetchPage(nextCursor);
+            if (id !== requestId.current) return;
+            setApplications(previous => [...previous, ...page.items]);
+            setNextCursor(page.nextCursor);
+        } catch (err) {
+            if (id !== requestId.current) return;
+            setError(err.response?.data?.detail || 'Failed to load applications');
+        } finally {
+            setLoadingMore(false);
+        }
+    }, [fetchPage, nextCursor]);
 
     useEffect(() => {
         fetchApplications();
     }, [fetchApplications]);
 
-    return { applications, loading, error, refetch: fetchApplications };
+    return {
+        applications, loading, loadingMore, hasMore: !!nextCursor, loadMore, error, refetch: fetchApplications,
+    };
 }
 
 // Hook to fetch a single application by ID
@@ -1,33 +1,106 @@
 // petHooks.js
 // Custom hooks for pet-related API operations
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { petsAPI, locationsAPI, favoritesAPI } from '../services/api.js';
 
-// Hook to fetch all pets with optional filtering
-export function usePets() {
+// Hook to page through pets matching optional filters (species, status,
+// location_id, and q for a full-text search), pageSize pets at a time.
+// loadMore() appends the next page while hasMore is true.
+export function usePets(filters = {}, pageSize = 24) {
     const [pets, setPets] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState(null);
+    const filterKey = JSON.stringify(filters);
+    // Only the newest request may update state, so a slow response for
+    // old filters can't overwrite the results for the current ones
+    const requestId = useRef(0);
+
+    const fetchPage = useCallback((cursor) => {
+        const { q, ...params } = JSON.parse(filterKey);
+        const query = { ...params, limit: pageSize, cursor };
+        return q ? petsAPI.search({ ...query, q }) : petsAPI.list(query);
+    }, [filterKey, pageSize]);
 
     const fetchPets = useCallback(async () => {
+        const id = ++requestId.current;
         setLoading(true);
         setError(null);
         try {
-            const data = await petsAPI.list();
-            setPets(data);
+            const page = await fetchPage(null);
+            if (id !== requestId.current) return;
+            setPets(page.items);
+            setNextCursor(page.nextCursor);
         } catch (err) {
+            if (id !== requestId.current) return;
             setError(err.response?.data?.detail || 'Failed to load pets');
         } finally {
-            setLoading(false);
+            if (id === requestId.current) setLoading(false);
         }
-    }, []);
+    }, [fetchPage]);
+
+    const loadMore = useCallback(async () => {
+        if (!nextCursor) return;
+        const id = ++requestId.current;
+        setLoadingMore(true);
+        try {
+            const page = await fetchPage(nextCursor);
+            if (id !== requestId.current) return;
+            setPets(previous => [...previous, ...page.items]);
+            setNextCursor(page.nextCursor);
+        } catch (err) {
+            if (id !== requestId.current) return;
+            setError(err.response?.data?.detail || 'Failed to load pets');
+        } finally {
+            setLoadingMore(false);
+        }
+    }, [fetchPage, nextCursor]);
 
     useEffect(() => {
         fetchPets();
     }, [fetchPets]);
 
-    return { pets, loading, error, refetch: fetchPets };
+    return { pets, loading, loadingMore, hasMore: !!nextCursor, loadMore, error, refetch: fetchPets };
+}
+
+// Hook to fetch every species that has pets, for the species filter
+export function useSpecies() {
+    const [species, setSpecies] = useState([]);
+
+    useEffect(() => {
+        petsAPI.species().then(setSpecies).catch(() => setSpecies([]));
+    }, []);
+
+    return { species };
+}
+
+// Hook to count pets matching optional filters, without loading them
+export function usePetCount(filters = {}) {
+    const [count, setCount] = useState(0);
+    const [loading, setLoading] = useState(true);
+    const [error, setError] = useState(null);
+    const filterKey = JSON.stringify(filters);
+
+    const fetchCount = useCallback(async () => {
+        setLoading(true);
+        setError(null);
+        try {
+            const data = await petsAPI.count(JSON.parse(filterKey));
+            setCount(data.count);
+        } catch (err) {
+            setError(err.response?.data?.detail || 'Failed to count pets');
+        } finally {
+            setLoading(false);
+        }
+    }, [filterKey]);
+
+    useEffect(() => {
+        fetchCount();
+    }, [fetchCount]);
+
+    return { count, loading, error, refetch: fetchCount };
 }
 
 // Hook to fetch a single pet by ID
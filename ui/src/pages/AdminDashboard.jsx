@@ -5,7 +5,7 @@
 import React, { useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext.jsx';
-import { usePets, useLocations } from '../hooks/petHooks.js';
+import { usePetCount, useLocations } from '../hooks/petHooks.js';
 import { useUsers } from '../hooks/userHooks.js';
 import { useApplications, useApplicationStats } from '../hooks/applicationHooks.js';
 import { DashboardStats, QuickActions, PendingApplicationsTable } from '../components/Dashboard.jsx';
@@ -16,10 +16,13 @@ export default function AdminDashboard() {
     const navigate = useNavigate();
 
     // Fetch all data needed for dashboard display
-    const { pets, loading: petsLoading } = usePets();
+    const { count: petCount, loading: petsLoading } = usePetCount();
     const { locations, loading: locationsLoading } = useLocations();
     const { users, loading: usersLoading } = useUsers();
-    const { applications, loading: appsLoading } = useApplications('pending');
+    // Pending applications, longest waiting first, one page at a time
+    const {
+        applications, loading: appsLoading, loadingMore, hasMore, loadMore
+    } = useApplications({ status: 'pending', order: 'oldest', view: 'summary' }, 10);
     const { stats: appStats, loading: statsLoading } = useApplicationStats();
 
     // Redirect non-admin users to home page
@@ -35,18 +38,18 @@ export default function AdminDashboard() {
         return <LoadingSpinner message="Loading dashboard..." />;
     }
 
-    // Calculate days waiting for each application and sort by longest wait
+    // Calculate days waiting for each application (the server sorts by longest wait)
     const processedApplications = applications.map(app => {
         const applicationDate = new Date(app.application_date);
         const today = new Date();
         const diffTime = Math.abs(today - applicationDate);
         const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
         return { ...app, days_waiting: diffDays };
-    }).sort((a, b) => b.days_waiting - a.days_waiting).slice(0, 5);
+    });
 
     // Aggregate statistics for dashboard cards
     const stats = {
-        totalPets: pets.length,
+        totalPets: petCount,
         totalLocations: locations.length,
         totalUsers: users.length,
         pendingApplications: appStats?.pending || 0
@@ -65,12 +68,17 @@ export default function AdminDashboard() {
                     <h2 className="text-xl font-bold">Pending Applications</h2>
                     {processedApplications.length > 0 && (
                         <span className="text-[#B6C6DA] text-sm">
-                            Showing top 5 by wait time
+                            Longest waiting first
                         </span>
                     )}
                 </div>
 
-                <PendingApplicationsTable applications={processedApplications} />
+                <PendingApplicationsTable
+                    applications={processedApplications}
+                    hasMore={hasMore}
+                    loadingMore={loadingMore}
+                    onLoadMore={loadMore}
+                />
             </div>
         </div>
     );
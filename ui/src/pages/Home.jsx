@@ -4,24 +4,23 @@
 
 import React, { useState, useEffect } from 'react';
 import { useAuth } from '../context/AuthContext.jsx';
-import { usePets } from '../hooks/petHooks.js';
+import { usePets, usePetCount } from '../hooks/petHooks.js';
 import { HeroSection, StatsSection, FeaturedPets, HowItWorks, CallToAction } from '../components/HomeComp.jsx';
 
 export default function Home() {
     const { user } = useAuth();
-    const { pets, loading } = usePets();
+
+    // Only approved pets are shown on the homepage: the newest four, plus a count of all of them
+    const { pets: featuredPets, loading } = usePets({ status: 'approved' }, 4);
+    const { count: approvedCount } = usePetCount({ status: 'approved' });
 
     // Platform statistics displayed in stats section
     const [stats, setStats] = useState({ totalPets: 0, locations: 3, happyAdoptions: 150 });
 
-    // Filter to show only approved pets on homepage
-    const approvedPets = pets.filter(p => p.status === 'approved');
-    const featuredPets = approvedPets.slice(0, 4);
-
     // Update pet count when data loads
     useEffect(() => {
-        setStats(prev => ({ ...prev, totalPets: approvedPets.length }));
-    }, [approvedPets.length]);
+        setStats(prev => ({ ...prev, totalPets: approvedCount }));
+    }, [approvedCount]);
 
     return (
         <div>
@@ -3,7 +3,7 @@
 // Provides CRUD operations with form validation and image handling
 
 import React, { useState } from 'react';
-import { usePets, useLocations, useCreatePet, useUpdatePet, useDeletePet } from '../hooks/petHooks.js';
+import { usePets, usePetCount, useLocations, useCreatePet, useUpdatePet, useDeletePet } from '../hooks/petHooks.js';
 import PetTable from '../components/PetTable.jsx';
 import PetForm from '../components/PetForm.jsx';
 import LoadingSpinner from '../components/LoadingSpinner.jsx';
@@ -13,8 +13,11 @@ const MAX_FILE_SIZE_MB = 2;
 const MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024;
 
 export default function ManagePet() {
-    // Data fetching and mutation hooks
-    const { pets, loading: petsLoading, refetch: refetchPets } = usePets();
+    // Data fetching and mutation hooks (pets are loaded a page at a time)
+    const {
+        pets, loading: petsLoading, loadingMore, hasMore, loadMore, refetch: refetchPetPage
+    } = usePets({}, 50);
+    const { count: petCount, refetch: refetchCount } = usePetCount();
     const { locations, loading: locationsLoading } = useLocations();
     const { createPet } = useCreatePet();
     const { updatePet } = useUpdatePet();
@@ -36,6 +39,9 @@ export default function ManagePet() {
     const [isSubmitting, setIsSubmitting] = useState(false);
     const [successMessage, setSuccessMessage] = useState('');
 
+    // Reload the first page and the total after a change
+    const refetchPets = () => Promise.all([refetchPetPage(), refetchCount()]);
+
     // Validate all form fields before submission
     const validateForm = () => {
         const newErrors = {};
@@ -215,13 +221,20 @@ export default function ManagePet() {
                 </div>
 
                 <div className="panel overflow-x-auto">
-                    <h2 className="text-xl font-bold mb-4">All Pets ({pets.length})</h2>
+                    <h2 className="text-xl font-bold mb-4">All Pets ({petCount})</h2>
                     <PetTable
                         pets={pets}
                         locations={locations}
                         onEdit={handleEdit}
                         onDelete={handleDelete}
                     />
+                    {hasMore && (
+                        <div className="text-center mt-4">
+                            <button className="btn" onClick={loadMore} disabled={loadingMore} data-cy="load-more-pets">
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        </div>
+                    )}
                 </div>
             </div>
         );
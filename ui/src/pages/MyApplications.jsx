@@ -5,7 +5,7 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext.jsx';
-import { useApplications } from '../hooks/applicationHooks.js';
+import { useApplications, useApplicationStats } from '../hooks/applicationHooks.js';
 import ApplicationsList from '../components/ApplicationsList.jsx';
 import FilterTabs from '../components/FilterTabs.jsx';
 import LoadingSpinner from '../components/LoadingSpinner.jsx';
@@ -18,8 +18,12 @@ export default function MyApplications() {
     // Current filter selection
     const [filter, setFilter] = useState('all');
 
-    // Fetch user's applications
-    const { applications, loading, error, refetch } = useApplications();
+    // Fetch user's applications (the selected status, a page at a time)
+    // and their counts per status
+    const {
+        applications, loading, loadingMore, hasMore, loadMore, error, refetch
+    } = useApplications(filter === 'all' ? {} : { status: filter });
+    const { stats, loading: statsLoading } = useApplicationStats();
 
     // Redirect unauthenticated users to login, admins to dashboard
     useEffect(() => {
@@ -32,20 +36,15 @@ export default function MyApplications() {
         }
     }, [user, navigate]);
 
-    // Apply status filter to applications list
-    const filteredApplications = filter === 'all'
-        ? applications
-        : applications.filter(app => app.status === filter);
-
-    // Calculate counts for each status tab
+    // Counts for each status tab
     const statusCounts = {
-        all: applications.length,
-        pending: applications.filter(a => a.status === 'pending').length,
-        approved: applications.filter(a => a.status === 'approved').length,
-        rejected: applications.filter(a => a.status === 'rejected').length
+        all: stats?.total || 0,
+        pending: stats?.pending || 0,
+        approved: stats?.approved || 0,
+        rejected: stats?.rejected || 0
     };
 
-    if (loading) {
+    if (statsLoading) {
         return <LoadingSpinner message="Loading applications..." />;
     }
 
@@ -68,14 +67,27 @@ export default function MyApplications() {
                 counts={statusCounts}
             />
 
-            <ApplicationsList
-                applications={filteredApplications}
-                emptyMessage={
-                    filter === 'all'
-                        ? "You haven't submitted any applications yet."
-                        : `No ${filter} applications.`
-                }
-            />
+            {/* Only the list reloads when the tab changes */}
+            {loading ? (
+                <LoadingSpinner message="Loading applications..." />
+            ) : (
+                <ApplicationsList
+                    applications={applications}
+                    emptyMessage={
+                        filter === 'all'
+                            ? "You haven't submitted any applications yet."
+                            : `No ${filter} applications.`
+                    }
+                />
+            )}
+
+            {hasMore && !loading && (
+                <div className="text-center mt-6">
+                    <button onClick={loadMore} className="btn" disabled={loadingMore} data-cy="load-more-applications">
+                        {loadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
\ No newline at end of file
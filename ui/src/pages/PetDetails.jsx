@@ -77,8 +77,8 @@ export default function PetDetails() {
                         <div
                             className="w-full h-96 bg-[#152e56] rounded-xl bg-cover bg-center"
                             style={{
-                                backgroundImage: pet.photo_url
-                                    ? `url(${API_BASE_URL}/${pet.photo_url})`
+                                backgroundImage: (pet.photo_variants?.full || pet.photo_url)
+                                    ? `url(${API_BASE_URL}/${pet.photo_variants?.full || pet.photo_url})`
                                     : undefined
                             }}
                         />
@@ -2,10 +2,10 @@
 // Main pet browsing page with search, filtering, and favorites functionality
 // Displays pets in a grid layout with species, location, and status filters
 
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext.jsx';
-import { usePets, useLocations, useFavorites } from '../hooks/petHooks.js';
+import { usePets, useSpecies, useLocations, useFavorites } from '../hooks/petHooks.js';
 import PetFilters from '../components/PetFilters.jsx';
 import PetGrid from '../components/PetGrid.jsx';
 import LoadingSpinner from '../components/LoadingSpinner.jsx';
@@ -15,11 +15,6 @@ export default function PetList() {
     const { user } = useAuth();
     const navigate = useNavigate();
 
-    // Fetch pets, locations, and user favorites
-    const { pets, loading: petsLoading, error: petsError, refetch } = usePets();
-    const { locations, loading: locationsLoading } = useLocations();
-    const { favorites, toggleFavorite, isFavorite } = useFavorites(user?.user_id);
-
     // Filter state for search and dropdowns
     const [filters, setFilters] = useState({
         species: '',
@@ -28,6 +23,27 @@ export default function PetList() {
         search: ''
     });
 
+    // Wait until typing pauses before searching, instead of one request per keystroke
+    const [search, setSearch] = useState('');
+    useEffect(() => {
+        const timer = setTimeout(() => setSearch(filters.search.trim()), 300);
+        return () => clearTimeout(timer);
+    }, [filters.search]);
+
+    // Filtering and search happen on the server, one page at a time
+    const {
+        pets, loading: petsLoading, loadingMore, hasMore, loadMore, error: petsError, refetch
+    } = usePets({
+        species: filters.species,
+        status: filters.status,
+        location_id: filters.location,
+        q: search,
+    });
+    const { species } = useSpecies();
+    const { locations, loading: locationsLoading } = useLocations();
+    const { favorites, toggleFavorite, isFavorite } = useFavorites(user?.user_id);
+    const hasFilters = !!(filters.species || filters.location || filters.status || search);
+
     // Toggle favorite with login requirement check
     const handleToggleFavorite = (petId) => {
         if (!user) {
@@ -38,26 +54,10 @@ export default function PetList() {
         toggleFavorite(petId);
     };
 
-    // Apply all active filters to the pet list
-    const filteredPets = pets.filter(pet => {
-        if (filters.species && pet.species.toLowerCase() !== filters.species.toLowerCase()) return false;
-        if (filters.location && pet.location_id.toString() !== filters.location) return false;
-        if (filters.status && pet.status !== filters.status) return false;
-        if (filters.search && !pet.name.toLowerCase().includes(filters.search.toLowerCase())) return false;
-        return true;
-    });
-
-    // Extract unique species for filter dropdown
-    const uniqueSpecies = [...new Set(pets.map(p => p.species))].sort();
-
-    if (petsLoading || locationsLoading) {
+    if (locationsLoading) {
         return <LoadingSpinner message="Loading pets..." />;
     }
 
-    if (petsError) {
-        return <ErrorMessage message={petsError} onRetry={refetch} />;
-    }
-
     return (
         <div className="container-narrow">
             <div className="flex items-center justify-between mb-6">
@@ -72,22 +72,37 @@ export default function PetList() {
             <PetFilters
                 filters={filters}
                 onFilterChange={setFilters}
-                species={uniqueSpecies}
+                species={species}
                 locations={locations}
             />
 
-            <PetGrid
-                pets={filteredPets}
-                locations={locations}
-                showFavorite={!!user}
-                favorites={favorites}
-                onToggleFavorite={handleToggleFavorite}
-                emptyMessage={
-                    pets.length === 0
-                        ? 'No pets available yet. Check back soon!'
-                        : 'No pets found matching your filters.'
-                }
-            />
+            {/* The filters stay mounted while a page loads, so typing keeps focus */}
+            {petsError ? (
+                <ErrorMessage message={petsError} onRetry={refetch} />
+            ) : petsLoading ? (
+                <LoadingSpinner message="Loading pets..." />
+            ) : (
+                <PetGrid
+                    pets={pets}
+                    locations={locations}
+                    showFavorite={!!user}
+                    favorites={favorites}
+                    onToggleFavorite={handleToggleFavorite}
+                    emptyMessage={
+                        hasFilters
+                            ? 'No pets found matching your filters.'
+                            : 'No pets available yet. Check back soon!'
+                    }
+                />
+            )}
+
+            {hasMore && !petsLoading && !petsError && (
+                <div className="text-center mt-6">
+                    <button onClick={loadMore} className="btn" disabled={loadingMore} data-cy="load-more-pets">
+                        {loadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
\ No newline at end of file
@@ -14,6 +14,20 @@ const handleResponse = async (response) => {
     return response.json();
 };
 
+// Query string from a params object, leaving out empty values
+const toQuery = (params) => new URLSearchParams(
+    Object.entries(params).filter(([, value]) => value !== null && value !== undefined && value !== '')
+).toString();
+
+// Helper to fetch one page of a cursor-paginated list: { items, nextCursor }
+const fetchPage = async (path, params = {}) => {
+    const response = await fetch(`${API_BASE_URL}${path}?${toQuery(params)}`, {
+        credentials: 'include',
+    });
+    const items = await handleResponse(response);
+    return { items, nextCursor: response.headers.get('X-Next-Cursor') };
+};
+
 // Authentication API
 export const authAPI = {
     login: async (email, password, rememberMe = false) => {
@@ -144,8 +158,23 @@ export const locationsAPI = {
 
 // Pets API
 export const petsAPI = {
-    list: async () => {
-        const response = await fetch(`${API_BASE_URL}/pets`, {
+    // One page of pets matching the filters (species, status, location_id,
+    // limit, cursor): { items, nextCursor }
+    list: async (params = {}) => fetchPage('/pets', params),
+
+    // One page of full-text search results (q plus the list filters): { items, nextCursor }
+    search: async (params = {}) => fetchPage('/pets/search', params),
+
+    // Every species with at least one pet, for filter dropdowns
+    species: async () => {
+        const response = await fetch(`${API_BASE_URL}/pets/species`, {
+            credentials: 'include',
+        });
+        return handleResponse(response);
+    },
+
+    count: async (filters = {}) => {
+        const response = await fetch(`${API_BASE_URL}/pets/count?${toQuery(filters)}`, {
             credentials: 'include',
         });
         return handleResponse(response);
@@ -205,15 +234,9 @@ export const applicationsAPI = {
         return handleResponse(response);
     },
 
-    list: async (status = null) => {
-        const url = status
-            ? `${API_BASE_URL}/applications?status=${status}`
-            : `${API_BASE_URL}/applications`;
-        const response = await fetch(url, {
-            credentials: 'include',
-        });
-        return handleResponse(response);
-    },
+    // One page of the applications visible to the user: { items, nextCursor }
+    // params: status, view, order ('newest' or 'oldest'), limit, cursor
+    list: async (params = {}) => fetchPage('/applications', params),
 
     get: async (id) => {
         const response = await fetch(`${API_BASE_URL}/applications/${id}`, {
@@ -232,6 +255,7 @@ export const applicationsAPI = {
         return handleResponse(response);
     },
 
+    // Counts per status: all applications for admins, their own for users
     getStats: async () => {
         const response = await fetch(`${API_BASE_URL}/applications/stats`, {
             credentials: 'include',